@@ -0,0 +1,35 @@
+"""add embedding_cache
+
+Revision ID: 14c93b801058
+Revises: 23db54c43a87
+Create Date: 2026-10-16 14:02:51.170934
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '14c93b801058'
+down_revision: Union[str, Sequence[str], None] = '23db54c43a87'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create embedding_cache: chunk-text SHA-256 + model -> packed vector."""
+    op.create_table(
+        'embedding_cache',
+        sa.Column('hash', sa.CHAR(64), nullable=False),
+        sa.Column('model', sa.Text, nullable=False),
+        sa.Column('vector', sa.LargeBinary, nullable=False),
+        sa.Column('created_at', sa.DateTime, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint('hash', 'model'),
+    )
+
+
+def downgrade() -> None:
+    """Drop embedding_cache."""
+    op.drop_table('embedding_cache')
@@ -0,0 +1,59 @@
+"""jsonb for subagents_allowed and audit details
+
+Revision ID: 15d938b4170f
+Revises: 967f362cc1b4
+Create Date: 2026-10-16 10:31:12.407586
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSON, JSONB
+
+
+# revision identifiers, used by Alembic.
+revision: str = '15d938b4170f'
+down_revision: Union[str, Sequence[str], None] = '967f362cc1b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Store documents.subagents_allowed and audit_logs.details as JSONB.
+
+    JSONB is parsed once on write instead of on every read, and lets
+    details @> '{...}' filters use a GIN index.
+    """
+    op.alter_column(
+        'documents', 'subagents_allowed',
+        type_=JSONB(),
+        existing_type=JSON(),
+        postgresql_using='subagents_allowed::jsonb',
+    )
+    op.alter_column(
+        'audit_logs', 'details',
+        type_=JSONB(),
+        existing_type=JSON(),
+        existing_nullable=True,
+        postgresql_using='details::jsonb',
+    )
+    op.create_index('ix_audit_logs_details_gin', 'audit_logs', ['details'], postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Revert both columns to plain JSON."""
+    op.drop_index('ix_audit_logs_details_gin', table_name='audit_logs')
+    op.alter_column(
+        'audit_logs', 'details',
+        type_=JSON(),
+        existing_type=JSONB(),
+        existing_nullable=True,
+        postgresql_using='details::json',
+    )
+    op.alter_column(
+        'documents', 'subagents_allowed',
+        type_=JSON(),
+        existing_type=JSONB(),
+        postgresql_using='subagents_allowed::json',
+    )
@@ -0,0 +1,28 @@
+"""add content_hash to documents
+
+Revision ID: 23db54c43a87
+Revises: 8be1c28fb3bb
+Create Date: 2026-10-16 13:40:19.552806
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '23db54c43a87'
+down_revision: Union[str, Sequence[str], None] = '8be1c28fb3bb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Store the SHA-256 of each document's source content."""
+    op.add_column('documents', sa.Column('content_hash', sa.String(64), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop documents.content_hash."""
+    op.drop_column('documents', 'content_hash')
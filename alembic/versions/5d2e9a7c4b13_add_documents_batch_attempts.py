@@ -0,0 +1,31 @@
+"""add documents.batch_attempts
+
+Revision ID: 5d2e9a7c4b13
+Revises: c41e8b0f5a27
+Create Date: 2026-10-17 09:14:52.207431
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2e9a7c4b13'
+down_revision: Union[str, Sequence[str], None] = 'c41e8b0f5a27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Count failed attempts to complete a document's embedding batch."""
+    op.add_column(
+        'documents',
+        sa.Column('batch_attempts', sa.Integer(), nullable=False, server_default=sa.text('0'))
+    )
+
+
+def downgrade() -> None:
+    """Drop documents.batch_attempts."""
+    op.drop_column('documents', 'batch_attempts')
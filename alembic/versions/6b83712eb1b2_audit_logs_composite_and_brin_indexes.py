@@ -0,0 +1,50 @@
+"""audit_logs composite and BRIN indexes
+
+Revision ID: 6b83712eb1b2
+Revises: 00e46b805690
+Create Date: 2026-10-16 09:12:04.118220
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6b83712eb1b2'
+down_revision: Union[str, Sequence[str], None] = '00e46b805690'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace the three single-column audit_logs indexes with two cheaper ones.
+
+    Every INSERT into audit_logs used to update four B-trees (PK + created_at,
+    actor, action). The composite index answers the actor/action lookups with
+    time ordering, and BRIN covers the append-only created_at range scans at a
+    fraction of the size of a B-tree.
+    """
+    op.drop_index('ix_audit_logs_created_at', table_name='audit_logs')
+    op.drop_index('ix_audit_logs_actor', table_name='audit_logs')
+    op.drop_index('ix_audit_logs_action', table_name='audit_logs')
+
+    op.execute(
+        "CREATE INDEX ix_audit_logs_actor_action_time "
+        "ON audit_logs (actor, action, created_at DESC)"
+    )
+    op.execute(
+        "CREATE INDEX ix_audit_logs_created_at_brin "
+        "ON audit_logs USING BRIN (created_at)"
+    )
+
+
+def downgrade() -> None:
+    """Restore the original single-column audit_logs indexes."""
+    op.drop_index('ix_audit_logs_created_at_brin', table_name='audit_logs')
+    op.drop_index('ix_audit_logs_actor_action_time', table_name='audit_logs')
+
+    op.create_index('ix_audit_logs_created_at', 'audit_logs', ['created_at'])
+    op.create_index('ix_audit_logs_actor', 'audit_logs', ['actor'])
+    op.create_index('ix_audit_logs_action', 'audit_logs', ['action'])
@@ -0,0 +1,29 @@
+"""quantize embedding_cache vectors
+
+Revision ID: 6e6b39266d11
+Revises: 14c93b801058
+Create Date: 2026-10-16 15:21:07.483912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6e6b39266d11'
+down_revision: Union[str, Sequence[str], None] = '14c93b801058'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add embedding_cache.scale; rows with a scale hold int8 vectors."""
+    op.add_column('embedding_cache', sa.Column('scale', sa.Float, nullable=True))
+
+
+def downgrade() -> None:
+    """Drop int8 rows (unreadable as float32) and the scale column."""
+    op.execute("DELETE FROM embedding_cache WHERE scale IS NOT NULL")
+    op.drop_column('embedding_cache', 'scale')
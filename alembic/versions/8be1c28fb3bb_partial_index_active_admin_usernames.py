@@ -0,0 +1,37 @@
+"""partial index on active admin usernames
+
+Revision ID: 8be1c28fb3bb
+Revises: b20963ba9fae
+Create Date: 2026-10-16 13:21:44.910372
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8be1c28fb3bb'
+down_revision: Union[str, Sequence[str], None] = 'b20963ba9fae'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index only active admin usernames, matching the login lookup.
+
+    Uniqueness is still enforced by the column's UNIQUE constraint, so the
+    plain ix_admin_users_username duplicate is dropped.
+    """
+    op.drop_index('ix_admin_users_username', table_name='admin_users')
+    op.execute(
+        "CREATE INDEX ix_admin_users_username_active "
+        "ON admin_users (username) WHERE is_active = true"
+    )
+
+
+def downgrade() -> None:
+    """Restore the full username index."""
+    op.drop_index('ix_admin_users_username_active', table_name='admin_users')
+    op.create_index('ix_admin_users_username', 'admin_users', ['username'])
@@ -0,0 +1,36 @@
+"""trigram index on clients.clinic_name
+
+Revision ID: 967f362cc1b4
+Revises: dcbe8f8d23fc
+Create Date: 2026-10-16 10:05:37.902114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '967f362cc1b4'
+down_revision: Union[str, Sequence[str], None] = 'dcbe8f8d23fc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index lower(clinic_name) with pg_trgm so '%name%' lookups avoid a seq scan.
+
+    The CLI scripts search with lower(clinic_name) LIKE '%<name>%'; the index
+    is built on the same expression so the planner can use it.
+    """
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX ix_clients_clinic_name_trgm "
+        "ON clients USING GIN (lower(clinic_name) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Drop the trigram index (the extension is left installed)."""
+    op.drop_index('ix_clients_clinic_name_trgm', table_name='clients')
@@ -0,0 +1,28 @@
+"""add documents.batch_job_id
+
+Revision ID: a3f7c2d91e84
+Revises: e9b82fc6d1c1
+Create Date: 2026-10-16 18:20:11.402517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3f7c2d91e84'
+down_revision: Union[str, Sequence[str], None] = 'e9b82fc6d1c1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Track the OpenAI Batch API job embedding a pending document."""
+    op.add_column('documents', sa.Column('batch_job_id', sa.String(64), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop documents.batch_job_id."""
+    op.drop_column('documents', 'batch_job_id')
@@ -0,0 +1,40 @@
+"""covering index on documents (client_id, status)
+
+Revision ID: b20963ba9fae
+Revises: f54d56fbe111
+Create Date: 2026-10-16 11:14:08.283951
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b20963ba9fae'
+down_revision: Union[str, Sequence[str], None] = 'f54d56fbe111'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace the client_id and status singles with one covering composite.
+
+    "Documents for practice X with status Y" is answered by a single index
+    scan, and INCLUDE (title, updated_at) lets the listing skip the heap.
+    client_id-only lookups still use the leading column.
+    """
+    op.drop_index('ix_documents_client_id', table_name='documents')
+    op.drop_index('ix_documents_status', table_name='documents')
+    op.execute(
+        "CREATE INDEX ix_documents_client_status "
+        "ON documents (client_id, status) INCLUDE (title, updated_at)"
+    )
+
+
+def downgrade() -> None:
+    """Restore the single-column documents indexes."""
+    op.drop_index('ix_documents_client_status', table_name='documents')
+    op.create_index('ix_documents_client_id', 'documents', ['client_id'])
+    op.create_index('ix_documents_status', 'documents', ['status'])
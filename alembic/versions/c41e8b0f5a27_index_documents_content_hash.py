@@ -0,0 +1,32 @@
+"""partial index on indexed documents by content hash
+
+Revision ID: c41e8b0f5a27
+Revises: a3f7c2d91e84
+Create Date: 2026-10-16 19:02:37.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41e8b0f5a27'
+down_revision: Union[str, Sequence[str], None] = 'a3f7c2d91e84'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index (client_id, content_hash) of indexed documents, matching the
+    duplicate-upload lookup."""
+    op.execute(
+        "CREATE INDEX ix_documents_client_content_hash_indexed "
+        "ON documents (client_id, content_hash) WHERE status = 'indexed'"
+    )
+
+
+def downgrade() -> None:
+    """Drop the content hash index."""
+    op.drop_index('ix_documents_client_content_hash_indexed', table_name='documents')
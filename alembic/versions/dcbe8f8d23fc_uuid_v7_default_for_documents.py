@@ -0,0 +1,57 @@
+"""uuid v7 default for documents
+
+Revision ID: dcbe8f8d23fc
+Revises: 6b83712eb1b2
+Create Date: 2026-10-16 09:40:51.530117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'dcbe8f8d23fc'
+down_revision: Union[str, Sequence[str], None] = '6b83712eb1b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Install gen_uuid_v7() and use it as the server default for documents.doc_id.
+
+    UUIDv7 puts a millisecond timestamp in the high bits, so new keys land on
+    the rightmost B-tree leaf instead of a random page.
+    """
+    # 48-bit unix-ms timestamp over the random bytes of gen_random_uuid(),
+    # then flip bits 52/53 so the version nibble reads 7 (v4 0100 -> 0111).
+    op.execute("""
+        CREATE OR REPLACE FUNCTION gen_uuid_v7() RETURNS uuid AS $$
+            SELECT encode(
+                set_bit(
+                    set_bit(
+                        overlay(
+                            uuid_send(gen_random_uuid())
+                            PLACING substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                            FROM 1 FOR 6
+                        ),
+                        52, 1
+                    ),
+                    53, 1
+                ),
+                'hex'
+            )::uuid
+        $$ LANGUAGE sql VOLATILE;
+    """)
+
+    op.alter_column(
+        'documents', 'doc_id',
+        server_default=sa.text('gen_uuid_v7()'),
+    )
+
+
+def downgrade() -> None:
+    """Drop the doc_id server default and the gen_uuid_v7() function."""
+    op.alter_column('documents', 'doc_id', server_default=None)
+    op.execute("DROP FUNCTION IF EXISTS gen_uuid_v7()")
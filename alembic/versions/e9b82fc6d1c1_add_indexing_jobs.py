@@ -0,0 +1,42 @@
+"""add indexing_jobs
+
+Revision ID: e9b82fc6d1c1
+Revises: 6e6b39266d11
+Create Date: 2026-10-16 16:05:42.907311
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e9b82fc6d1c1'
+down_revision: Union[str, Sequence[str], None] = '6e6b39266d11'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create indexing_jobs for uploads indexed in the background."""
+    op.create_table(
+        'indexing_jobs',
+        sa.Column('job_id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_uuid_v7()')),
+        sa.Column('client_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('clients.client_id'), nullable=False),
+        sa.Column('doc_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('filename', sa.String(500), nullable=False),
+        sa.Column('status', sa.String(20), nullable=False, server_default='queued'),
+        sa.Column('percent', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('message', sa.String, nullable=True),
+        sa.Column('created_at', sa.DateTime, server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime, server_default=sa.func.now()),
+    )
+    op.create_index('ix_indexing_jobs_client_id', 'indexing_jobs', ['client_id'])
+
+
+def downgrade() -> None:
+    """Drop indexing_jobs."""
+    op.drop_index('ix_indexing_jobs_client_id', table_name='indexing_jobs')
+    op.drop_table('indexing_jobs')
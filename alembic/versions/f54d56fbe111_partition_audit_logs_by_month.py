@@ -0,0 +1,166 @@
+"""partition audit_logs by month
+
+Revision ID: f54d56fbe111
+Revises: 15d938b4170f
+Create Date: 2026-10-16 10:52:40.615309
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f54d56fbe111'
+down_revision: Union[str, Sequence[str], None] = '15d938b4170f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Monthly partitions pre-created past the current month
+MONTHS_AHEAD = 3
+
+
+def upgrade() -> None:
+    """Rebuild audit_logs as a table range-partitioned on created_at by month.
+
+    Time-range queries prune to the matching months, and old months can be
+    detached and dropped instead of DELETE + VACUUM. Existing rows are copied
+    across; the id sequence is kept so ids stay monotonic.
+    """
+    # Move the old table out of the way (index names must be free for the new one)
+    op.drop_index('ix_audit_logs_details_gin', table_name='audit_logs')
+    op.drop_index('ix_audit_logs_created_at_brin', table_name='audit_logs')
+    op.drop_index('ix_audit_logs_actor_action_time', table_name='audit_logs')
+    op.execute("ALTER TABLE audit_logs RENAME TO audit_logs_unpartitioned")
+    op.execute("ALTER TABLE audit_logs_unpartitioned RENAME CONSTRAINT audit_logs_pkey TO audit_logs_unpartitioned_pkey")
+    op.execute("ALTER SEQUENCE audit_logs_id_seq OWNED BY NONE")
+
+    # The partition key has to be part of the primary key
+    op.execute("""
+        CREATE TABLE audit_logs (
+            id BIGINT NOT NULL DEFAULT nextval('audit_logs_id_seq'),
+            actor VARCHAR(100) NOT NULL,
+            action VARCHAR(100) NOT NULL,
+            practice_id UUID,
+            doc_id UUID,
+            result VARCHAR(20) NOT NULL DEFAULT 'success',
+            details JSONB,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now(),
+            CONSTRAINT audit_logs_pkey PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+    """)
+    op.execute("ALTER SEQUENCE audit_logs_id_seq OWNED BY audit_logs.id")
+
+    # Idempotent helper: create the partition holding the month of `month_start`
+    op.execute("""
+        CREATE OR REPLACE FUNCTION create_audit_logs_partition(month_start date) RETURNS void AS $$
+        DECLARE
+            lower_bound date := date_trunc('month', month_start)::date;
+            upper_bound date := (date_trunc('month', month_start) + interval '1 month')::date;
+            partition_name text := 'audit_logs_' || to_char(lower_bound, 'YYYY_MM');
+        BEGIN
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF audit_logs FOR VALUES FROM (%L) TO (%L)',
+                partition_name, lower_bound, upper_bound
+            );
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    # One partition per month from the oldest existing row to MONTHS_AHEAD out
+    op.execute(f"""
+        SELECT create_audit_logs_partition(m::date)
+        FROM generate_series(
+            date_trunc('month', LEAST(
+                (SELECT min(created_at) FROM audit_logs_unpartitioned),
+                now()
+            )),
+            date_trunc('month', now()) + interval '{MONTHS_AHEAD} months',
+            interval '1 month'
+        ) AS m
+    """)
+    # Safety net so inserts never fail if a month was not created in time
+    op.execute("CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT")
+
+    op.execute("""
+        INSERT INTO audit_logs (id, actor, action, practice_id, doc_id, result, details, created_at)
+        SELECT id, actor, action, practice_id, doc_id, result, details, COALESCE(created_at, now())
+        FROM audit_logs_unpartitioned
+    """)
+    op.execute("DROP TABLE audit_logs_unpartitioned")
+
+    # Indexes on the parent are created on every partition
+    op.execute(
+        "CREATE INDEX ix_audit_logs_actor_action_time "
+        "ON audit_logs (actor, action, created_at DESC)"
+    )
+    op.execute(
+        "CREATE INDEX ix_audit_logs_created_at_brin "
+        "ON audit_logs USING BRIN (created_at)"
+    )
+    op.create_index('ix_audit_logs_details_gin', 'audit_logs', ['details'], postgresql_using='gin')
+
+    # Roll partitions forward monthly when pg_cron is available; otherwise the
+    # application creates the current and next month at startup
+    op.execute("""
+        DO $do$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+                PERFORM cron.schedule(
+                    'audit_logs_next_partition',
+                    '0 0 25 * *',
+                    $cron$SELECT create_audit_logs_partition((date_trunc('month', now()) + interval '1 month')::date)$cron$
+                );
+            END IF;
+        END
+        $do$;
+    """)
+
+
+def downgrade() -> None:
+    """Collapse audit_logs back into a single unpartitioned table."""
+    op.execute("""
+        DO $do$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+                PERFORM cron.unschedule('audit_logs_next_partition');
+            END IF;
+        END
+        $do$;
+    """)
+
+    op.execute("ALTER TABLE audit_logs RENAME TO audit_logs_partitioned")
+    op.execute("ALTER TABLE audit_logs_partitioned RENAME CONSTRAINT audit_logs_pkey TO audit_logs_partitioned_pkey")
+    op.execute("ALTER INDEX ix_audit_logs_actor_action_time RENAME TO ix_audit_logs_partitioned_actor_action_time")
+    op.execute("ALTER INDEX ix_audit_logs_created_at_brin RENAME TO ix_audit_logs_partitioned_created_at_brin")
+    op.execute("ALTER INDEX ix_audit_logs_details_gin RENAME TO ix_audit_logs_partitioned_details_gin")
+    op.execute("ALTER SEQUENCE audit_logs_id_seq OWNED BY NONE")
+
+    op.execute("""
+        CREATE TABLE audit_logs (
+            id BIGINT NOT NULL DEFAULT nextval('audit_logs_id_seq') PRIMARY KEY,
+            actor VARCHAR(100) NOT NULL,
+            action VARCHAR(100) NOT NULL,
+            practice_id UUID,
+            doc_id UUID,
+            result VARCHAR(20) NOT NULL DEFAULT 'success',
+            details JSONB,
+            created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT now()
+        )
+    """)
+    op.execute("ALTER SEQUENCE audit_logs_id_seq OWNED BY audit_logs.id")
+    op.execute("INSERT INTO audit_logs SELECT * FROM audit_logs_partitioned")
+    op.execute("DROP TABLE audit_logs_partitioned CASCADE")
+    op.execute("DROP FUNCTION IF EXISTS create_audit_logs_partition(date)")
+
+    op.execute(
+        "CREATE INDEX ix_audit_logs_actor_action_time "
+        "ON audit_logs (actor, action, created_at DESC)"
+    )
+    op.execute(
+        "CREATE INDEX ix_audit_logs_created_at_brin "
+        "ON audit_logs USING BRIN (created_at)"
+    )
+    op.create_index('ix_audit_logs_details_gin', 'audit_logs', ['details'], postgresql_using='gin')
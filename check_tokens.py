@@ -1,15 +1,17 @@
 #!/usr/bin/env python3
 """Quick script to check client tokens in the database."""
 
+from sqlalchemy import func
 from src.core.db import get_db
 from src.models.models import Client
 
 def main():
     db = next(get_db())
     try:
-        clients = db.query(Client).all()
+        total = db.query(func.count(Client.client_id)).scalar()
+        clients = db.query(Client).execution_options(stream_results=True).yield_per(200)
 
-        print(f"\nFound {len(clients)} clients:")
+        print(f"\nFound {total} clients:")
         print("-" * 80)
 
         for client in clients:
@@ -1,20 +1,17 @@
 """
 Script to fetch access token for a client from the database
 """
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import func
+from src.core.db import get_db
 from src.models.models import Client
-from src.core.config import DATABASE_URL
 
-# Create engine and session
-engine = create_engine(DATABASE_URL)
-Session = sessionmaker(bind=engine)
-session = Session()
+# Reuse the application's engine/session factory
+session = next(get_db())
 
 try:
     # Query for Robeck Dental client
     client = session.query(Client).filter(
-        Client.clinic_name.ilike('%robeck%')
+        func.lower(Client.clinic_name).like('%robeck%')
     ).first()
     
     if client:
@@ -30,12 +27,13 @@ try:
     else:
         print("\n❌ No client found with 'robeck' in the name.")
         print("\nLet me list all clients in the database:\n")
-        all_clients = session.query(Client).all()
-        if all_clients:
-            for c in all_clients:
-                print(f"  - {c.clinic_name} (ID: {c.client_id})")
-                print(f"    Access Token: {c.access_token}")
-        else:
+        all_clients = session.query(Client).execution_options(stream_results=True).yield_per(200)
+        found = False
+        for c in all_clients:
+            found = True
+            print(f"  - {c.clinic_name} (ID: {c.client_id})")
+            print(f"    Access Token: {c.access_token}")
+        if not found:
             print("  No clients found in database.")
             
 except Exception as e:
@@ -6,6 +6,7 @@ This script creates a secure one-time token and outputs a URL you can use to acc
 
 import sys
 from uuid import UUID
+from sqlalchemy import func
 from src.core.db import get_db
 from src.models.models import Client
 from src.api.dependencies import generate_one_time_url_token
@@ -19,13 +20,13 @@ def main():
         if clinic_name:
             # Find client by clinic name
             client = db.query(Client).filter(
-                Client.clinic_name.ilike(f'%{clinic_name}%')
+                func.lower(Client.clinic_name).like(f'%{clinic_name.lower()}%')
             ).first()
 
             if not client:
                 print(f"ERROR: No client found matching '{clinic_name}'")
                 print("\nAvailable clients:")
-                all_clients = db.query(Client).all()
+                all_clients = db.query(Client).execution_options(stream_results=True).yield_per(200)
                 for c in all_clients:
                     print(f"  - {c.clinic_name}")
                 sys.exit(1)
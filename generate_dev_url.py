@@ -5,9 +5,15 @@ These URLs point to your local development server with the backend API on port 8
 """
 
 import sys
+import urllib.parse
+from sqlalchemy import func
 from src.core.db import get_db
 from src.models.models import Client
 
+# URL-encoded API parameter and URL prefix, built once rather than per client
+API_PARAM = urllib.parse.quote("http://localhost:8000/api/clinical", safe='')
+_URL_PREFIX = f"http://localhost:3000/?api={API_PARAM}&permanent_token="
+
 def main():
     # Get clinic name from command line or show all
     clinic_name = sys.argv[1] if len(sys.argv) > 1 else None
@@ -17,33 +23,36 @@ def main():
         if clinic_name:
             # Find client by clinic name
             client = db.query(Client).filter(
-                Client.clinic_name.ilike(f'%{clinic_name}%')
+                func.lower(Client.clinic_name).like(f'%{clinic_name.lower()}%')
             ).first()
 
             if not client:
                 print(f"ERROR: No client found matching '{clinic_name}'")
                 print("\nAvailable clients:")
-                all_clients = db.query(Client).all()
+                all_clients = db.query(Client).execution_options(stream_results=True).yield_per(200)
                 for c in all_clients:
                     print(f"  - {c.clinic_name}")
                 sys.exit(1)
 
             print_client_url(client)
         else:
-            # Show all clients
-            clients = db.query(Client).all()
+            # Show all clients, streaming rows instead of loading the whole table
+            clients = db.query(Client).execution_options(stream_results=True).yield_per(200)
 
-            if not clients:
-                print("ERROR: No clients found in database.")
-                sys.exit(1)
+            found = False
+            for client in clients:
+                if not found:
+                    print("\n" + "="*80)
+                    print("DEVELOPMENT ACCESS URLS (Port 3000)")
+                    print("="*80 + "\n")
+                    found = True
+                print_client_url(client, end="\n")
 
-            print("\n" + "="*80)
-            print("DEVELOPMENT ACCESS URLS (Port 3000)")
-            print("="*80 + "\n")
+            sys.stdout.flush()
 
-            for client in clients:
-                print_client_url(client)
-                print()
+            if not found:
+                print("ERROR: No clients found in database.")
+                sys.exit(1)
 
     except Exception as e:
         print(f"ERROR: {e}")
@@ -52,25 +61,25 @@ def main():
     finally:
         db.close()
 
-def print_client_url(client):
+def print_client_url(client, end=""):
     """Print the development access URL for a client."""
     if not client.access_token:
-        print(f"WARNING: {client.clinic_name} has no access token configured")
+        sys.stdout.write(f"WARNING: {client.clinic_name} has no access token configured\n{end}")
         return
 
-    # URL-encode the API parameter
-    import urllib.parse
-    api_param = urllib.parse.quote("http://localhost:8000/api/clinical", safe='')
-
-    print(f"Clinic: {client.clinic_name}")
-    print(f"Client ID: {client.client_id}")
-    print(f"Access Token: {client.access_token}")
-    print(f"\nDevelopment URL (Port 3000):")
-    print(f"http://localhost:3000/?api={api_param}&permanent_token={client.access_token}")
-    print(f"\nAlternative (without URL encoding):")
-    print(f"http://localhost:3000/?api=http://localhost:8000/api/clinical&permanent_token={client.access_token}")
-    print(f"\nNote: This URL never expires and can be bookmarked!")
-    print("-" * 80)
+    # One write per client; the caller flushes once after the loop
+    sys.stdout.write(
+        f"Clinic: {client.clinic_name}\n"
+        f"Client ID: {client.client_id}\n"
+        f"Access Token: {client.access_token}\n"
+        f"\nDevelopment URL (Port 3000):\n"
+        f"{_URL_PREFIX}{client.access_token}\n"
+        f"\nAlternative (without URL encoding):\n"
+        f"http://localhost:3000/?api=http://localhost:8000/api/clinical&permanent_token={client.access_token}\n"
+        f"\nNote: This URL never expires and can be bookmarked!\n"
+        f"{'-' * 80}\n"
+        f"{end}"
+    )
 
 if __name__ == "__main__":
     main()
@@ -5,6 +5,7 @@ These URLs use the permanent access token and don't expire.
 """
 
 import sys
+from sqlalchemy import func
 from src.core.db import get_db
 from src.models.models import Client
 
@@ -17,33 +18,36 @@ def main():
         if clinic_name:
             # Find client by clinic name
             client = db.query(Client).filter(
-                Client.clinic_name.ilike(f'%{clinic_name}%')
+                func.lower(Client.clinic_name).like(f'%{clinic_name.lower()}%')
             ).first()
 
             if not client:
                 print(f"ERROR: No client found matching '{clinic_name}'")
                 print("\nAvailable clients:")
-                all_clients = db.query(Client).all()
+                all_clients = db.query(Client).execution_options(stream_results=True).yield_per(200)
                 for c in all_clients:
                     print(f"  - {c.clinic_name}")
                 sys.exit(1)
 
             print_client_url(client)
         else:
-            # Show all clients
-            clients = db.query(Client).all()
+            # Show all clients, streaming rows instead of loading the whole table
+            clients = db.query(Client).execution_options(stream_results=True).yield_per(200)
 
-            if not clients:
-                print("ERROR: No clients found in database.")
-                sys.exit(1)
+            found = False
+            for client in clients:
+                if not found:
+                    print("\n" + "="*80)
+                    print("PERMANENT ACCESS URLS FOR ALL CLIENTS")
+                    print("="*80 + "\n")
+                    found = True
+                print_client_url(client, end="\n")
 
-            print("\n" + "="*80)
-            print("PERMANENT ACCESS URLS FOR ALL CLIENTS")
-            print("="*80 + "\n")
+            sys.stdout.flush()
 
-            for client in clients:
-                print_client_url(client)
-                print()
+            if not found:
+                print("ERROR: No clients found in database.")
+                sys.exit(1)
 
     except Exception as e:
         print(f"ERROR: {e}")
@@ -52,19 +56,23 @@ def main():
     finally:
         db.close()
 
-def print_client_url(client):
+def print_client_url(client, end=""):
     """Print the permanent access URL for a client."""
     if not client.access_token:
-        print(f"WARNING: {client.clinic_name} has no access token configured")
+        sys.stdout.write(f"WARNING: {client.clinic_name} has no access token configured\n{end}")
         return
 
-    print(f"Clinic: {client.clinic_name}")
-    print(f"Client ID: {client.client_id}")
-    print(f"Access Token: {client.access_token}")
-    print(f"\nPermanent Access URL:")
-    print(f"http://localhost:8000/frontends/clinical-ui/index.html?permanent_token={client.access_token}")
-    print(f"\nNote: This URL never expires and can be bookmarked!")
-    print("-" * 80)
+    # One write per client; the caller flushes once after the loop
+    sys.stdout.write(
+        f"Clinic: {client.clinic_name}\n"
+        f"Client ID: {client.client_id}\n"
+        f"Access Token: {client.access_token}\n"
+        f"\nPermanent Access URL:\n"
+        f"http://localhost:8000/frontends/clinical-ui/index.html?permanent_token={client.access_token}\n"
+        f"\nNote: This URL never expires and can be bookmarked!\n"
+        f"{'-' * 80}\n"
+        f"{end}"
+    )
 
 if __name__ == "__main__":
     main()
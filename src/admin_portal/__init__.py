@@ -8,6 +8,13 @@ This module provides admin-only access to:
 - Agent health monitoring
 """
 
-from src.admin_portal.router import admin_portal_router
-
 __all__ = ["admin_portal_router"]
+
+
+def __getattr__(name):
+    # Resolve the router on first access so importing a submodule (auth,
+    # services, ...) does not drag in FastAPI routing and everything below it
+    if name == "admin_portal_router":
+        from src.admin_portal.router import admin_portal_router
+        return admin_portal_router
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
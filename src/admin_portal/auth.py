@@ -6,19 +6,31 @@ Admin credentials are stored in the database (admin_users table).
 """
 
 import os
+import hmac
+import atexit
+import asyncio
+import time
+import base64
+import binascii
+import hashlib
 import logging
+import secrets
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 import jwt
 import bcrypt
+import orjson
 
 from src.admin_portal.schemas import AdminUser, AdminLoginRequest, AdminLoginResponse
 from src.models.models import AdminUser as AdminUserModel
-from src.core.db import get_db
+from src.core.db import get_db, SessionLocal
 
 logger = logging.getLogger(__name__)
 
@@ -31,18 +43,75 @@ SECRET_KEY = os.getenv("ADMIN_JWT_SECRET", "practice-brain-admin-secret-key-chan
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
 
+# HMAC state keyed once at import; each verification copies it instead of
+# re-deriving the padded key
+_TOKEN_HMAC = hmac.new(SECRET_KEY.encode('utf-8'), digestmod=hashlib.sha256)
+
+# bcrypt cost for new hashes (2^rounds work). Existing hashes keep the cost
+# they were created with.
+BCRYPT_ROUNDS = 10
+
+# last_login_at updates are queued per user and written in one batch every
+# few seconds instead of a commit per login
+LAST_LOGIN_FLUSH_SECONDS = 5.0
+
+_pending_last_login: Dict[int, datetime] = {}
+_pending_last_login_lock = threading.Lock()
+_last_login_flusher: Optional[threading.Thread] = None
+
 # Security scheme
 security = HTTPBearer()
 
+# Successful bcrypt checks are remembered for a short while so repeat logins
+# skip the (deliberately slow) key schedule
+PASSWORD_CACHE_TTL_SECONDS = 300
+PASSWORD_CACHE_MAX_ENTRIES = 512
+
+_password_cache: "OrderedDict[Tuple[bytes, str], float]" = OrderedDict()
+_password_cache_lock = threading.Lock()
+
+# Cache keys are an HMAC under a random per-process secret, so the cache never
+# holds anything an attacker could brute-force offline from a memory dump
+_PASSWORD_CACHE_SECRET = secrets.token_bytes(32)
+
+# Validated principals per token, so the several API calls behind one admin
+# page load verify the JWT once.
+PRINCIPAL_CACHE_TTL_SECONDS = 30
+PRINCIPAL_CACHE_MAX_ENTRIES = 10_000
+
+_principal_cache: "OrderedDict[bytes, Tuple[float, AdminUser]]" = OrderedDict()
+_principal_cache_lock = threading.Lock()
+
 
 # =============================================================================
 # Helper Functions
 # =============================================================================
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against a hash using bcrypt directly."""
+    """
+    Verify a password against a hash using bcrypt directly.
+
+    Successful matches are cached per (keyed HMAC of the password, stored
+    hash) for PASSWORD_CACHE_TTL_SECONDS, at most PASSWORD_CACHE_MAX_ENTRIES
+    of them. Failures are never cached, and changing the stored hash
+    naturally invalidates the entry.
+    """
+    key = (
+        hmac.new(_PASSWORD_CACHE_SECRET, plain_password.encode('utf-8'), hashlib.sha256).digest(),
+        hashed_password,
+    )
+    now = time.monotonic()
+
+    with _password_cache_lock:
+        expires_at = _password_cache.get(key)
+        if expires_at is not None:
+            if expires_at > now:
+                _password_cache.move_to_end(key)
+                return True
+            del _password_cache[key]
+
     try:
-        return bcrypt.checkpw(
+        matched = bcrypt.checkpw(
             plain_password.encode('utf-8'),
             hashed_password.encode('utf-8')
         )
@@ -50,33 +119,143 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         logger.error(f"Password verification error: {e}")
         return False
 
+    if matched:
+        with _password_cache_lock:
+            _password_cache[key] = now + PASSWORD_CACHE_TTL_SECONDS
+            _password_cache.move_to_end(key)
+            while len(_password_cache) > PASSWORD_CACHE_MAX_ENTRIES:
+                _password_cache.popitem(last=False)
+
+    return matched
+
 
 def get_password_hash(password: str) -> str:
     """Generate password hash using bcrypt directly."""
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode('utf-8')
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password on a worker thread, for use from async code."""
+    return await asyncio.to_thread(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """get_password_hash on a worker thread, for use from async code."""
+    return await asyncio.to_thread(get_password_hash, password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token."""
     to_encode = data.copy()
-    expire = datetime.utcnow() + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
-    to_encode.update({"exp": expire})
+    lifetime = expires_delta.total_seconds() if expires_delta else ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    to_encode["exp"] = int(time.time() + lifetime)
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 
+def _b64url_decode(segment: str) -> bytes:
+    """Decode an unpadded base64url JWT segment."""
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
 def decode_access_token(token: str) -> Optional[dict]:
-    """Decode and validate a JWT token."""
+    """
+    Decode and validate a JWT token.
+
+    Verifies the HS256 signature against the precomputed HMAC state and checks
+    the header algorithm and the "exp" (required), "nbf" and "iat" claims the
+    way PyJWT does, without a round-trip through it.
+    """
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
-    except jwt.ExpiredSignatureError:
+        header_b64, payload_b64, signature_b64 = token.split(".")
+
+        mac = _TOKEN_HMAC.copy()
+        mac.update(f"{header_b64}.{payload_b64}".encode("ascii"))
+        if not hmac.compare_digest(mac.digest(), _b64url_decode(signature_b64)):
+            raise ValueError("Signature verification failed")
+
+        header = orjson.loads(_b64url_decode(header_b64))
+        if not isinstance(header, dict) or header.get("alg") != ALGORITHM:
+            raise ValueError("The specified alg value is not allowed")
+
+        payload = orjson.loads(_b64url_decode(payload_b64))
+        if not isinstance(payload, dict):
+            raise ValueError("Invalid payload")
+
+        if "exp" not in payload:
+            raise ValueError('Token is missing the "exp" claim')
+        for claim in ("exp", "nbf", "iat"):
+            value = payload.get(claim)
+            if claim in payload and (isinstance(value, bool) or not isinstance(value, (int, float))):
+                raise ValueError(f"Claim ({claim}) must be a number")
+    except (ValueError, binascii.Error, UnicodeError) as e:
+        logger.warning(f"Invalid token: {e}")
+        return None
+
+    now = time.time()
+    if payload["exp"] <= now:
         logger.warning("Token has expired")
         return None
-    except jwt.InvalidTokenError as e:
-        logger.warning(f"Invalid token: {e}")
+    if payload.get("nbf", now) > now or payload.get("iat", now) > now:
+        logger.warning("Token is not yet valid")
         return None
 
+    return payload
+
+
+# =============================================================================
+# Last Login Tracking
+# =============================================================================
+
+def record_last_login(user_id: int, when: datetime) -> None:
+    """Queue a last_login_at update; the flusher thread writes it within a few seconds."""
+    global _last_login_flusher
+
+    with _pending_last_login_lock:
+        _pending_last_login[user_id] = when
+        if _last_login_flusher is None:
+            _last_login_flusher = threading.Thread(
+                target=_last_login_flush_loop, name="admin-last-login-flusher", daemon=True
+            )
+            _last_login_flusher.start()
+
+
+def flush_last_logins() -> None:
+    """Write all queued last_login_at values in one bulk UPDATE and one commit."""
+    global _pending_last_login
+
+    with _pending_last_login_lock:
+        pending, _pending_last_login = _pending_last_login, {}
+    if not pending:
+        return
+
+    db = SessionLocal()
+    try:
+        db.execute(
+            update(AdminUserModel),
+            [{"id": user_id, "last_login_at": when} for user_id, when in pending.items()],
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def _last_login_flush_loop() -> None:
+    while True:
+        time.sleep(LAST_LOGIN_FLUSH_SECONDS)
+        try:
+            flush_last_logins()
+        except Exception as e:
+            logger.error(f"Failed to flush admin last_login_at updates: {e}")
+
+
+@atexit.register
+def _flush_last_logins_at_exit() -> None:
+    try:
+        flush_last_logins()
+    except Exception as e:
+        logger.error(f"Failed to flush admin last_login_at updates at exit: {e}")
+
 
 # =============================================================================
 # Authentication Functions
@@ -101,9 +280,8 @@ def authenticate_admin(username: str, password: str, db: Session) -> Optional[Ad
         logger.warning(f"Admin login failed: invalid password for '{username}'")
         return None
 
-    # Update last login time
-    db_user.last_login_at = datetime.utcnow()
-    db.commit()
+    # Update last login time (written by the background flusher, not here)
+    record_last_login(db_user.id, datetime.utcnow())
 
     return AdminUser(username=db_user.username, role=db_user.role)
 
@@ -141,18 +319,36 @@ def admin_login(request: AdminLoginRequest, db: Session) -> AdminLoginResponse:
 VALID_ADMIN_ROLES = {"admin", "superadmin", "viewer"}
 
 
+def _token_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode('utf-8')).digest()
+
+
 async def require_admin(
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ) -> AdminUser:
     """
     FastAPI dependency that requires valid admin JWT token.
 
+    A validated principal is cached per token for PRINCIPAL_CACHE_TTL_SECONDS
+    (never past the token's exp).
+
     Usage:
         @router.get("/protected")
         async def protected_route(admin: AdminUser = Depends(require_admin)):
             pass
     """
     token = credentials.credentials
+    key = _token_key(token)
+    now = time.time()
+
+    with _principal_cache_lock:
+        cached = _principal_cache.get(key)
+        if cached is not None:
+            if cached[0] > now:
+                _principal_cache.move_to_end(key)
+                return cached[1]
+            del _principal_cache[key]
+
     payload = decode_access_token(token)
 
     if not payload:
@@ -171,7 +367,14 @@ async def require_admin(
             detail="Admin access required"
         )
 
-    return AdminUser(username=username, role=role)
+    admin = AdminUser(username=username, role=role)
+    with _principal_cache_lock:
+        _principal_cache[key] = (min(now + PRINCIPAL_CACHE_TTL_SECONDS, payload["exp"]), admin)
+        _principal_cache.move_to_end(key)
+        while len(_principal_cache) > PRINCIPAL_CACHE_MAX_ENTRIES:
+            _principal_cache.popitem(last=False)
+
+    return admin
 
 
 async def optional_admin(
@@ -6,22 +6,55 @@ Uses the same logic as embed_data.py for consistency.
 """
 
 import os
+import re
+import time
 import uuid
+import random
+import mmap
 import hashlib
+import importlib.util
 import logging
-from datetime import datetime
-from typing import List, Dict, Optional, Tuple
-from io import BytesIO
+import multiprocessing
+import threading
+import zipfile
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, BinaryIO, List, Dict, Optional, Tuple, Union
+from io import BytesIO, StringIO
+from itertools import chain, islice
+from functools import lru_cache
+from collections import deque
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
-from langchain_openai import OpenAIEmbeddings
-from langchain_experimental.text_splitter import SemanticChunker
-from langchain_pinecone import Pinecone as LangchainPinecone
-from langchain_core.documents import Document as LangchainDocument
-import pinecone
-
-from src.core.config import PINECONE_API_KEY, OPENAI_API_KEY, PINECONE_INDEX_NAME
+from src.core.config import (
+    PINECONE_API_KEY,
+    OPENAI_API_KEY,
+    PINECONE_INDEX_NAME,
+    EMBED_BATCH_SIZE,
+    EMBED_MAX_CONCURRENCY,
+    UPSERT_BATCH_SIZE,
+    UPSERT_MAX_INFLIGHT,
+    PINECONE_INT8_VECTORS,
+)
 from src.core.db import SessionLocal
-from src.models.models import Document as DBDocument
+import httpx
+import orjson
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.models.models import Document as DBDocument, EmbeddingCache, IndexingJob, uuid7
+
+try:
+    import pymupdf
+except ImportError:  # optional: fall back to PyPDF2
+    pymupdf = None
+
+# LangChain / Pinecone are imported where they are used: together they take
+# seconds to import, and most importers of this module never index anything.
+if TYPE_CHECKING:
+    from langchain_openai import OpenAIEmbeddings
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +66,59 @@ logger = logging.getLogger(__name__)
 MIN_CHUNK_SIZE = 100  # Minimum characters per chunk
 MAX_CHUNK_SIZE = 2000  # Maximum characters per chunk
 
+# Pinecone upsert batching (UPSERT_BATCH_SIZE / UPSERT_MAX_INFLIGHT come
+# from config); the REST client needs at least one thread per request in flight
+UPSERT_POOL_THREADS = max(30, UPSERT_MAX_INFLIGHT)  # REST client worker threads for async_req
+
+# How long a describe_index_stats() result is reused
+STATS_CACHE_TTL_SECONDS = 10
+
+HASH_TEXT_SLICE_CHARS = 1024 * 1024  # text is encoded for hashing one slice at a time
+HASH_READ_BLOCK_BYTES = 1024 * 1024  # file objects that cannot be mmapped are read in blocks
+
+# Uploads indexed in the background (see submit_indexing_job)
+INDEXING_JOB_WORKERS = 2
+# Progress ticks within a stage closer together than this (and under 1%)
+# are dropped before reaching SSE clients or job rows (coalesce_progress)
+PROGRESS_MIN_INTERVAL_SECONDS = 0.25
+
+# Pinecone accepts at most 1000 ids per delete request
+DELETE_BATCH_SIZE = 1000
+
+# OpenAI embedding requests: EMBED_BATCH_SIZE inputs per request and
+# EMBED_MAX_CONCURRENCY requests at once (both from config), plus a token
+# budget per request just under the API's 300k-token limit. Single inputs
+# beyond the model's EMBED_MAX_INPUT_TOKENS are split by the LangChain
+# wrapper instead. Tokens are counted with count_tokens (cl100k_base, the
+# embedding model's encoding).
+EMBED_BATCH_MAX_TOKENS = 290_000
+EMBED_MAX_INPUT_TOKENS = 8191
+EMBED_REQUEST_JITTER_SECONDS = 0.05  # spreads concurrent requests to avoid 429 bursts
+# Chunks are embedded in groups of one full round of concurrent requests;
+# the next group embeds while the previous one is upserted
+EMBED_PIPELINE_CHUNKS = EMBED_BATCH_SIZE * EMBED_MAX_CONCURRENCY
+# Batch API (opt-in for text indexing): completion window, the states of a
+# batch still in flight, and how often pending documents are checked
+EMBED_BATCH_COMPLETION_WINDOW = "24h"
+EMBED_BATCH_RUNNING_STATES = frozenset({"validating", "in_progress", "finalizing", "cancelling"})
+EMBED_BATCH_POLL_SECONDS = 300
+# Completing a finished batch: a worker claims the document (status
+# "processing") first; a claim older than EMBED_BATCH_CLAIM_SECONDS belongs to
+# a dead worker. Transient failures are retried after POLL * 2**attempts
+# seconds (capped), up to EMBED_BATCH_MAX_ATTEMPTS.
+EMBED_BATCH_CLAIM_SECONDS = 900
+EMBED_BATCH_RETRY_MAX_SECONDS = 6 * 60 * 60
+EMBED_BATCH_MAX_ATTEMPTS = 8
+OPENAI_MAX_CONNECTIONS = 100  # shared httpx pool for the OpenAI clients
+# Multiplex concurrent embedding requests over HTTP/2 when h2 (httpx[http2]) is installed
+OPENAI_HTTP2 = importlib.util.find_spec("h2") is not None
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+# Multi-file uploads: extraction + chunking runs in worker processes
+BATCH_INDEX_WORKERS = os.cpu_count() or 1
+BATCH_SUBMIT_AHEAD = 2  # files queued per worker; bounds batch memory
+
 # Supported file types
 SUPPORTED_EXTENSIONS = {
     ".txt": "text/plain",
@@ -49,36 +135,88 @@ SUPPORTED_EXTENSIONS = {
 # Text Extraction Functions
 # =============================================================================
 
-def extract_text_from_txt(content: bytes) -> str:
+_DOCX_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_DOCX_BODY = _DOCX_NS + "body"
+_DOCX_P = _DOCX_NS + "p"
+_DOCX_T = _DOCX_NS + "t"
+_DOCX_TAB = _DOCX_NS + "tab"
+_DOCX_BR = _DOCX_NS + "br"
+_DOCX_CR = _DOCX_NS + "cr"
+
+# BeautifulSoup backend: lxml's C parser when available (python-docx depends
+# on it), else the pure-Python html.parser
+HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+
+
+def _as_stream(content: Union[bytes, BinaryIO]) -> BinaryIO:
+    """Wrap raw bytes in a stream; file-like objects are passed through."""
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        return BytesIO(content)
+    return content
+
+
+def _file_path(content: Union[bytes, BinaryIO]) -> Optional[str]:
+    """Path of a file object backed by a file on disk, else None."""
+    name = getattr(content, "name", None)
+    if isinstance(name, str) and os.path.isfile(name):
+        return name
+    return None
+
+
+def extract_text_from_txt(content: Union[bytes, BinaryIO]) -> str:
     """Extract text from plain text file."""
+    if not isinstance(content, (bytes, bytearray, memoryview)):
+        content = content.read()
     try:
-        return content.decode('utf-8')
+        return bytes(content).decode('utf-8')
     except UnicodeDecodeError:
-        return content.decode('latin-1')
+        return bytes(content).decode('latin-1')
+
+
+def _extract_pdf_pages_pymupdf(stream: BinaryIO) -> List[str]:
+    """Extract all pages of a PDF with PyMuPDF (MuPDF's C text extraction)."""
+    path = _file_path(stream)
+    if path is not None:
+        doc = pymupdf.open(path)
+    else:
+        stream.seek(0)
+        doc = pymupdf.open(stream=stream.read(), filetype="pdf")
+    with doc:
+        return [page.get_text() for page in doc]
 
 
-def extract_text_from_pdf(content: bytes) -> str:
-    """Extract text from PDF file using PyPDF2."""
+def extract_text_from_pdf(content: Union[bytes, BinaryIO]) -> str:
+    """Extract text from PDF file using PyMuPDF when installed, else PyPDF2."""
+    stream = _as_stream(content)
     try:
-        import PyPDF2
-        pdf_reader = PyPDF2.PdfReader(BytesIO(content))
-        text_parts = []
-        for page in pdf_reader.pages:
-            text = page.extract_text()
+        if pymupdf is not None:
+            texts = _extract_pdf_pages_pymupdf(stream)
+        else:
+            import PyPDF2
+            pdf_reader = PyPDF2.PdfReader(stream)
+            texts = (page.extract_text() for page in pdf_reader.pages)
+
+        buf = StringIO()
+        for text in texts:
             if text:
-                text_parts.append(text)
-        return "\n\n".join(text_parts)
+                if buf.tell():
+                    buf.write("\n\n")
+                buf.write(text)
+        return buf.getvalue()
     except ImportError:
         logger.warning("PyPDF2 not installed. Trying pdfplumber...")
         try:
             import pdfplumber
-            with pdfplumber.open(BytesIO(content)) as pdf:
-                text_parts = []
+            stream.seek(0)
+            with pdfplumber.open(stream) as pdf:
+                buf = StringIO()
                 for page in pdf.pages:
                     text = page.extract_text()
                     if text:
-                        text_parts.append(text)
-            return "\n\n".join(text_parts)
+                        if buf.tell():
+                            buf.write("\n\n")
+                        buf.write(text)
+            return buf.getvalue()
         except ImportError:
             raise ImportError("Please install PyPDF2 or pdfplumber for PDF support: pip install PyPDF2 pdfplumber")
     except Exception as e:
@@ -86,16 +224,44 @@ def extract_text_from_pdf(content: bytes) -> str:
         raise
 
 
-def extract_text_from_docx(content: bytes) -> str:
-    """Extract text from DOCX file using python-docx."""
+def _docx_paragraph_text(paragraph) -> str:
+    """Text of a <w:p>: its <w:t> runs, with tabs and line breaks."""
+    parts = []
+    for node in paragraph.iter(_DOCX_T, _DOCX_TAB, _DOCX_BR, _DOCX_CR):
+        if node.tag == _DOCX_T:
+            parts.append(node.text or "")
+        elif node.tag == _DOCX_TAB:
+            parts.append("\t")
+        else:
+            parts.append("\n")
+    return "".join(parts)
+
+
+def extract_text_from_docx(content: Union[bytes, BinaryIO]) -> str:
+    """
+    Extract body paragraph text from a DOCX file.
+
+    Streams word/document.xml out of the zip with lxml.iterparse, freeing
+    each paragraph once read, instead of building python-docx's object
+    model for the whole package.
+    """
     try:
-        from docx import Document as DocxDocument
-        doc = DocxDocument(BytesIO(content))
-        text_parts = []
-        for paragraph in doc.paragraphs:
-            if paragraph.text.strip():
-                text_parts.append(paragraph.text)
-        return "\n\n".join(text_parts)
+        from lxml import etree
+        buf = StringIO()
+        with zipfile.ZipFile(_as_stream(content)) as package, package.open("word/document.xml") as xml:
+            for _, element in etree.iterparse(xml, events=("end",), tag=_DOCX_P):
+                parent = element.getparent()
+                if parent is None or parent.tag != _DOCX_BODY:
+                    continue  # table-cell / text-box paragraphs are skipped
+                text = _docx_paragraph_text(element)
+                if text.strip():
+                    if buf.tell():
+                        buf.write("\n\n")
+                    buf.write(text)
+                element.clear()
+                while element.getprevious() is not None:
+                    del parent[0]
+        return buf.getvalue()
     except ImportError:
         raise ImportError("Please install python-docx for DOCX support: pip install python-docx")
     except Exception as e:
@@ -103,18 +269,24 @@ def extract_text_from_docx(content: bytes) -> str:
         raise
 
 
-def extract_text_from_html(content: bytes) -> str:
+def extract_text_from_html(content: Union[bytes, BinaryIO]) -> str:
     """Extract text from HTML file."""
     try:
         from bs4 import BeautifulSoup
-        soup = BeautifulSoup(content, 'html.parser')
+        soup = BeautifulSoup(content, HTML_PARSER)
         # Remove script and style elements
         for element in soup(['script', 'style', 'nav', 'footer', 'header']):
             element.decompose()
         text = soup.get_text(separator='\n')
         # Clean up whitespace
-        lines = [line.strip() for line in text.splitlines() if line.strip()]
-        return "\n".join(lines)
+        buf = StringIO()
+        for line in text.splitlines():
+            line = line.strip()
+            if line:
+                if buf.tell():
+                    buf.write("\n")
+                buf.write(line)
+        return buf.getvalue()
     except ImportError:
         raise ImportError("Please install beautifulsoup4 for HTML support: pip install beautifulsoup4")
     except Exception as e:
@@ -122,13 +294,13 @@ def extract_text_from_html(content: bytes) -> str:
         raise
 
 
-def extract_text(filename: str, content: bytes) -> str:
+def extract_text(filename: str, content: Union[bytes, BinaryIO]) -> str:
     """
     Extract text from file based on extension.
     
     Args:
         filename: Original filename with extension
-        content: File content as bytes
+        content: File content as bytes, or a readable binary file object
         
     Returns:
         Extracted text content
@@ -153,62 +325,520 @@ def extract_text(filename: str, content: bytes) -> str:
 # Chunking Functions
 # =============================================================================
 
+# Paragraph break (group 1) or sentence end. The ".\n" case is a lookahead so
+# it does not consume the first newline of a following "\n\n".
+_BOUNDARY_RE = re.compile(r'(\n\n)|[.!?] |\.(?=\n)')
+
+
 def simple_chunk_text(text: str, chunk_size: int = 800, overlap: int = 100) -> List[str]:
     """
     Simple text chunking with overlap.
     Fallback when semantic chunking is not available.
     """
-    if len(text) <= chunk_size:
+    n = len(text)
+    if n <= chunk_size:
         return [text]
     
+    # Scan the text for boundaries once; each window then finds its break
+    # point with a bisect instead of re-running the regex over the window
+    para_ends: List[int] = []
+    sent_ends: List[int] = []
+    for match in _BOUNDARY_RE.finditer(text):
+        (para_ends if match.group(1) else sent_ends).append(match.end())
+    
+    half = chunk_size // 2
     chunks = []
     start = 0
     
-    while start < len(text):
+    while start < n:
         end = start + chunk_size
         
-        # Try to break at a sentence or paragraph boundary
-        if end < len(text):
-            # Look for paragraph break
-            para_break = text.rfind('\n\n', start, end)
-            if para_break > start + chunk_size // 2:
-                end = para_break + 2
-            else:
-                # Look for sentence break
-                for punct in ['. ', '! ', '? ', '.\n']:
-                    sent_break = text.rfind(punct, start + chunk_size // 2, end)
-                    if sent_break > 0:
-                        end = sent_break + len(punct)
-                        break
+        # Try to break at the last paragraph boundary, else the last sentence
+        # boundary, in the second half of the window
+        if end < n:
+            for ends in (para_ends, sent_ends):
+                i = bisect_right(ends, end) - 1
+                if i >= 0 and ends[i] > start + half:
+                    end = ends[i]
+                    break
         
         chunk = text[start:end].strip()
         if chunk:
             chunks.append(chunk)
         
+        # The last window reached the end; stepping back by `overlap` would
+        # only emit a duplicate of its tail
+        if end >= n:
+            break
         start = end - overlap
     
     return chunks
 
 
-def semantic_chunk_text(text: str, embeddings: OpenAIEmbeddings) -> List[LangchainDocument]:
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.?!])\s+')
+
+# Semantic chunking: each sentence is embedded together with this many
+# neighbours on each side, and a chunk ends where the cosine distance to the
+# next window is above this percentile of all adjacent distances
+SEMANTIC_BUFFER_SIZE = 1
+SEMANTIC_BREAKPOINT_PERCENTILE = 95
+# Semantic chunks longer than this many tokens are cut into overlapping
+# CHUNK_TOKENS windows (token_windows)
+SEMANTIC_MAX_CHUNK_TOKENS = 2000
+
+# Documents shorter than this are split recursively at paragraph, line,
+# sentence and word boundaries; semantic boundaries are not worth one
+# embedding per sentence there. Sizes are in tokens.
+RECURSIVE_MAX_CHARS = 20_000
+CHUNK_TOKENS = 800
+CHUNK_OVERLAP_TOKENS = 200
+CHUNK_TOKEN_ENCODING = "cl100k_base"
+TOKEN_COUNT_CACHE_SIZE = 4096
+
+_RECURSIVE_SEPARATORS = ["\n\n", "\n", ". ", "? ", "! ", " ", ""]
+
+
+@lru_cache(maxsize=1)
+def _chunk_encoding():
+    import tiktoken
+    return tiktoken.get_encoding(CHUNK_TOKEN_ENCODING)
+
+
+@lru_cache(maxsize=TOKEN_COUNT_CACHE_SIZE)
+def count_tokens(text: str) -> int:
+    """
+    Token count of text in CHUNK_TOKEN_ENCODING.
+
+    Memoized: the recursive splitter measures each piece when splitting it
+    and again when merging pieces back into chunks. encode_ordinary skips
+    the special-token scan that encode(disallowed_special=()) still runs.
+    """
+    return len(_chunk_encoding().encode_ordinary(text))
+
+
+def count_tokens_batch(texts: List[str]) -> List[int]:
+    """
+    Token counts of many texts at once, e.g. every chunk of an upload.
+
+    The splitter's merged chunks are new strings count_tokens has not seen,
+    so they are encoded together with encode_ordinary_batch, which spreads
+    them over tiktoken's threads; repeated texts are encoded once.
     """
-    Semantic chunking using LangChain's SemanticChunker.
-    Creates chunks based on semantic similarity.
+    unique = list(dict.fromkeys(texts))
+    counts = {
+        text: len(ids)
+        for text, ids in zip(unique, _chunk_encoding().encode_ordinary_batch(unique))
+    }
+    return [counts[text] for text in texts]
+
+
+@lru_cache(maxsize=16)
+def _recursive_splitter(chunk_tokens: int, overlap_tokens: int):
+    from langchain_text_splitters import RecursiveCharacterTextSplitter
+    return RecursiveCharacterTextSplitter(
+        length_function=count_tokens,
+        chunk_size=chunk_tokens,
+        chunk_overlap=overlap_tokens,
+        separators=_RECURSIVE_SEPARATORS,
+    )
+
+
+def window_starts(n_tokens: int, window: int, stride: int):
+    """
+    Start offsets of windows of `window` tokens every `stride` tokens over
+    n_tokens, as one NumPy range; the last window is moved back to end
+    exactly at n_tokens so the tail is always covered.
+    """
+    import numpy as np
+
+    if n_tokens <= window:
+        return np.zeros(1, dtype=np.int64)
+    starts = np.arange(0, n_tokens - window + 1, stride, dtype=np.int64)
+    if starts[-1] + window < n_tokens:
+        starts = np.append(starts, n_tokens - window)
+    return starts
+
+
+def token_windows(
+    text: str,
+    window_tokens: int = CHUNK_TOKENS,
+    overlap_tokens: int = CHUNK_OVERLAP_TOKENS
+) -> List[str]:
+    """
+    Split text into overlapping fixed-size token windows.
+
+    The text is tokenized once; window offsets come from window_starts and
+    every window is decoded in one decode_batch call.
+    """
+    import numpy as np
+
+    encoding = _chunk_encoding()
+    tokens = np.asarray(encoding.encode_ordinary(text), dtype=np.int32)
+    starts = window_starts(len(tokens), window_tokens, window_tokens - overlap_tokens)
+    return encoding.decode_batch([tokens[s:s + window_tokens].tolist() for s in starts.tolist()])
+
+
+def chunk_text_recursive(
+    text: str,
+    chunk_tokens: int = CHUNK_TOKENS,
+    overlap_tokens: int = CHUNK_OVERLAP_TOKENS
+) -> List[str]:
+    """
+    Split at the coarsest natural boundary that keeps chunks within
+    chunk_tokens, with overlap_tokens of overlap between neighbours.
+
+    Needs no embeddings to place boundaries.
+    """
+    return _recursive_splitter(chunk_tokens, overlap_tokens).split_text(text)
+
+
+def chunk_text(
+    text: str,
+    embeddings: "OpenAIEmbeddings",
+    chunk_tokens: Optional[int] = None,
+    overlap_tokens: Optional[int] = None
+) -> List[str]:
+    """
+    Recursive chunks for short documents, semantic chunks otherwise.
+
+    Passing chunk_tokens and/or overlap_tokens always chunks recursively
+    with those sizes; the overlap defaults to a quarter of the chunk.
+    """
+    if chunk_tokens is not None or overlap_tokens is not None:
+        chunk_tokens = chunk_tokens or CHUNK_TOKENS
+        if overlap_tokens is None:
+            overlap_tokens = chunk_tokens // 4
+        return chunk_text_recursive(text, chunk_tokens, overlap_tokens)
+    if len(text) < RECURSIVE_MAX_CHARS:
+        return chunk_text_recursive(text)
+    return semantic_chunk_text(text, embeddings)
+
+
+def semantic_breakpoints(vectors) -> List[int]:
+    """
+    Indices i where a chunk should end after sentence i.
+
+    Rows are L2-normalized once and every adjacent cosine similarity comes
+    from a single einsum, instead of one Python-level dot product per pair.
+    """
+    import numpy as np
+
+    matrix = np.asarray(vectors, dtype=np.float32)
+    if len(matrix) < 2:
+        return []
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    matrix = matrix / np.maximum(norms, np.finfo(np.float32).tiny)
+    distances = 1.0 - np.einsum('ij,ij->i', matrix[:-1], matrix[1:])
+    threshold = np.percentile(distances, SEMANTIC_BREAKPOINT_PERCENTILE)
+    return np.flatnonzero(distances > threshold).tolist()
+
+
+def semantic_chunk_text(text: str, embeddings: "OpenAIEmbeddings") -> List[str]:
+    """
+    Semantic chunking: split where adjacent sentence windows diverge.
+
+    Same algorithm as LangChain's SemanticChunker (percentile breakpoints),
+    with the distance series computed in NumPy. Chunks over
+    SEMANTIC_MAX_CHUNK_TOKENS are cut into token windows, so none has to be
+    split again to fit the embedding model.
     """
     try:
-        text_splitter = SemanticChunker(embeddings)
-        chunks = text_splitter.create_documents([text])
+        sentences = _SENTENCE_SPLIT_RE.split(text)
+        if len(sentences) == 1:
+            return [text]
+
+        windows = [
+            " ".join(sentences[max(0, i - SEMANTIC_BUFFER_SIZE):i + SEMANTIC_BUFFER_SIZE + 1])
+            for i in range(len(sentences))
+        ]
+        breakpoints = semantic_breakpoints(embeddings.embed_documents(windows))
+
+        chunks = []
+        start = 0
+        for end in chain(breakpoints, [len(sentences) - 1]):
+            chunk = " ".join(sentences[start:end + 1])
+            if chunk:
+                if count_tokens(chunk) > SEMANTIC_MAX_CHUNK_TOKENS:
+                    chunks.extend(token_windows(chunk))
+                else:
+                    chunks.append(chunk)
+            start = end + 1
         return chunks
     except Exception as e:
         logger.warning(f"Semantic chunking failed, falling back to simple chunking: {e}")
-        simple_chunks = simple_chunk_text(text)
-        return [LangchainDocument(page_content=chunk) for chunk in simple_chunks]
+        return simple_chunk_text(text)
+
+
+_worker_embeddings: Optional["OpenAIEmbeddings"] = None
+
+
+def _worker_payload(content: Union[bytes, BinaryIO]) -> Union[bytes, str]:
+    """What to send a worker process for a file: its path when on disk, else its bytes."""
+    if isinstance(content, (bytes, bytearray)):
+        return content
+    path = _file_path(content)
+    if path is not None:
+        return path
+    content.seek(0)
+    data = content.read()
+    content.seek(0)
+    return data
+
+
+def _extract_and_chunk(filename: str, content: Union[bytes, str]) -> Tuple[int, List[str]]:
+    """
+    Extract and chunk one file inside a worker process.
+
+    content is the raw bytes, or the path of a file on disk.
+
+    Returns (text_length, chunk_texts); chunk_texts is empty when the file
+    has too little text to index. Each worker builds its own embeddings
+    client on first use, since clients do not survive pickling.
+    """
+    global _worker_embeddings
+    if isinstance(content, str):
+        with open(content, "rb") as f:
+            text_content = extract_text(filename, f)
+    else:
+        text_content = extract_text(filename, content)
+    if not text_content or len(text_content.strip()) < MIN_CHUNK_SIZE:
+        return len(text_content or ""), []
+
+    if len(text_content) < RECURSIVE_MAX_CHARS:
+        chunks = chunk_text_recursive(text_content)
+    else:
+        if _worker_embeddings is None:
+            from langchain_openai import OpenAIEmbeddings
+            _worker_embeddings = OpenAIEmbeddings(openai_api_key=OPENAI_API_KEY, model=EMBEDDING_MODEL)
+        chunks = semantic_chunk_text(text_content, _worker_embeddings)
+    return len(text_content), chunks
+
+
+_batch_index_pool: Optional[ProcessPoolExecutor] = None
+_batch_index_pool_lock = threading.Lock()
+
+
+def get_batch_index_pool() -> ProcessPoolExecutor:
+    """
+    The worker-process pool shared by every batch upload (created on first
+    use if start_batch_index_pool was not called at startup).
+
+    Workers are spawned, not forked: forking the threaded server would copy
+    locks held by its other threads (audit writer, HTTP clients) into the
+    children, where nothing could ever release them.
+    """
+    global _batch_index_pool
+    with _batch_index_pool_lock:
+        if _batch_index_pool is None:
+            _batch_index_pool = ProcessPoolExecutor(
+                max_workers=BATCH_INDEX_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _batch_index_pool
+
+
+def start_batch_index_pool() -> None:
+    """Create the batch indexing pool up front (at startup)."""
+    get_batch_index_pool()
+
+
+def close_batch_index_pool(pool: Optional[ProcessPoolExecutor] = None) -> None:
+    """
+    Shut down the batch indexing pool (at shutdown), or only the given
+    pool if it is still the current one, e.g. after it broke.
+    """
+    global _batch_index_pool
+    with _batch_index_pool_lock:
+        if _batch_index_pool is None or (pool is not None and pool is not _batch_index_pool):
+            return
+        pool, _batch_index_pool = _batch_index_pool, None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def chunk_metadata(base_meta: Dict, total_chunks: int, indexed_at: Optional[str] = None) -> Dict:
+    """
+    Pinecone metadata shared by every chunk of one document.
+
+    Adds total_chunks and indexed_at to the per-document fields; pass
+    indexed_at to share one UTC timestamp across several documents.
+    iter_upsert_chunks fills in chunk_index and text per vector.
+    """
+    return {
+        **base_meta,
+        "total_chunks": total_chunks,
+        "indexed_at": indexed_at or datetime.now(timezone.utc).isoformat(),
+    }
+
+
+# =============================================================================
+# Document Records
+# =============================================================================
+
+def persist_document_record(
+    doc_id: str,
+    practice_id: str,
+    title: str,
+    source_type: str,
+    source_uri: str,
+    chunk_count: int,
+    subagents_allowed: List[str],
+    content_hash: Optional[str] = None,
+    status: str = "indexed"
+) -> bool:
+    """
+    Insert the documents row for a freshly indexed document (or, with
+    status="pending", one awaiting batch embeddings).
+
+    Safe to run as a FastAPI background task: failures are logged, and the
+    session is rolled back and returned to the pool on every path. Returns
+    whether the row was saved, for callers that must not go on without it.
+    """
+    try:
+        with SessionLocal() as db, db.begin():
+            db.add(DBDocument(
+                doc_id=uuid.UUID(doc_id),
+                client_id=uuid.UUID(practice_id),
+                title=title,
+                source_type=source_type,
+                source_uri=source_uri,
+                status=status,
+                chunk_count=chunk_count,
+                subagents_allowed=subagents_allowed,
+                content_hash=content_hash,
+                last_indexed_at=datetime.utcnow() if status == "indexed" else None
+            ))
+        logger.info(f"Document record saved to database: {doc_id}")
+        return True
+    except Exception as db_error:
+        logger.error(f"Failed to save document to database: {db_error}")
+        return False
+
+
+def _embedding_batch_due(now: datetime):
+    """
+    SQL condition for documents whose embedding batch should be checked at
+    now: pending ones past their retry backoff, and claims abandoned by a
+    worker that died.
+    """
+    retry_delay = func.least(
+        EMBED_BATCH_POLL_SECONDS * func.power(2, DBDocument.batch_attempts),
+        EMBED_BATCH_RETRY_MAX_SECONDS,
+    )
+    return and_(
+        DBDocument.batch_job_id.isnot(None),
+        or_(
+            and_(
+                DBDocument.status == "pending",
+                or_(
+                    DBDocument.batch_attempts == 0,
+                    DBDocument.updated_at + func.make_interval(0, 0, 0, 0, 0, 0, retry_delay) <= now,
+                ),
+            ),
+            and_(
+                DBDocument.status == "processing",
+                DBDocument.updated_at <= now - timedelta(seconds=EMBED_BATCH_CLAIM_SECONDS),
+            ),
+        ),
+    )
+
+
+# =============================================================================
+# Embedding Cache Encoding
+# =============================================================================
+
+def _int8_levels(vector: List[float]):
+    """Symmetric per-vector int8 quantization: (int8 array, scale)."""
+    import numpy as np
+
+    values = np.asarray(vector, dtype=np.float32)
+    scale = float(np.max(np.abs(values))) / 127 or 1.0
+    return np.round(values / scale).astype(np.int8), scale
+
+
+def quantize_vector(vector: List[float]) -> Tuple[bytes, float]:
+    """
+    Symmetric per-vector int8 quantization: (int8 bytes, scale).
+
+    A 1536-dim embedding packs into 1.5 KiB instead of 6 KiB of float32.
+    """
+    levels, scale = _int8_levels(vector)
+    return levels.tobytes(), scale
+
+
+def int8_upsert_values(vector: List[float]) -> Tuple[List[float], float]:
+    """
+    The vector's int8 levels as whole-number floats, plus its scale.
+
+    Cosine similarity ignores the scale, so a cosine index ranks these like
+    the original vector; levels * scale recovers it. Whole numbers serialize
+    to far shorter JSON than full-precision floats.
+    """
+    levels, scale = _int8_levels(vector)
+    return levels.astype(float).tolist(), scale
+
+
+def dequantize_vector(data: bytes, scale: Optional[float]) -> List[float]:
+    """Unpack a cached vector; rows without a scale hold raw float32."""
+    import numpy as np
+
+    if scale is None:
+        return np.frombuffer(data, dtype='<f4').tolist()
+    return (np.frombuffer(data, dtype=np.int8).astype(np.float32) * scale).tolist()
+
+
+# =============================================================================
+# Server-Sent Events
+# =============================================================================
+
+def sse_event(event: Dict) -> bytes:
+    """Encode one progress event as an SSE "data:" frame."""
+    return b"data: " + orjson.dumps(event) + b"\n\n"
+
+
+def coalesce_progress(events, min_interval: float = PROGRESS_MIN_INTERVAL_SECONDS):
+    """
+    Pass through progress events, dropping ticks within a stage that move
+    less than one percent in under min_interval seconds.
+
+    Stage changes, results and errors always go through, so clients only
+    lose intermediate per-batch ticks (e.g. one per upsert batch).
+    """
+    last_stage = None
+    last_percent = -1
+    last_time = 0.0
+    for event in events:
+        now = time.monotonic()
+        if (
+            event["stage"] == last_stage
+            and "result" not in event
+            and not event.get("error")
+            and event["percent"] - last_percent < 1
+            and now - last_time < min_interval
+        ):
+            continue
+        last_stage, last_percent, last_time = event["stage"], event["percent"], now
+        yield event
 
 
 # =============================================================================
 # Indexing Service
 # =============================================================================
 
+def _upsert_vector(vector_id: str, values: List[float], metadata: Dict) -> Tuple[str, List[float], Dict]:
+    """One upsert entry; int8 levels plus metadata["vector_scale"] when PINECONE_INT8_VECTORS is set."""
+    if PINECONE_INT8_VECTORS:
+        values, metadata["vector_scale"] = int8_upsert_values(values)
+    return vector_id, values, metadata
+
+
+def _wait_upsert(request) -> None:
+    """Block on an async upsert: gRPC returns a future, REST an ApplyResult."""
+    if hasattr(request, "result"):
+        request.result()
+    else:
+        request.get()
+
+
 class IndexingService:
     """Service for indexing documents into Pinecone."""
     
@@ -222,35 +852,359 @@ class IndexingService:
             raise ValueError("PINECONE_INDEX_NAME environment variable is not set")
         
         logger.info(f"Initializing IndexingService with index: {PINECONE_INDEX_NAME}")
-        logger.info(f"Using embedding model: text-embedding-3-small")
-        
+        self.model_name = EMBEDDING_MODEL
+        logger.info(f"Using embedding model: {self.model_name}")
+
+        from langchain_openai import OpenAIEmbeddings
+        import pinecone
+
+        # One keep-alive pool shared by both OpenAI clients, sized for the
+        # concurrent embedding requests, so TLS handshakes are paid once
+        self.http_client = httpx.Client(
+            http2=OPENAI_HTTP2,
+            limits=httpx.Limits(
+                max_connections=OPENAI_MAX_CONNECTIONS,
+                max_keepalive_connections=EMBED_MAX_CONCURRENCY,
+            ),
+        )
         self.embeddings = OpenAIEmbeddings(
             openai_api_key=OPENAI_API_KEY,
-            model="text-embedding-3-small"
+            model=self.model_name,
+            http_client=self.http_client,
         )
+        # Direct client for batched embedding requests (see _embed_texts)
+        from openai import OpenAI
+        self.openai_client = OpenAI(api_key=OPENAI_API_KEY, http_client=self.http_client)
         self.index_name = PINECONE_INDEX_NAME
         self.pc = pinecone.Pinecone(api_key=PINECONE_API_KEY)
+        # Resolved once; Index() looks up the index host on every call
+        self.index = self.pc.Index(self.index_name, pool_threads=UPSERT_POOL_THREADS)
+
+
+        # Upserts go over gRPC (one multiplexed HTTP/2 channel) when the
+        # pinecone[grpc] extra is installed, otherwise over the REST thread pool
+        try:
+            from pinecone.grpc import PineconeGRPC
+            self.upsert_index = PineconeGRPC(api_key=PINECONE_API_KEY).Index(self.index_name)
+            logger.info("Using Pinecone gRPC client for upserts")
+        except ImportError:
+            self.upsert_index = self.index
     
-    def compute_content_hash(self, content: str) -> str:
-        """Compute hash of content for change detection."""
-        return hashlib.sha256(content.encode('utf-8')).hexdigest()[:16]
-    
+    def close(self) -> None:
+        """Close the pooled HTTP connections shared by the OpenAI clients."""
+        self.http_client.close()
+
+    def _embed_batch(self, batch: List[str]) -> List[List[float]]:
+        """One embeddings request; results are returned in input order."""
+        response = self.openai_client.embeddings.create(model=self.model_name, input=batch)
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+    def _embed_batch_jittered(self, batch: List[str]) -> List[List[float]]:
+        """_embed_batch after a short random delay, for concurrent requests."""
+        time.sleep(random.uniform(0, EMBED_REQUEST_JITTER_SECONDS))
+        return self._embed_batch(batch)
+
+    def _embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed texts in large requests issued concurrently.
+
+        Texts are packed greedily into requests of up to EMBED_BATCH_SIZE
+        inputs and EMBED_BATCH_MAX_TOKENS tokens, and up to EMBED_MAX_CONCURRENCY
+        requests run at once, each started after up to
+        EMBED_REQUEST_JITTER_SECONDS of jitter. Oversized texts go through the
+        LangChain wrapper, which splits them to fit the model's context window.
+        """
+        vectors: List[Optional[List[float]]] = [None] * len(texts)
+        token_counts = count_tokens_batch(texts)
+
+        oversized = [i for i, tokens in enumerate(token_counts) if tokens > EMBED_MAX_INPUT_TOKENS]
+        if oversized:
+            for i, vector in zip(oversized, self.embeddings.embed_documents([texts[i] for i in oversized])):
+                vectors[i] = vector
+
+        batches: List[List[int]] = []
+        batch_tokens = 0
+        for i, tokens in enumerate(token_counts):
+            if vectors[i] is not None:
+                continue
+            if not batches or len(batches[-1]) >= EMBED_BATCH_SIZE or batch_tokens + tokens > EMBED_BATCH_MAX_TOKENS:
+                batches.append([])
+                batch_tokens = 0
+            batches[-1].append(i)
+            batch_tokens += tokens
+
+        if batches:
+            inputs = [[texts[i] for i in batch] for batch in batches]
+            if len(inputs) == 1:
+                results = [self._embed_batch(inputs[0])]
+            else:
+                with ThreadPoolExecutor(max_workers=min(EMBED_MAX_CONCURRENCY, len(inputs))) as executor:
+                    results = list(executor.map(self._embed_batch_jittered, inputs))
+            for batch, batch_vectors in zip(batches, results):
+                for i, vector in zip(batch, batch_vectors):
+                    vectors[i] = vector
+
+        return vectors
+
+    def _embed_chunks_with_cache(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed texts, reusing vectors from embedding_cache where possible.
+
+        Identical chunks (repeated headers, footers, boilerplate) are hashed,
+        looked up and embedded once and the vector is shared by every copy.
+        All hashes are looked up in one query, only the misses are embedded,
+        and new vectors are written back int8-quantized (quantize_vector) with
+        ON CONFLICT DO NOTHING. Cache failures are logged and fall back to
+        embedding everything.
+        """
+        unique_texts = list(dict.fromkeys(texts))
+        hashes = {text: self.compute_content_hash(text) for text in unique_texts}
+        cached: Dict[str, Tuple[bytes, Optional[float]]] = {}
+
+        # The lookup session is closed before the OpenAI round-trip so no
+        # pooled connection sits idle in a transaction while we wait
+        db = SessionLocal()
+        try:
+            rows = db.execute(
+                select(EmbeddingCache.hash, EmbeddingCache.vector, EmbeddingCache.scale).where(
+                    EmbeddingCache.model == self.model_name,
+                    EmbeddingCache.hash.in_(list(hashes.values())),
+                )
+            )
+            cached = {row.hash: (row.vector, row.scale) for row in rows}
+        except SQLAlchemyError as e:
+            logger.warning(f"Embedding cache lookup failed, embedding all chunks: {e}")
+        finally:
+            db.close()
+
+        missing = [text for text in unique_texts if hashes[text] not in cached]
+
+        vectors: Dict[str, List[float]] = {}
+        if missing:
+            vectors.update(zip(missing, self._embed_texts(missing)))
+            rows = []
+            for text in missing:
+                data, scale = quantize_vector(vectors[text])
+                rows.append({"hash": hashes[text], "model": self.model_name, "vector": data, "scale": scale})
+            db = SessionLocal()
+            try:
+                db.execute(
+                    pg_insert(EmbeddingCache).on_conflict_do_nothing(index_elements=['hash', 'model']),
+                    rows,
+                )
+                db.commit()
+            except SQLAlchemyError as e:
+                db.rollback()
+                logger.warning(f"Failed to write embedding cache: {e}")
+            finally:
+                db.close()
+
+        for text in unique_texts:
+            if text not in vectors:
+                vectors[text] = dequantize_vector(*cached[hashes[text]])
+
+        logger.info(
+            f"Embedding {len(texts)} chunks: {len(texts) - len(unique_texts)} duplicates, "
+            f"{len(unique_texts) - len(missing)} cache hits, {len(missing)} embedded"
+        )
+        return [vectors[text] for text in texts]
+
+    def _iter_embeddings(self, texts: List[str]):
+        """
+        Yield the vectors of texts in order, embedding EMBED_PIPELINE_CHUNKS
+        at a time (via _embed_chunks_with_cache) one group ahead of the
+        consumer, so embedding overlaps with whatever is done with the
+        previous group's vectors.
+        """
+        groups = [texts[i:i + EMBED_PIPELINE_CHUNKS] for i in range(0, len(texts), EMBED_PIPELINE_CHUNKS)]
+        if len(groups) <= 1:
+            yield from self._embed_chunks_with_cache(texts)
+            return
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(self._embed_chunks_with_cache, groups[0])
+            for group in groups[1:]:
+                vectors = future.result()
+                future = executor.submit(self._embed_chunks_with_cache, group)
+                yield from vectors
+            yield from future.result()
+
+    def iter_upsert_chunks(
+        self,
+        documents: List[Tuple[Dict, List[str]]],
+        practice_id: str,
+        embeddings: Optional[List[List[float]]] = None
+    ):
+        """
+        Embed chunks and upsert them into the practice namespace, yielding
+        (batches_done, total_batches) as each batch is acknowledged.
+
+        documents holds one (metadata, chunk_texts) pair per document, the
+        metadata coming from chunk_metadata. Vector ids are
+        "{doc_id}-{chunk_index}", so several documents can go through in one
+        call. Vectors are sent in batches of UPSERT_BATCH_SIZE with up to
+        UPSERT_MAX_INFLIGHT requests outstanding. The chunk text is stored in
+        metadata["text"], which is where rag_engine reads it from. Chunks
+        are embedded here unless their vectors are passed as embeddings, in
+        the same order; large documents are embedded group by group
+        (_iter_embeddings) while earlier groups are being upserted.
+        """
+        if embeddings is None:
+            embeddings = self._iter_embeddings([text for _, texts in documents for text in texts])
+        values = iter(embeddings)
+
+        # (id, values, metadata) tuples, built a batch at a time as the
+        # batches are sent
+        vectors = (
+            _upsert_vector(f"{meta['doc_id']}-{i}", next(values), {**meta, "chunk_index": i, "text": text})
+            for meta, texts in documents
+            for i, text in enumerate(texts)
+        )
+
+        total_batches = -(-sum(len(texts) for _, texts in documents) // UPSERT_BATCH_SIZE)
+        done = 0
+        pending = deque()
+        try:
+            while batch := list(islice(vectors, UPSERT_BATCH_SIZE)):
+                if len(pending) >= UPSERT_MAX_INFLIGHT:
+                    _wait_upsert(pending.popleft())
+                    done += 1
+                    yield done, total_batches
+                pending.append(self.upsert_index.upsert(
+                    vectors=batch,
+                    namespace=practice_id,
+                    async_req=True,
+                ))
+            while pending:
+                _wait_upsert(pending.popleft())
+                done += 1
+                yield done, total_batches
+        except GeneratorExit:
+            # Closed early: let in-flight upserts land before returning, so
+            # a caller deleting the partial document does not race them
+            for request in pending:
+                _wait_upsert(request)
+            raise
+
+        invalidate_index_stats()
+
+    def upsert_chunks(
+        self,
+        documents: List[Tuple[Dict, List[str]]],
+        practice_id: str,
+        embeddings: Optional[List[List[float]]] = None
+    ) -> int:
+        """
+        Embed (unless embeddings are given) and upsert the chunks of one or
+        more documents, blocking until every batch is acknowledged.
+
+        Returns:
+            Number of vectors upserted
+        """
+        for _ in self.iter_upsert_chunks(documents, practice_id, embeddings):
+            pass
+        return sum(len(texts) for _, texts in documents)
+
+    def compute_content_hash(self, content: Union[str, bytes, BinaryIO]) -> str:
+        """
+        Compute the SHA-256 hex digest of content for change detection.
+
+        Stored content_hash values are compared across hosts and deploys, so
+        the algorithm is fixed rather than chosen by which hash packages
+        happen to be installed. Bytes are hashed in place; text is encoded
+        and fed to the hasher in HASH_TEXT_SLICE_CHARS slices, so a multi-MB
+        document is never copied whole into a UTF-8 buffer. Files on disk are
+        hashed through an mmap, other file objects in blocks; either way the
+        stream is left at position 0.
+        """
+        path = None
+        size = 0
+        if not isinstance(content, (str, bytes, bytearray, memoryview)):
+            path = _file_path(content)
+            content.seek(0, os.SEEK_END)
+            size = content.tell()
+            content.seek(0)
+
+        hasher = hashlib.sha256()
+        if isinstance(content, str):
+            for i in range(0, len(content), HASH_TEXT_SLICE_CHARS):
+                hasher.update(content[i:i + HASH_TEXT_SLICE_CHARS].encode('utf-8'))
+        elif isinstance(content, (bytes, bytearray, memoryview)):
+            hasher.update(memoryview(content))
+        elif path is not None and size:
+            with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                hasher.update(mm)
+        else:
+            for block in iter(lambda: content.read(HASH_READ_BLOCK_BYTES), b""):
+                hasher.update(block)
+            content.seek(0)
+        return hasher.hexdigest()
+
+    def find_indexed_duplicates(self, practice_id: str, content_hashes: List[str]) -> Dict[str, Dict]:
+        """
+        Already indexed documents of this practice whose content hash is in
+        content_hashes, as {hash: result dict (with "duplicate": True)}.
+
+        Lets an unchanged re-upload skip extraction, chunking and embedding.
+        Lookup failures are logged and treated as "no duplicates".
+        """
+        if not content_hashes:
+            return {}
+        try:
+            with SessionLocal() as db:
+                rows = db.execute(
+                    select(DBDocument.content_hash, DBDocument.doc_id, DBDocument.title, DBDocument.chunk_count).where(
+                        DBDocument.client_id == uuid.UUID(practice_id),
+                        DBDocument.status == "indexed",
+                        DBDocument.content_hash.in_(set(content_hashes)),
+                    )
+                ).all()
+        except SQLAlchemyError as e:
+            logger.warning(f"Duplicate lookup failed, indexing anyway: {e}")
+            return {}
+
+        duplicates = {}
+        for row in rows:
+            if row.content_hash in duplicates:
+                continue
+            logger.info(f"Content {row.content_hash} already indexed as {row.doc_id}; skipping")
+            duplicates[row.content_hash] = {
+                "status": "success",
+                "message": f"'{row.title}' is already indexed with the same content ({row.chunk_count} chunks)",
+                "doc_id": str(row.doc_id),
+                "title": row.title,
+                "chunk_count": row.chunk_count,
+                "content_hash": row.content_hash,
+                "duplicate": True,
+            }
+        return duplicates
+
+    def find_indexed_duplicate(self, practice_id: str, content_hash: str) -> Optional[Dict]:
+        """
+        An already indexed document of this practice with the same content
+        hash, as a result dict (with "duplicate": True), or None.
+        """
+        return self.find_indexed_duplicates(practice_id, [content_hash]).get(content_hash)
+
     def process_and_index_file_with_progress(
         self,
         practice_id: str,
         filename: str,
-        file_content: bytes,
+        file_content: Union[bytes, BinaryIO],
         title: Optional[str] = None,
         source_type: str = "pdf",
-        subagents_allowed: List[str] = None
+        subagents_allowed: List[str] = None,
+        chunk_tokens: Optional[int] = None,
+        overlap_tokens: Optional[int] = None
     ):
         """
         Generator that yields progress updates during indexing.
         
+        chunk_tokens / overlap_tokens override the chunk sizing (see chunk_text).
+        
         Yields:
             Dict with progress info: {"stage": str, "percent": int, "message": str}
         """
-        doc_id = str(uuid.uuid4())
+        doc_id = str(uuid7())
         title = title or os.path.splitext(filename)[0]
         subagents_allowed = subagents_allowed or ["chat", "clinical"]
         
@@ -258,20 +1212,29 @@ class IndexingService:
         
         try:
             # Step 1: Extract text (5-20%)
+            content_hash = self.compute_content_hash(file_content)
+            
+            # Unchanged re-upload with default chunking: nothing to redo
+            duplicate = None
+            if chunk_tokens is None and overlap_tokens is None:
+                duplicate = self.find_indexed_duplicate(practice_id, content_hash)
+            if duplicate:
+                yield {"stage": "complete", "percent": 100, "message": duplicate["message"], "result": duplicate}
+                return
+            
             text_content = extract_text(filename, file_content)
             
             if not text_content or len(text_content.strip()) < MIN_CHUNK_SIZE:
                 yield {"stage": "error", "percent": 0, "message": "File contains insufficient text content", "error": True}
                 return
             
-            content_hash = self.compute_content_hash(text_content)
             char_count = len(text_content)
             yield {"stage": "extracted", "percent": 20, "message": f"Extracted {char_count:,} characters"}
             
             # Step 2: Chunk the text (20-50%)
-            yield {"stage": "chunking", "percent": 25, "message": "Splitting text into semantic chunks..."}
+            yield {"stage": "chunking", "percent": 25, "message": "Splitting text into chunks..."}
             
-            chunks = semantic_chunk_text(text_content, self.embeddings)
+            chunks = chunk_text(text_content, self.embeddings, chunk_tokens, overlap_tokens)
             
             if not chunks:
                 yield {"stage": "error", "percent": 0, "message": "Failed to create chunks from content", "error": True}
@@ -283,30 +1246,37 @@ class IndexingService:
             # Step 3: Add metadata to chunks (50-60%)
             yield {"stage": "metadata", "percent": 55, "message": "Adding metadata to chunks..."}
             
-            for i, chunk in enumerate(chunks):
-                chunk.metadata = {
-                    "doc_id": doc_id,
-                    "practice_id": practice_id,
-                    "source": filename,
-                    "title": title,
-                    "source_type": source_type,
-                    "chunk_index": i,
-                    "total_chunks": chunk_count,
-                    "subagents_allowed": ",".join(subagents_allowed),
-                    "indexed_at": datetime.utcnow().isoformat()
-                }
+            meta = chunk_metadata({
+                "doc_id": doc_id,
+                "practice_id": practice_id,
+                "source": filename,
+                "title": title,
+                "source_type": source_type,
+                "subagents_allowed": ",".join(subagents_allowed),
+            }, chunk_count)
             
             yield {"stage": "uploading", "percent": 60, "message": f"Uploading {chunk_count} chunks to Pinecone..."}
             
-            # Step 4: Upload to Pinecone (60-95%)
-            LangchainPinecone.from_documents(
-                documents=chunks,
-                embedding=self.embeddings,
-                index_name=self.index_name,
-                namespace=practice_id
-            )
-            
-            yield {"stage": "uploaded", "percent": 95, "message": "Vectors uploaded to Pinecone"}
+            # Step 4: Upload to Pinecone (60-95%). A consumer that closes the
+            # generator from here on (e.g. the SSE client went away) never
+            # gets the result, so the vectors sent so far are removed again
+            try:
+                for done, total_batches in self.iter_upsert_chunks([(meta, chunks)], practice_id):
+                    yield {
+                        "stage": "uploading",
+                        "percent": 60 + int(35 * done / total_batches),
+                        "message": f"Uploaded batch {done}/{total_batches}"
+                    }
+                
+                yield {"stage": "uploaded", "percent": 95, "message": "Vectors uploaded to Pinecone"}
+            except GeneratorExit:
+                logger.info(f"Indexing of {filename} abandoned; removing partial vectors of {doc_id}")
+                try:
+                    self._delete_vectors(practice_id, doc_id, chunk_count)
+                    invalidate_index_stats()
+                except Exception as e:
+                    logger.error(f"Failed to remove partial vectors of {doc_id}: {e}")
+                raise
             
             # Done!
             yield {
@@ -329,14 +1299,25 @@ class IndexingService:
             logger.error(f"Error indexing file: {e}")
             yield {"stage": "error", "percent": 0, "message": f"Indexing failed: {str(e)}", "error": True}
     
+    def process_and_index_file_sse(self, *args, **kwargs):
+        """
+        Same as process_and_index_file_with_progress, but yields each event
+        already encoded as SSE bytes for a StreamingResponse.
+        """
+        for event in coalesce_progress(self.process_and_index_file_with_progress(*args, **kwargs)):
+            yield sse_event(event)
+
     def process_and_index_file(
         self,
         practice_id: str,
         filename: str,
-        file_content: bytes,
+        file_content: Union[bytes, BinaryIO],
         title: Optional[str] = None,
         source_type: str = "pdf",
-        subagents_allowed: List[str] = None
+        subagents_allowed: List[str] = None,
+        persist: bool = True,
+        chunk_tokens: Optional[int] = None,
+        overlap_tokens: Optional[int] = None
     ) -> Dict:
         """
         Process a file and index it into Pinecone.
@@ -344,15 +1325,19 @@ class IndexingService:
         Args:
             practice_id: The practice/client ID (used as Pinecone namespace)
             filename: Original filename
-            file_content: Raw file content as bytes
+            file_content: Raw file content as bytes, or an open binary file
+                (e.g. the upload spooled to a temp file)
             title: Document title (defaults to filename)
             source_type: Type of source (pdf, doc, etc.)
             subagents_allowed: Which agents can use this doc
+            persist: Save the documents row before returning
+            chunk_tokens: Chunk size in tokens (recursive chunking; see chunk_text)
+            overlap_tokens: Overlap between chunks in tokens
             
         Returns:
             Dict with indexing results
         """
-        doc_id = str(uuid.uuid4())
+        doc_id = str(uuid7())
         title = title or os.path.splitext(filename)[0]
         subagents_allowed = subagents_allowed or ["chat", "clinical"]
         
@@ -360,6 +1345,14 @@ class IndexingService:
         
         try:
             # Step 1: Extract text
+            content_hash = self.compute_content_hash(file_content)
+            
+            # Unchanged re-upload with default chunking: nothing to redo
+            if chunk_tokens is None and overlap_tokens is None:
+                duplicate = self.find_indexed_duplicate(practice_id, content_hash)
+                if duplicate:
+                    return duplicate
+            
             logger.info(f"Extracting text from {filename}...")
             text_content = extract_text(filename, file_content)
             
@@ -370,12 +1363,11 @@ class IndexingService:
                     "doc_id": doc_id
                 }
             
-            content_hash = self.compute_content_hash(text_content)
             logger.info(f"Extracted {len(text_content)} characters, hash: {content_hash}")
             
             # Step 2: Chunk the text
-            logger.info("Chunking text semantically...")
-            chunks = semantic_chunk_text(text_content, self.embeddings)
+            logger.info("Chunking text...")
+            chunks = chunk_text(text_content, self.embeddings, chunk_tokens, overlap_tokens)
             
             if not chunks:
                 return {
@@ -387,51 +1379,35 @@ class IndexingService:
             logger.info(f"Created {len(chunks)} chunks")
             
             # Step 3: Add metadata to chunks
-            for i, chunk in enumerate(chunks):
-                chunk.metadata = {
-                    "doc_id": doc_id,
-                    "practice_id": practice_id,
-                    "source": filename,
-                    "title": title,
-                    "source_type": source_type,
-                    "chunk_index": i,
-                    "total_chunks": len(chunks),
-                    "subagents_allowed": ",".join(subagents_allowed),
-                    "indexed_at": datetime.utcnow().isoformat()
-                }
+            meta = chunk_metadata({
+                "doc_id": doc_id,
+                "practice_id": practice_id,
+                "source": filename,
+                "title": title,
+                "source_type": source_type,
+                "subagents_allowed": ",".join(subagents_allowed),
+            }, len(chunks))
             
             # Step 4: Upload to Pinecone
             logger.info(f"Uploading {len(chunks)} chunks to Pinecone namespace: {practice_id}")
             
-            LangchainPinecone.from_documents(
-                documents=chunks,
-                embedding=self.embeddings,
-                index_name=self.index_name,
-                namespace=practice_id
-            )
+            self.upsert_chunks([(meta, chunks)], practice_id)
             
             logger.info(f"Successfully indexed document: {title}")
 
-            # Persist document record to database
-            try:
-                db = SessionLocal()
-                db_doc = DBDocument(
-                    doc_id=uuid.UUID(doc_id),
-                    client_id=uuid.UUID(practice_id),
+            # Persist document record to database (callers that pass
+            # persist=False schedule persist_document_record themselves)
+            if persist:
+                persist_document_record(
+                    doc_id=doc_id,
+                    practice_id=practice_id,
                     title=title,
                     source_type=source_type,
                     source_uri=filename,
-                    status="indexed",
                     chunk_count=len(chunks),
                     subagents_allowed=subagents_allowed,
-                    last_indexed_at=datetime.utcnow()
+                    content_hash=content_hash,
                 )
-                db.add(db_doc)
-                db.commit()
-                db.close()
-                logger.info(f"Document record saved to database: {doc_id}")
-            except Exception as db_error:
-                logger.error(f"Failed to save document to database: {db_error}")
 
             return {
                 "status": "success",
@@ -458,7 +1434,190 @@ class IndexingService:
                 "message": f"Indexing failed: {str(e)}",
                 "doc_id": doc_id
             }
+
+    def process_and_index_path(
+        self,
+        practice_id: str,
+        path: str,
+        filename: Optional[str] = None,
+        **kwargs
+    ) -> Dict:
+        """
+        Index a file already on disk; see process_and_index_file.
+
+        The open file keeps its path, so hashing mmaps it and PDF extraction
+        reopens it by path rather than copying bytes. filename defaults to
+        the path's basename.
+        """
+        with open(path, "rb") as f:
+            return self.process_and_index_file(
+                practice_id=practice_id,
+                filename=filename or os.path.basename(path),
+                file_content=f,
+                **kwargs
+            )
     
+    def batch_index_files(
+        self,
+        practice_id: str,
+        files: List[Tuple[str, Union[bytes, BinaryIO]]],
+        source_type: Optional[str] = None,
+        subagents_allowed: List[str] = None,
+        persist: bool = True
+    ) -> List[Dict]:
+        """
+        Index several uploaded files in one pass.
+
+        Extraction and chunking fan out across the shared process pool (one
+        file per task, see get_batch_index_pool); the chunks of every file
+        are then embedded and upserted together, so small files share
+        embedding requests and upsert batches. Files are handed to the pool
+        at most BATCH_SUBMIT_AHEAD per worker ahead of the one being
+        collected, so only those are held in memory. A file whose content
+        repeats an earlier file of the batch is indexed once.
+
+        Args:
+            practice_id: The practice/client ID (used as Pinecone namespace)
+            files: (filename, raw bytes or open binary file) pairs
+            source_type: Type of source; defaults to each file's extension
+            subagents_allowed: Which agents can use these docs
+            persist: Save the documents rows before returning
+
+        Returns:
+            One result dict per file, in input order
+        """
+        subagents_allowed = subagents_allowed or ["chat", "clinical"]
+        results: List[Dict] = []
+        indexed: List[Dict] = []
+        documents: List[Tuple[Dict, List[str]]] = []
+
+        logger.info(f"Batch processing {len(files)} files for practice: {practice_id}")
+
+        # Files already indexed with identical content skip the pipeline, and
+        # so do later copies of a file that appears twice in this batch
+        content_hashes = [self.compute_content_hash(content) for _, content in files]
+        duplicates = self.find_indexed_duplicates(practice_id, content_hashes)
+        first_seen: Dict[str, int] = {}
+        for i, content_hash in enumerate(content_hashes):
+            if content_hash not in duplicates:
+                first_seen.setdefault(content_hash, i)
+        pending = sorted(first_seen.values())
+        repeats: List[Tuple[Dict, int]] = []
+
+        workers = max(1, min(BATCH_INDEX_WORKERS, len(pending)))
+        pool = get_batch_index_pool()
+        futures = {}
+        to_submit = iter(pending)
+
+        def submit_ahead():
+            while len(futures) < workers * BATCH_SUBMIT_AHEAD:
+                j = next(to_submit, None)
+                if j is None:
+                    return
+                filename, content = files[j]
+                futures[j] = pool.submit(_extract_and_chunk, filename, _worker_payload(content))
+
+        indexed_at = datetime.now(timezone.utc).isoformat()
+        broken = False
+        try:
+            for i, (filename, content) in enumerate(files):
+                duplicate = duplicates.get(content_hashes[i])
+                if duplicate:
+                    results.append({**duplicate, "filename": filename})
+                    continue
+                if first_seen[content_hashes[i]] != i:
+                    # Filled in from the first copy's final result below
+                    repeat = {"filename": filename}
+                    results.append(repeat)
+                    repeats.append((repeat, first_seen[content_hashes[i]]))
+                    continue
+
+                doc_id = str(uuid7())
+                try:
+                    submit_ahead()
+                    text_length, chunk_texts = futures.pop(i).result()
+                except Exception as e:
+                    broken = broken or isinstance(e, BrokenProcessPool)
+                    logger.error(f"Error processing {filename}: {e}")
+                    results.append({
+                        "status": "error",
+                        "message": f"Indexing failed: {str(e)}",
+                        "doc_id": doc_id,
+                        "filename": filename
+                    })
+                    continue
+
+                if not chunk_texts:
+                    results.append({
+                        "status": "error",
+                        "message": "File contains insufficient text content",
+                        "doc_id": doc_id,
+                        "filename": filename
+                    })
+                    continue
+
+                title = os.path.splitext(filename)[0]
+                documents.append((chunk_metadata({
+                    "doc_id": doc_id,
+                    "practice_id": practice_id,
+                    "source": filename,
+                    "title": title,
+                    "source_type": source_type or os.path.splitext(filename)[1].lower().lstrip("."),
+                    "subagents_allowed": ",".join(subagents_allowed),
+                }, len(chunk_texts), indexed_at), chunk_texts))
+
+                result = {
+                    "status": "success",
+                    "message": f"Successfully indexed '{title}' with {len(chunk_texts)} chunks",
+                    "doc_id": doc_id,
+                    "filename": filename,
+                    "title": title,
+                    "chunk_count": len(chunk_texts),
+                    "content_hash": content_hashes[i],
+                    "text_length": text_length,
+                }
+                results.append(result)
+                indexed.append(result)
+        finally:
+            for future in futures.values():
+                future.cancel()
+            if broken:
+                # A worker died; later batches get a fresh pool
+                close_batch_index_pool(pool)
+
+        if documents:
+            logger.info(f"Uploading {sum(len(texts) for _, texts in documents)} chunks from {len(indexed)} files to Pinecone namespace: {practice_id}")
+            try:
+                self.upsert_chunks(documents, practice_id)
+            except Exception as e:
+                logger.error(f"Error indexing batch: {e}")
+                for result in indexed:
+                    result.update(status="error", message=f"Indexing failed: {str(e)}")
+            else:
+                if persist:
+                    for result in indexed:
+                        persist_document_record(
+                            doc_id=result["doc_id"],
+                            practice_id=practice_id,
+                            title=result["title"],
+                            source_type=source_type or os.path.splitext(result["filename"])[1].lower().lstrip("."),
+                            source_uri=result["filename"],
+                            chunk_count=result["chunk_count"],
+                            subagents_allowed=subagents_allowed,
+                            content_hash=result["content_hash"],
+                        )
+
+        # Repeated files report the outcome of their first copy
+        for repeat, first in repeats:
+            repeat.update({key: value for key, value in results[first].items() if key != "filename"})
+            if repeat["status"] == "success":
+                repeat.update(
+                    message=f"'{repeat['title']}' is already indexed with the same content ({repeat['chunk_count']} chunks)",
+                    duplicate=True,
+                )
+
+        return results
+
     def index_text_content(
         self,
         practice_id: str,
@@ -466,7 +1625,8 @@ class IndexingService:
         text_content: str,
         source_type: str = "manual",
         source_uri: str = "manual-entry",
-        subagents_allowed: List[str] = None
+        subagents_allowed: List[str] = None,
+        persist: bool = True
     ) -> Dict:
         """
         Index raw text content directly.
@@ -478,11 +1638,12 @@ class IndexingService:
             source_type: Type of source
             source_uri: URI or description of source
             subagents_allowed: Which agents can use this doc
+            persist: Save the documents row before returning
             
         Returns:
             Dict with indexing results
         """
-        doc_id = str(uuid.uuid4())
+        doc_id = str(uuid7())
         subagents_allowed = subagents_allowed or ["chat", "clinical"]
         
         try:
@@ -496,50 +1657,34 @@ class IndexingService:
             content_hash = self.compute_content_hash(text_content)
             
             # Chunk the text
-            chunks = semantic_chunk_text(text_content, self.embeddings)
+            chunks = chunk_text(text_content, self.embeddings)
             
             # Add metadata
-            for i, chunk in enumerate(chunks):
-                chunk.metadata = {
-                    "doc_id": doc_id,
-                    "practice_id": practice_id,
-                    "source": source_uri,
-                    "title": title,
-                    "source_type": source_type,
-                    "chunk_index": i,
-                    "total_chunks": len(chunks),
-                    "subagents_allowed": ",".join(subagents_allowed),
-                    "indexed_at": datetime.utcnow().isoformat()
-                }
+            meta = chunk_metadata({
+                "doc_id": doc_id,
+                "practice_id": practice_id,
+                "source": source_uri,
+                "title": title,
+                "source_type": source_type,
+                "subagents_allowed": ",".join(subagents_allowed),
+            }, len(chunks))
             
             # Upload to Pinecone
-            LangchainPinecone.from_documents(
-                documents=chunks,
-                embedding=self.embeddings,
-                index_name=self.index_name,
-                namespace=practice_id
-            )
+            self.upsert_chunks([(meta, chunks)], practice_id)
 
-            # Persist document record to database
-            try:
-                db = SessionLocal()
-                db_doc = DBDocument(
-                    doc_id=uuid.UUID(doc_id),
-                    client_id=uuid.UUID(practice_id),
+            # Persist document record to database (callers that pass
+            # persist=False schedule persist_document_record themselves)
+            if persist:
+                persist_document_record(
+                    doc_id=doc_id,
+                    practice_id=practice_id,
                     title=title,
                     source_type=source_type,
                     source_uri=source_uri,
-                    status="indexed",
                     chunk_count=len(chunks),
                     subagents_allowed=subagents_allowed,
-                    last_indexed_at=datetime.utcnow()
+                    content_hash=content_hash,
                 )
-                db.add(db_doc)
-                db.commit()
-                db.close()
-                logger.info(f"Document record saved to database: {doc_id}")
-            except Exception as db_error:
-                logger.error(f"Failed to save document to database: {db_error}")
 
             return {
                 "status": "success",
@@ -558,11 +1703,267 @@ class IndexingService:
                 "doc_id": doc_id
             }
 
+    def submit_text_embedding_batch(
+        self,
+        practice_id: str,
+        title: str,
+        text_content: str,
+        source_type: str = "manual",
+        source_uri: str = "manual-entry",
+        subagents_allowed: List[str] = None
+    ) -> Dict:
+        """
+        Index raw text through the OpenAI Batch API (half the embedding
+        price, results within 24h) instead of embedding it now.
+
+        The text is chunked recursively and the documents row is saved as
+        "pending" before anything is submitted, so a paid-for batch is never
+        left without a row pointing at it. One /v1/embeddings request per
+        chunk is then submitted as a batch and its id attached to the row;
+        complete_embedding_batches upserts the vectors once the batch
+        finishes. If the id cannot be attached the batch is cancelled.
+
+        Returns:
+            Dict with status "pending", the doc_id and the batch job_id, or
+            status "error"
+        """
+        doc_id = str(uuid7())
+        subagents_allowed = subagents_allowed or ["chat", "clinical"]
+
+        try:
+            if len(text_content.strip()) < MIN_CHUNK_SIZE:
+                return {
+                    "status": "error",
+                    "message": "Text content is too short",
+                    "doc_id": doc_id
+                }
+
+            content_hash = self.compute_content_hash(text_content)
+            # Recursive chunking needs no embedding calls of its own
+            chunks = chunk_text_recursive(text_content)
+
+            saved = persist_document_record(
+                doc_id=doc_id,
+                practice_id=practice_id,
+                title=title,
+                source_type=source_type,
+                source_uri=source_uri,
+                chunk_count=len(chunks),
+                subagents_allowed=subagents_allowed,
+                content_hash=content_hash,
+                status="pending",
+            )
+            if not saved:
+                return {
+                    "status": "error",
+                    "message": "Failed to save the document record",
+                    "doc_id": doc_id
+                }
+
+            requests = BytesIO()
+            for i, chunk in enumerate(chunks):
+                requests.write(orjson.dumps({
+                    "custom_id": f"{doc_id}:{i}",
+                    "method": "POST",
+                    "url": "/v1/embeddings",
+                    "body": {"model": self.model_name, "input": chunk},
+                }))
+                requests.write(b"\n")
+            try:
+                batch_file = self.openai_client.files.create(
+                    file=(f"{doc_id}.jsonl", requests.getvalue()),
+                    purpose="batch"
+                )
+                batch = self.openai_client.batches.create(
+                    input_file_id=batch_file.id,
+                    endpoint="/v1/embeddings",
+                    completion_window=EMBED_BATCH_COMPLETION_WINDOW,
+                    metadata={"doc_id": doc_id, "practice_id": practice_id}
+                )
+            except Exception as e:
+                self._fail_batch_submission(doc_id, f"Batch submission failed: {e}")
+                raise
+            logger.info(f"Submitted embedding batch {batch.id} for {len(chunks)} chunks of {doc_id}")
+
+            if not self._attach_embedding_batch(doc_id, batch.id):
+                try:
+                    self.openai_client.batches.cancel(batch.id)
+                except Exception as cancel_error:
+                    logger.error(f"Failed to cancel embedding batch {batch.id}: {cancel_error}")
+                self._fail_batch_submission(doc_id, f"Could not record embedding batch {batch.id}")
+                return {
+                    "status": "error",
+                    "message": "Failed to record the embedding batch; it was cancelled",
+                    "doc_id": doc_id
+                }
+
+            return {
+                "status": "pending",
+                "message": f"Queued '{title}' ({len(chunks)} chunks) for batch embedding",
+                "doc_id": doc_id,
+                "job_id": batch.id,
+                "title": title,
+                "chunk_count": len(chunks),
+                "content_hash": content_hash
+            }
+
+        except Exception as e:
+            logger.error(f"Error submitting embedding batch: {e}")
+            return {
+                "status": "error",
+                "message": f"Batch submission failed: {str(e)}",
+                "doc_id": doc_id
+            }
+
+    def _read_batch_file(self, file_id: str) -> Dict[str, Dict]:
+        """A Batch API JSONL file (input or output) keyed by custom_id."""
+        lines = self.openai_client.files.content(file_id).content.splitlines()
+        return {row["custom_id"]: row for row in map(orjson.loads, filter(None, lines))}
+
+    def complete_embedding_batch(self, doc) -> bool:
+        """
+        Upsert a claimed document (see claim_embedding_batch) whose embedding
+        batch has finished.
+
+        Returns False while the batch is still running, handing the document
+        back as pending. A batch that failed, expired or has missing results
+        marks the document failed. Any other error (OpenAI, Pinecone or the
+        database being unavailable) leaves it pending for a retry with
+        backoff, until EMBED_BATCH_MAX_ATTEMPTS.
+        """
+        doc_id = str(doc.doc_id)
+        try:
+            batch = self.openai_client.batches.retrieve(doc.batch_job_id)
+            if batch.status in EMBED_BATCH_RUNNING_STATES:
+                self._finish_embedding_batch(doc, status="pending")
+                return False
+
+            problem = None
+            if batch.status != "completed" or not batch.output_file_id:
+                problem = f"embedding batch {batch.id} ended as {batch.status}"
+            else:
+                requests = self._read_batch_file(batch.input_file_id)
+                results = self._read_batch_file(batch.output_file_id)
+                chunks, vectors = [], []
+                for i in range(doc.chunk_count):
+                    result = results.get(f"{doc_id}:{i}")
+                    if not result or result.get("error") or result["response"]["status_code"] != 200:
+                        problem = f"embedding batch {batch.id} has no result for chunk {i}"
+                        break
+                    chunks.append(requests[f"{doc_id}:{i}"]["body"]["input"])
+                    vectors.append(result["response"]["body"]["data"][0]["embedding"])
+
+            if problem:
+                logger.error(f"Completing embedding batch for {doc_id} failed: {problem}")
+                self._finish_embedding_batch(doc, status="failed", error_message=problem)
+                return True
+
+            meta = chunk_metadata({
+                "doc_id": doc_id,
+                "practice_id": str(doc.client_id),
+                "source": doc.source_uri,
+                "title": doc.title,
+                "source_type": doc.source_type,
+                "subagents_allowed": ",".join(doc.subagents_allowed or []),
+            }, len(chunks))
+            self.upsert_chunks([(meta, chunks)], str(doc.client_id), embeddings=vectors)
+        except Exception as e:
+            attempts = doc.batch_attempts + 1
+            if attempts >= EMBED_BATCH_MAX_ATTEMPTS:
+                logger.error(f"Completing embedding batch for {doc_id} failed {attempts} times, giving up: {e}")
+                self._finish_embedding_batch(doc, status="failed", error_message=str(e), batch_attempts=attempts)
+                return True
+            logger.warning(f"Completing embedding batch for {doc_id} failed (attempt {attempts}), will retry: {e}")
+            self._finish_embedding_batch(doc, status="pending", error_message=str(e), batch_attempts=attempts)
+            return False
+
+        logger.info(f"Embedding batch {doc.batch_job_id} upserted {len(chunks)} chunks of {doc_id}")
+        self._finish_embedding_batch(
+            doc, status="indexed", error_message=None, last_indexed_at=datetime.utcnow()
+        )
+        return True
+
+    @staticmethod
+    def _attach_embedding_batch(doc_id: str, batch_job_id: str) -> bool:
+        """Record the submitted batch on its pending row; False if that failed."""
+        try:
+            with SessionLocal() as db, db.begin():
+                attached = db.execute(
+                    update(DBDocument)
+                    .where(DBDocument.doc_id == uuid.UUID(doc_id), DBDocument.status == "pending")
+                    .values(batch_job_id=batch_job_id)
+                ).rowcount
+            return attached == 1
+        except Exception as db_error:
+            logger.error(f"Failed to attach embedding batch {batch_job_id} to {doc_id}: {db_error}")
+            return False
+
+    @staticmethod
+    def _fail_batch_submission(doc_id: str, message: str) -> None:
+        """Mark a pending row failed when its batch never got submitted."""
+        try:
+            with SessionLocal() as db, db.begin():
+                db.execute(
+                    update(DBDocument)
+                    .where(DBDocument.doc_id == uuid.UUID(doc_id), DBDocument.status == "pending")
+                    .values(status="failed", error_message=message)
+                )
+        except Exception as db_error:
+            logger.error(f"Failed to mark {doc_id} failed: {db_error}")
+
+    @staticmethod
+    def _finish_embedding_batch(doc, **values) -> None:
+        """Release a claimed document with new column values."""
+        with SessionLocal() as db, db.begin():
+            db.execute(
+                update(DBDocument)
+                .where(DBDocument.doc_id == doc.doc_id, DBDocument.status == "processing")
+                .values(**values)
+            )
+
+    @staticmethod
+    def claim_embedding_batch(doc_id: uuid.UUID, now: datetime):
+        """
+        Atomically mark a due pending document "processing" and return its
+        row, or None when another worker got there first.
+        """
+        with SessionLocal() as db, db.begin():
+            return db.execute(
+                update(DBDocument)
+                .where(DBDocument.doc_id == doc_id, _embedding_batch_due(now))
+                .values(status="processing")
+                .returning(
+                    DBDocument.doc_id, DBDocument.client_id, DBDocument.title,
+                    DBDocument.source_uri, DBDocument.source_type, DBDocument.subagents_allowed,
+                    DBDocument.chunk_count, DBDocument.batch_job_id, DBDocument.batch_attempts,
+                )
+                .execution_options(synchronize_session=False)
+            ).first()
+
+    def complete_embedding_batches(self) -> int:
+        """
+        Finish every due document whose embedding batch is done; returns how
+        many. Each document is claimed first, so with several worker
+        processes polling, only one of them completes a given batch.
+        """
+        now = datetime.utcnow()
+        with SessionLocal() as db:
+            due = db.execute(select(DBDocument.doc_id).where(_embedding_batch_due(now))).scalars().all()
+
+        finished = 0
+        for doc_id in due:
+            try:
+                doc = self.claim_embedding_batch(doc_id, now)
+                if doc is not None and self.complete_embedding_batch(doc):
+                    finished += 1
+            except Exception as e:
+                logger.warning(f"Could not check embedding batch of {doc_id}: {e}")
+        return finished
+
     def get_index_stats(self, practice_id: str) -> Dict:
         """Get statistics for a practice's namespace in Pinecone."""
         try:
-            index = self.pc.Index(self.index_name)
-            stats = index.describe_index_stats()
+            stats = describe_index_stats()
             
             namespaces = stats.get("namespaces", {})
             namespace_stats = namespaces.get(practice_id, {})
@@ -580,26 +1981,46 @@ class IndexingService:
                 "message": str(e)
             }
     
+    def _delete_vectors(self, practice_id: str, doc_id: str, chunk_count: int) -> None:
+        """Delete the vectors "{doc_id}-0" .. "{doc_id}-{chunk_count - 1}" by id."""
+        ids = [f"{doc_id}-{i}" for i in range(chunk_count)]
+        for start in range(0, len(ids), DELETE_BATCH_SIZE):
+            self.index.delete(ids=ids[start:start + DELETE_BATCH_SIZE], namespace=practice_id)
+
     def delete_document(self, practice_id: str, doc_id: str) -> Dict:
-        """Delete all vectors for a specific document from Pinecone and database."""
+        """
+        Delete all vectors for a specific document from Pinecone and database.
+
+        Vector ids are "{doc_id}-{chunk_index}", so with the chunk_count from
+        the documents row they are deleted by id; the metadata-filter delete
+        is only used when the row is missing.
+        """
         try:
-            index = self.pc.Index(self.index_name)
+            with SessionLocal() as db:
+                chunk_count = db.execute(
+                    select(DBDocument.chunk_count).where(
+                        DBDocument.doc_id == uuid.UUID(doc_id),
+                        DBDocument.client_id == uuid.UUID(practice_id)
+                    )
+                ).scalar_one_or_none()
 
-            # Delete from Pinecone by metadata filter (doc_id)
-            index.delete(
-                namespace=practice_id,
-                filter={"doc_id": {"$eq": doc_id}}
-            )
+            if chunk_count is None:
+                # No record of the chunk count: delete by metadata filter (doc_id)
+                self.index.delete(
+                    namespace=practice_id,
+                    filter={"doc_id": {"$eq": doc_id}}
+                )
+            else:
+                self._delete_vectors(practice_id, doc_id, chunk_count)
+            invalidate_index_stats()
 
             # Delete from database
             try:
-                db = SessionLocal()
-                db.query(DBDocument).filter(
-                    DBDocument.doc_id == uuid.UUID(doc_id),
-                    DBDocument.client_id == uuid.UUID(practice_id)
-                ).delete()
-                db.commit()
-                db.close()
+                with SessionLocal() as db, db.begin():
+                    db.query(DBDocument).filter(
+                        DBDocument.doc_id == uuid.UUID(doc_id),
+                        DBDocument.client_id == uuid.UUID(practice_id)
+                    ).delete()
                 logger.info(f"Document record deleted from database: {doc_id}")
             except Exception as db_error:
                 logger.error(f"Failed to delete document from database: {db_error}")
@@ -616,12 +2037,224 @@ class IndexingService:
             }
 
 
-# Singleton instance
-_indexing_service = None
+_indexing_service: Optional[IndexingService] = None
+_indexing_service_lock = threading.Lock()
+
 
 def get_indexing_service() -> IndexingService:
-    """Get or create the indexing service singleton."""
+    """
+    Get or create the indexing service singleton (created once, even when
+    first requested from several threads at the same time).
+    """
+    global _indexing_service
+    with _indexing_service_lock:
+        if _indexing_service is None:
+            _indexing_service = IndexingService()
+        return _indexing_service
+
+
+def close_indexing_service() -> None:
+    """Close the singleton's pooled OpenAI connections, if it was created (at shutdown)."""
     global _indexing_service
-    if _indexing_service is None:
-        _indexing_service = IndexingService()
-    return _indexing_service
+    with _indexing_service_lock:
+        service, _indexing_service = _indexing_service, None
+    if service is not None:
+        service.close()
+
+
+# =============================================================================
+# Index Stats
+# =============================================================================
+
+_stats_cache: Optional[Tuple[float, Any]] = None
+_stats_lock = threading.Lock()
+
+
+def describe_index_stats():
+    """
+    describe_index_stats() of the Pinecone index, memoized for
+    STATS_CACHE_TTL_SECONDS and dropped after every upsert or delete.
+
+    Reads through the query path's cached index handle, so the practice
+    list and the health check (services.py) need only the Pinecone settings,
+    not an IndexingService. The lock is held across the call so concurrent
+    polls wait for one request instead of each issuing their own.
+    """
+    global _stats_cache
+    from src.core.rag_engine import get_pinecone_index
+
+    with _stats_lock:
+        now = time.monotonic()
+        if _stats_cache is not None and now - _stats_cache[0] < STATS_CACHE_TTL_SECONDS:
+            return _stats_cache[1]
+        index = get_pinecone_index()
+        if index is None:
+            raise RuntimeError("Pinecone index is not available")
+        stats = index.describe_index_stats()
+        _stats_cache = (now, stats)
+        return stats
+
+
+def invalidate_index_stats() -> None:
+    """Drop the memoized index stats (after vectors were written or deleted)."""
+    global _stats_cache
+    with _stats_lock:
+        _stats_cache = None
+
+
+# =============================================================================
+# Indexing Jobs
+# =============================================================================
+
+_job_executor: Optional[ThreadPoolExecutor] = None
+_job_executor_lock = threading.Lock()
+
+
+def create_indexing_job(practice_id: str, filename: str) -> str:
+    """Insert a queued indexing_jobs row and return its job_id."""
+    job_id = uuid7()
+    with SessionLocal() as db, db.begin():
+        db.add(IndexingJob(
+            job_id=job_id,
+            client_id=uuid.UUID(practice_id),
+            filename=filename,
+            status="queued",
+            percent=0,
+            message="Queued for indexing"
+        ))
+    return str(job_id)
+
+
+def update_indexing_job(job_id: str, **fields) -> None:
+    """Update a job row; failures are logged so indexing carries on."""
+    try:
+        with SessionLocal() as db, db.begin():
+            db.execute(
+                update(IndexingJob)
+                .where(IndexingJob.job_id == uuid.UUID(job_id))
+                .values(updated_at=datetime.utcnow(), **fields)
+            )
+    except SQLAlchemyError as e:
+        logger.error(f"Failed to update indexing job {job_id}: {e}")
+
+
+def get_indexing_job(job_id: str) -> Optional[Dict]:
+    """Current state of a job, or None if there is no such job."""
+    try:
+        key = uuid.UUID(job_id)
+    except ValueError:
+        return None
+    with SessionLocal() as db:
+        job = db.get(IndexingJob, key)
+        if job is None:
+            return None
+        return {
+            "job_id": str(job.job_id),
+            "practice_id": str(job.client_id),
+            "doc_id": str(job.doc_id) if job.doc_id else None,
+            "filename": job.filename,
+            "status": job.status,
+            "percent": job.percent,
+            "message": job.message,
+            "created_at": job.created_at,
+            "updated_at": job.updated_at,
+        }
+
+
+def run_indexing_job(
+    job_id: str,
+    practice_id: str,
+    filename: str,
+    file_content: Union[bytes, BinaryIO],
+    title: Optional[str] = None,
+    source_type: str = "pdf",
+    subagents_allowed: List[str] = None
+) -> None:
+    """
+    Index one upload, mirroring each progress event into its job row.
+
+    On success the documents row is saved as well. A file object passed
+    as file_content is closed (and a temp file thereby removed) when done.
+    """
+    subagents_allowed = subagents_allowed or ["chat", "clinical"]
+    try:
+        indexing_service = get_indexing_service()
+        for event in coalesce_progress(indexing_service.process_and_index_file_with_progress(
+            practice_id=practice_id,
+            filename=filename,
+            file_content=file_content,
+            title=title,
+            source_type=source_type,
+            subagents_allowed=subagents_allowed
+        )):
+            if event.get("error"):
+                update_indexing_job(job_id, status="failed", message=event["message"])
+                return
+
+            result = event.get("result")
+            if result is None:
+                update_indexing_job(job_id, status="processing", percent=event["percent"], message=event["message"])
+                continue
+
+            if not result.get("duplicate"):
+                persist_document_record(
+                    doc_id=result["doc_id"],
+                    practice_id=practice_id,
+                    title=result["title"],
+                    source_type=source_type,
+                    source_uri=filename,
+                    chunk_count=result["chunk_count"],
+                    subagents_allowed=subagents_allowed,
+                    content_hash=result.get("content_hash"),
+                )
+            update_indexing_job(
+                job_id,
+                status="indexed",
+                percent=100,
+                message=event["message"],
+                doc_id=uuid.UUID(result["doc_id"])
+            )
+    except Exception as e:
+        logger.error(f"Indexing job {job_id} failed: {e}")
+        update_indexing_job(job_id, status="failed", message=f"Indexing failed: {str(e)}")
+    finally:
+        if hasattr(file_content, "close"):
+            file_content.close()
+
+
+def submit_background_job(fn, *args, **kwargs) -> None:
+    """
+    Run fn(*args, **kwargs) on the background job worker pool.
+
+    The pool lives in this process; jobs queued when it exits are lost and
+    their rows stay "queued".
+    """
+    global _job_executor
+    with _job_executor_lock:
+        if _job_executor is None:
+            _job_executor = ThreadPoolExecutor(
+                max_workers=INDEXING_JOB_WORKERS,
+                thread_name_prefix="indexing-job"
+            )
+    _job_executor.submit(fn, *args, **kwargs)
+
+
+def submit_indexing_job(job_id: str, *args, **kwargs) -> None:
+    """Run run_indexing_job on the background worker pool."""
+    submit_background_job(run_indexing_job, job_id, *args, **kwargs)
+
+
+def _embedding_batch_poll_loop() -> None:
+    while True:
+        time.sleep(EMBED_BATCH_POLL_SECONDS)
+        try:
+            get_indexing_service().complete_embedding_batches()
+        except ValueError:
+            pass  # indexing service not configured
+        except Exception as e:
+            logger.error(f"Embedding batch poll failed: {e}")
+
+
+def start_embedding_batch_poller() -> None:
+    """Start the thread that finishes documents indexed via the Batch API."""
+    threading.Thread(target=_embedding_batch_poll_loop, name="embedding-batch-poller", daemon=True).start()
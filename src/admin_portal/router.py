@@ -4,15 +4,22 @@ Admin Portal API Router
 All admin-only endpoints for Practice Brain management.
 """
 
+import asyncio
+import contextlib
+import functools
+import io
 import logging
 import os
-import json
-from typing import Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Tuple
+from uuid import UUID
 from pathlib import Path
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status, UploadFile, File, Form
-from fastapi.responses import HTMLResponse, FileResponse, StreamingResponse
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, status, UploadFile, File, Form
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
+from starlette.concurrency import run_in_threadpool
+import orjson
 
 from src.admin_portal.auth import (
     require_admin,
@@ -29,8 +36,8 @@ from src.admin_portal.schemas import (
     SourceListResponse,
     ReindexRequest,
     ReindexResponse,
+    IndexingJobResponse,
     HealthResponse,
-    ClinicalAdvisorConfig,
     ClinicalConfigResponse,
     ClinicalConfigUpdateRequest,
     ClinicalConfigUpdateResponse,
@@ -39,9 +46,23 @@ from src.admin_portal.services import (
     PracticeService,
     DocumentService,
     HealthService,
+    estimate_audit_log_count,
     log_admin_action
 )
+from src.admin_portal.indexing_service import (
+    CHUNK_TOKENS,
+    create_indexing_job,
+    get_indexing_job,
+    get_indexing_service,
+    persist_document_record,
+    sse_event,
+    submit_indexing_job,
+)
+from src.core.config import INDEX_WORKERS
 from src.core.db import get_db
+from sqlalchemy import Integer, cast, func, select
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
@@ -49,45 +70,23 @@ logger = logging.getLogger(__name__)
 # Create router
 admin_portal_router = APIRouter()
 
-# Static files directory
+# Admin UI assets (index.html, styles.css, app.js); src.main mounts this
+# directory at /admin with StaticFiles, after the API routes
 STATIC_DIR = Path(__file__).parent / "static"
+STATIC_ASSET_CACHE_CONTROL = "public, max-age=3600"
 
 
-# =============================================================================
-# Static Files / UI Endpoints
-# =============================================================================
+class AdminStaticFiles(StaticFiles):
+    """StaticFiles that lets browsers cache the CSS/JS assets for an hour.
+
+    index.html is left to ETag revalidation so a deploy is picked up on reload.
+    """
 
-@admin_portal_router.get("/")
-async def admin_ui():
-    """Serve the admin portal UI."""
-    index_path = STATIC_DIR / "index.html"
-    if index_path.exists():
-        with open(index_path, "r", encoding="utf-8") as f:
-            content = f.read()
-        return HTMLResponse(content=content)
-    return HTMLResponse("<h1>Admin Portal</h1><p>UI not found. API is running.</p>")
-
-
-@admin_portal_router.get("/styles.css")
-async def get_styles():
-    """Serve CSS file."""
-    css_path = STATIC_DIR / "styles.css"
-    if css_path.exists():
-        with open(css_path, "r", encoding="utf-8") as f:
-            content = f.read()
-        return HTMLResponse(content=content, media_type="text/css")
-    raise HTTPException(status_code=404, detail="CSS not found")
-
-
-@admin_portal_router.get("/app.js")
-async def get_js():
-    """Serve JavaScript file."""
-    js_path = STATIC_DIR / "app.js"
-    if js_path.exists():
-        with open(js_path, "r", encoding="utf-8") as f:
-            content = f.read()
-        return HTMLResponse(content=content, media_type="application/javascript")
-    raise HTTPException(status_code=404, detail="JavaScript not found")
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        if response.media_type != "text/html":
+            response.headers.setdefault("Cache-Control", STATIC_ASSET_CACHE_CONTROL)
+        return response
 
 
 # =============================================================================
@@ -102,7 +101,8 @@ async def get_js():
 )
 async def login(request: AdminLoginRequest, db: Session = Depends(get_db)):
     """Login endpoint for admin users."""
-    return admin_login(request, db)
+    # bcrypt is CPU-bound; keep it off the event loop
+    return await asyncio.to_thread(admin_login, request, db)
 
 
 @admin_portal_router.get(
@@ -262,7 +262,8 @@ async def reindex_document(
     admin: AdminUser = Depends(require_admin)
 ):
     """Re-index a single document."""
-    result = DocumentService.reindex_document(
+    result = await run_in_threadpool(
+        DocumentService.reindex_document,
         practice_id=practice_id,
         doc_id=doc_id,
         actor=admin.username
@@ -283,7 +284,8 @@ async def reindex_practice(
     admin: AdminUser = Depends(require_admin)
 ):
     """Re-index all documents in a practice."""
-    result = DocumentService.reindex_practice(
+    result = await run_in_threadpool(
+        DocumentService.reindex_practice,
         practice_id=practice_id,
         actor=admin.username
     )
@@ -379,8 +381,17 @@ async def get_audit_log(
     """Get audit log entries from database."""
     from src.models.models import AuditLog
 
-    # Query from database, most recent first
-    audit_entries = db.query(AuditLog).order_by(AuditLog.created_at.desc()).limit(limit).all()
+    # Query from database, most recent first; only the columns the UI shows
+    audit_rows = db.query(
+        AuditLog.id,
+        AuditLog.action,
+        AuditLog.actor,
+        AuditLog.practice_id,
+        AuditLog.doc_id,
+        AuditLog.result,
+        AuditLog.details,
+        AuditLog.created_at,
+    ).order_by(AuditLog.created_at.desc()).limit(limit)
 
     entries = [
         {
@@ -393,10 +404,15 @@ async def get_audit_log(
             "details": entry.details or {},
             "timestamp": entry.created_at.isoformat() if entry.created_at else None
         }
-        for entry in audit_entries
+        for entry in audit_rows
     ]
 
-    total_count = db.query(AuditLog).count()
+    # A short page is the whole table; otherwise use the planner's row
+    # estimate rather than COUNT(*) over every partition
+    if len(entries) < limit:
+        total_count = len(entries)
+    else:
+        total_count = max(estimate_audit_log_count(db), len(entries))
     return {"entries": entries, "total": total_count}
 
 
@@ -404,8 +420,194 @@ async def get_audit_log(
 # File Upload & Indexing Endpoints
 # =============================================================================
 
-SUPPORTED_EXTENSIONS = [".txt", ".pdf", ".docx", ".doc", ".md", ".html", ".json"]
+SUPPORTED_EXTENSIONS = frozenset({".txt", ".pdf", ".docx", ".doc", ".md", ".html", ".json"})
+SUPPORTED_EXTENSIONS_TEXT = ", ".join(sorted(SUPPORTED_EXTENSIONS))
 MAX_FILE_SIZE = 20 * 1024 * 1024  # 20MB
+JOB_POLL_SECONDS = 0.5  # how often /jobs/{job_id}/stream re-reads the job row
+# Multipart framing and the other form fields on top of the file itself
+UPLOAD_FORM_OVERHEAD = 64 * 1024
+DEFAULT_SUBAGENTS = ("chat", "clinical")
+# Leading bytes of the binary formats, checked against an upload's extension
+# before any parsing. Text types (.txt, .md, .html, .json) must not match any.
+FILE_SIGNATURES = (
+    (b"%PDF-", ".pdf"),
+    (b"PK\x03\x04", ".docx"),
+    (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1", "legacy .doc"),
+)
+EXPECTED_SIGNATURES = {".pdf": ".pdf", ".docx": ".docx", ".doc": ".docx"}  # .doc goes through python-docx too
+PDF_HEADER_WINDOW = 1024  # readers accept a %PDF- header anywhere in the first 1KB
+UTF8_BOM = b"\xef\xbb\xbf"
+SINGLE_FILE_UPLOAD_SUFFIXES = ("/documents/upload", "/documents/upload-stream", "/documents/upload-async")
+MIN_CHUNK_TOKENS = 50
+MAX_CHUNK_TOKENS = 8000  # embedding model input limit is 8191 tokens
+
+
+# Uploads and text indexing (extract, chunk, embed, upsert) run on their own
+# bounded pool, so a burst of uploads cannot take every thread of the shared
+# threadpool that other sync endpoints and dependencies need
+_index_executor = ThreadPoolExecutor(max_workers=INDEX_WORKERS, thread_name_prefix="index")
+
+
+async def run_indexing(fn, *args, **kwargs):
+    """Run a blocking indexing call on the indexing pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_index_executor, functools.partial(fn, *args, **kwargs))
+
+
+async def iterate_indexing(iterator, cleanup=None):
+    """
+    Drive a blocking generator on the indexing pool, one item per step.
+
+    When iteration ends, or the consumer stops or is cancelled, the
+    generator is closed and cleanup() called on the pool. If a step is
+    still running on a worker thread (the task was cancelled mid-step),
+    that waits for the step to finish, so nothing the generator reads is
+    closed under it.
+    """
+    done = object()
+    step = None
+    try:
+        while True:
+            step = _index_executor.submit(next, iterator, done)
+            item = await asyncio.wrap_future(step)
+            if item is done:
+                return
+            yield item
+    finally:
+        def close():
+            try:
+                if hasattr(iterator, "close"):
+                    iterator.close()
+            finally:
+                if cleanup is not None:
+                    cleanup()
+
+        if step is None or step.done():
+            _index_executor.submit(close)
+        else:
+            step.add_done_callback(lambda _: _index_executor.submit(close))
+
+
+def upload_exceeds_size_limit(request: Request) -> bool:
+    """
+    True when a single-file upload request declares a body larger than
+    MAX_FILE_SIZE allows.
+
+    The form is parsed (and the whole body received) before an endpoint
+    runs, so this is checked by middleware in src.main against
+    Content-Length. Uploads without the header are still rejected once
+    parsed (check_upload).
+    """
+    if request.method != "POST" or not request.url.path.endswith(SINGLE_FILE_UPLOAD_SUFFIXES):
+        return False
+    try:
+        declared = int(request.headers.get("content-length", ""))
+    except ValueError:
+        return False
+    return declared > MAX_FILE_SIZE + UPLOAD_FORM_OVERHEAD
+
+
+def sniff_file_type(head: bytes) -> Optional[str]:
+    """Format named by a binary signature at the start of head, or None (text)."""
+    for magic, file_type in FILE_SIGNATURES:
+        if head.startswith(magic):
+            return file_type
+    return None
+
+
+def check_upload_signature(ext: str, head: bytes, filename: str) -> None:
+    """
+    Reject an upload whose first bytes do not fit its extension.
+
+    Text formats must not start with a binary signature or contain NUL
+    bytes, and JSON must open with an object or array.
+    """
+    if ext == ".pdf" and b"%PDF-" in head[:PDF_HEADER_WINDOW]:
+        return
+    sniffed = sniff_file_type(head)
+    if sniffed is None and ext not in EXPECTED_SIGNATURES:
+        if b"\x00" in head:
+            sniffed = "binary data"
+        elif ext == ".json" and not head.removeprefix(UTF8_BOM).lstrip().startswith((b"{", b"[")):
+            sniffed = "text, not JSON"
+        else:
+            return
+    elif sniffed == EXPECTED_SIGNATURES.get(ext):
+        return
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"File content does not match its {ext} extension ({filename} looks like {sniffed or 'text'})"
+    )
+
+
+def file_extension(filename: str) -> str:
+    """Lower-cased extension of filename (lowering only the extension)."""
+    return os.path.splitext(filename)[1].lower()
+
+
+@functools.lru_cache(maxsize=64)
+def parse_subagents(subagents: Optional[str]) -> Tuple[str, ...]:
+    """Agents named in a comma-separated form field; chat and clinical by default.
+
+    Memoized: forms almost always send one of a handful of values.
+    """
+    if not subagents:
+        return DEFAULT_SUBAGENTS
+    return tuple(filter(None, (name.strip() for name in subagents.split(","))))
+
+
+def check_chunk_overlap(chunk_size: Optional[int], chunk_overlap: Optional[int]) -> None:
+    """Reject an overlap that is not smaller than the (effective) chunk size."""
+    if chunk_overlap is None:
+        return
+    if chunk_overlap >= (chunk_size or CHUNK_TOKENS):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="chunk_overlap must be smaller than chunk_size"
+        )
+
+
+def upload_file_size(fileobj) -> int:
+    """Size of a seekable upload file, leaving it rewound."""
+    size = fileobj.seek(0, os.SEEK_END)
+    fileobj.seek(0)
+    return size
+
+
+async def check_upload(file: UploadFile, ext: str) -> int:
+    """
+    Check an upload's size against MAX_FILE_SIZE and its first bytes
+    against its extension (check_upload_signature); returns the size.
+
+    Starlette has already spooled the multipart part (in memory, or on
+    disk once large), so file.file is checked and passed on as it is
+    instead of being read or copied again. It is left rewound.
+    """
+    filename = file.filename or "unnamed_file"
+    file_size = file.size if file.size is not None else await run_in_threadpool(upload_file_size, file.file)
+
+    if file_size > MAX_FILE_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File too large: {filename}. Maximum size: {MAX_FILE_SIZE / (1024*1024)}MB"
+        )
+
+    if file_size:
+        check_upload_signature(ext, await file.read(PDF_HEADER_WINDOW), filename)
+        await file.seek(0)
+    return file_size
+
+
+def take_upload_file(file: UploadFile):
+    """
+    Detach Starlette's spooled file from an upload and hand it to the caller.
+
+    FastAPI closes the form's files once the response has been sent, which
+    for a streamed response or a background job is while indexing may
+    still read it. Afterwards the caller owns the file and must close it.
+    """
+    spooled, file.file = file.file, io.BytesIO()
+    return spooled
 
 
 @admin_portal_router.post(
@@ -415,10 +617,13 @@ MAX_FILE_SIZE = 20 * 1024 * 1024  # 20MB
 )
 async def upload_and_index_document(
     practice_id: str,
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(..., description="File to upload (PDF, DOCX, TXT, etc.)"),
     title: Optional[str] = Form(None, description="Document title (defaults to filename)"),
     source_type: Optional[str] = Form("pdf", description="Source type (pdf, doc, manual)"),
     subagents: Optional[str] = Form("chat,clinical", description="Comma-separated list of agents"),
+    chunk_size: Optional[int] = Form(None, ge=MIN_CHUNK_TOKENS, le=MAX_CHUNK_TOKENS, description="Chunk size in tokens (default: automatic)"),
+    chunk_overlap: Optional[int] = Form(None, ge=0, description="Overlap between chunks in tokens (default: 25% of chunk size)"),
     admin: AdminUser = Depends(require_admin)
 ):
     """
@@ -428,76 +633,91 @@ async def upload_and_index_document(
     
     The file will be:
     1. Extracted for text content
-    2. Split into semantic chunks
+    2. Split into chunks (recursive, or semantic for long documents)
     3. Embedded using OpenAI text-embedding-3-small
     4. Uploaded to Pinecone in the practice's namespace
     """
-    from src.admin_portal.indexing_service import get_indexing_service, SUPPORTED_EXTENSIONS as EXTS
     
     # Validate file extension
     filename = file.filename or "unnamed_file"
-    ext = os.path.splitext(filename.lower())[1]
+    ext = file_extension(filename)
     
-    if ext not in EXTS:
+    if ext not in SUPPORTED_EXTENSIONS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Unsupported file type: {ext}. Supported: {', '.join(SUPPORTED_EXTENSIONS)}"
+            detail=f"Unsupported file type: {ext}. Supported: {SUPPORTED_EXTENSIONS_TEXT}"
         )
     
-    # Read file content
-    content = await file.read()
+    check_chunk_overlap(chunk_size, chunk_overlap)
     
-    # Check file size
-    if len(content) > MAX_FILE_SIZE:
-        raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail=f"File too large. Maximum size: {MAX_FILE_SIZE / (1024*1024)}MB"
-        )
+    file_size = await check_upload(file, ext)
     
-    if len(content) == 0:
+    if file_size == 0:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Empty file uploaded"
         )
     
-    # Parse subagents
-    subagents_list = [s.strip() for s in subagents.split(",") if s.strip()] if subagents else ["chat", "clinical"]
+    subagents_list = parse_subagents(subagents)
+    content = take_upload_file(file)
     
     # Process and index
-    try:
-        indexing_service = get_indexing_service()
-    except ValueError as e:
-        logger.error(f"Indexing service initialization failed: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Indexing service not configured: {str(e)}"
-        )
+    with content:
+        try:
+            indexing_service = await run_in_threadpool(get_indexing_service)
+        except ValueError as e:
+            logger.error(f"Indexing service initialization failed: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Indexing service not configured: {str(e)}"
+            )
+        
+        try:
+            # Extraction, chunking and embedding block; run them on a
+            # worker thread so the event loop keeps serving other requests
+            result = await run_indexing(
+                indexing_service.process_and_index_file,
+                practice_id=practice_id,
+                filename=filename,
+                file_content=content,
+                title=title,
+                source_type=source_type or ext[1:],
+                subagents_allowed=subagents_list,
+                persist=False,
+                chunk_tokens=chunk_size,
+                overlap_tokens=chunk_overlap
+            )
+        except Exception as e:
+            logger.error(f"Error during file indexing: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Indexing failed: {str(e)}"
+            )
     
-    try:
-        result = indexing_service.process_and_index_file(
+    # Save the documents row after the response is sent (a duplicate
+    # upload already has one)
+    if result.get("status") == "success" and not result.get("duplicate"):
+        background_tasks.add_task(
+            persist_document_record,
+            doc_id=result["doc_id"],
             practice_id=practice_id,
-            filename=filename,
-            file_content=content,
-            title=title,
+            title=result["title"],
             source_type=source_type or ext[1:],
-            subagents_allowed=subagents_list
-        )
-    except Exception as e:
-        logger.error(f"Error during file indexing: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Indexing failed: {str(e)}"
+            source_uri=filename,
+            chunk_count=result["chunk_count"],
+            subagents_allowed=subagents_list,
+            content_hash=result.get("content_hash")
         )
     
     # Log the action
     log_admin_action(
-        action="upload_document",
+        action="upload_document_deduped" if result.get("duplicate") else "upload_document",
         actor=admin.username,
         practice_id=practice_id,
         doc_id=result.get("doc_id"),
         details={
             "filename": filename,
-            "file_size": len(content),
+            "file_size": file_size,
             "status": result.get("status"),
             "chunk_count": result.get("chunk_count", 0)
         }
@@ -519,55 +739,317 @@ async def upload_and_index_document(
 )
 async def upload_and_index_document_stream(
     practice_id: str,
+    request: Request,
     file: UploadFile = File(..., description="File to upload"),
     title: Optional[str] = Form(None, description="Document title"),
     source_type: Optional[str] = Form("pdf", description="Source type"),
     subagents: Optional[str] = Form("chat,clinical", description="Comma-separated list of agents"),
+    chunk_size: Optional[int] = Form(None, ge=MIN_CHUNK_TOKENS, le=MAX_CHUNK_TOKENS, description="Chunk size in tokens (default: automatic)"),
+    chunk_overlap: Optional[int] = Form(None, ge=0, description="Overlap between chunks in tokens (default: 25% of chunk size)"),
     admin: AdminUser = Depends(require_admin)
 ):
     """
     Upload and index with Server-Sent Events for progress updates.
+
+    If the client disconnects, indexing stops before its next step and any
+    vectors already upserted for the document are removed.
     """
-    from src.admin_portal.indexing_service import get_indexing_service, SUPPORTED_EXTENSIONS as EXTS
     
     # Validate file
     filename = file.filename or "unnamed_file"
-    ext = os.path.splitext(filename.lower())[1]
+    ext = file_extension(filename)
     
-    if ext not in EXTS:
+    if ext not in SUPPORTED_EXTENSIONS:
         async def error_stream():
-            yield f"data: {json.dumps({'stage': 'error', 'percent': 0, 'message': f'Unsupported file type: {ext}'})}\n\n"
+            yield sse_event({'stage': 'error', 'percent': 0, 'message': f'Unsupported file type: {ext}'})
         return StreamingResponse(error_stream(), media_type="text/event-stream")
     
-    content = await file.read()
+    check_chunk_overlap(chunk_size, chunk_overlap)
+    
+    file_size = await check_upload(file, ext)
     
-    if len(content) == 0:
+    if file_size == 0:
         async def error_stream():
-            yield f"data: {json.dumps({'stage': 'error', 'percent': 0, 'message': 'Empty file uploaded'})}\n\n"
+            yield sse_event({'stage': 'error', 'percent': 0, 'message': 'Empty file uploaded'})
         return StreamingResponse(error_stream(), media_type="text/event-stream")
     
-    subagents_list = [s.strip() for s in subagents.split(",") if s.strip()] if subagents else ["chat", "clinical"]
+    subagents_list = parse_subagents(subagents)
+    content = take_upload_file(file)
     
     async def progress_stream():
+        frames = None
         try:
-            indexing_service = get_indexing_service()
+            indexing_service = await run_in_threadpool(get_indexing_service)
             
-            for progress in indexing_service.process_and_index_file_with_progress(
+            frames = indexing_service.process_and_index_file_sse(
                 practice_id=practice_id,
                 filename=filename,
                 file_content=content,
                 title=title,
                 source_type=source_type or ext[1:],
-                subagents_allowed=subagents_list
-            ):
-                yield f"data: {json.dumps(progress)}\n\n"
+                subagents_allowed=subagents_list,
+                chunk_tokens=chunk_size,
+                overlap_tokens=chunk_overlap
+            )
+            # Extraction, chunking and embedding are blocking; step the
+            # generator on a worker thread so the event loop keeps serving.
+            # From here on iterate_indexing owns the upload: closing the
+            # generator (which deletes partial upserts) and the temp file
+            # happen on the pool once no step is still reading it.
+            async with contextlib.aclosing(iterate_indexing(frames, cleanup=content.close)) as steps:
+                async for frame in steps:
+                    yield frame
+                    if await request.is_disconnected():
+                        logger.info(f"Client left while indexing {filename}; stopping")
+                        break
                 
         except Exception as e:
-            yield f"data: {json.dumps({'stage': 'error', 'percent': 0, 'message': str(e)})}\n\n"
+            yield sse_event({'stage': 'error', 'percent': 0, 'message': str(e)})
+        finally:
+            if frames is None:
+                content.close()
     
     return StreamingResponse(progress_stream(), media_type="text/event-stream")
 
 
+@admin_portal_router.post(
+    "/practices/{practice_id}/documents/upload-async",
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Upload Document for Background Indexing",
+    description="Upload a file and index it in the background; poll /jobs/{job_id} for progress."
+)
+async def upload_document_async(
+    practice_id: str,
+    file: UploadFile = File(..., description="File to upload (PDF, DOCX, TXT, etc.)"),
+    title: Optional[str] = Form(None, description="Document title (defaults to filename)"),
+    source_type: Optional[str] = Form("pdf", description="Source type (pdf, doc, manual)"),
+    subagents: Optional[str] = Form("chat,clinical", description="Comma-separated list of agents"),
+    admin: AdminUser = Depends(require_admin)
+):
+    """
+    Queue a document for indexing and return its job id right away.
+    
+    The upload is spooled to a temp file and indexed on a background
+    worker, which records progress in indexing_jobs and saves the
+    documents row when done.
+    """
+    
+    filename = file.filename or "unnamed_file"
+    ext = file_extension(filename)
+    
+    if ext not in SUPPORTED_EXTENSIONS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported file type: {ext}. Supported: {SUPPORTED_EXTENSIONS_TEXT}"
+        )
+    
+    file_size = await check_upload(file, ext)
+    
+    if file_size == 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Empty file uploaded"
+        )
+    
+    subagents_list = parse_subagents(subagents)
+    content = take_upload_file(file)
+    
+    try:
+        job_id = await run_in_threadpool(create_indexing_job, practice_id, filename)
+    except Exception as e:
+        content.close()
+        logger.error(f"Failed to create indexing job: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to queue document: {str(e)}"
+        )
+    
+    # The worker closes (and so deletes) the temp file when it is done
+    submit_indexing_job(
+        job_id,
+        practice_id=practice_id,
+        filename=filename,
+        file_content=content,
+        title=title,
+        source_type=source_type or ext[1:],
+        subagents_allowed=subagents_list
+    )
+    
+    log_admin_action(
+        action="upload_document",
+        actor=admin.username,
+        practice_id=practice_id,
+        details={
+            "filename": filename,
+            "file_size": file_size,
+            "status": "queued",
+            "job_id": job_id
+        }
+    )
+    
+    return {"job_id": job_id, "status": "queued"}
+
+
+@admin_portal_router.get(
+    "/jobs/{job_id}",
+    response_model=IndexingJobResponse,
+    summary="Get Indexing Job",
+    description="Get the status and progress of a background indexing job."
+)
+async def get_indexing_job_status(
+    job_id: str,
+    admin: AdminUser = Depends(require_admin)
+):
+    """Get a background indexing job."""
+    
+    job = await run_in_threadpool(get_indexing_job, job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Indexing job {job_id} not found"
+        )
+    return job
+
+
+@admin_portal_router.get(
+    "/jobs/{job_id}/stream",
+    summary="Stream Indexing Job Progress",
+    description="Follow a background indexing job via Server-Sent Events."
+)
+async def stream_indexing_job(
+    job_id: str,
+    admin: AdminUser = Depends(require_admin)
+):
+    """
+    Poll the job row and send an SSE event whenever its progress changes,
+    until the job is indexed or failed.
+    """
+    
+    async def job_stream():
+        last = None
+        while True:
+            job = await run_in_threadpool(get_indexing_job, job_id)
+            if job is None:
+                yield sse_event({'stage': 'error', 'percent': 0, 'message': f'Indexing job {job_id} not found', 'error': True})
+                return
+            
+            current = (job["status"], job["percent"], job["message"])
+            if current != last:
+                last = current
+                event = {'stage': job["status"], 'percent': job["percent"], 'message': job["message"], 'doc_id': job["doc_id"]}
+                if job["status"] == "failed":
+                    event['error'] = True
+                yield sse_event(event)
+            
+            if job["status"] in ("indexed", "failed"):
+                return
+            await asyncio.sleep(JOB_POLL_SECONDS)
+    
+    return StreamingResponse(job_stream(), media_type="text/event-stream")
+
+
+@admin_portal_router.post(
+    "/practices/{practice_id}/documents/upload-batch",
+    summary="Upload and Index Multiple Documents",
+    description="Upload several files and index them into Pinecone in one pass."
+)
+async def upload_and_index_documents_batch(
+    practice_id: str,
+    background_tasks: BackgroundTasks,
+    files: List[UploadFile] = File(..., description="Files to upload (PDF, DOCX, TXT, etc.)"),
+    source_type: Optional[str] = Form(None, description="Source type (defaults to each file's extension)"),
+    subagents: Optional[str] = Form("chat,clinical", description="Comma-separated list of agents"),
+    admin: AdminUser = Depends(require_admin)
+):
+    """
+    Upload several document files and index them into Pinecone.
+    
+    Text extraction and chunking run in parallel worker processes; the
+    chunks of all files are embedded and uploaded together. Returns one
+    result per file.
+    """
+    
+    uploads = []
+    for file in files:
+        filename = file.filename or "unnamed_file"
+        ext = file_extension(filename)
+        
+        if ext not in SUPPORTED_EXTENSIONS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unsupported file type: {ext} ({filename}). Supported: {SUPPORTED_EXTENSIONS_TEXT}"
+            )
+        
+        # Starlette has already spooled the part; pass its file on instead
+        # of reading every upload into memory here. The files are only read
+        # before this handler returns, so they stay with the form.
+        if await check_upload(file, ext) == 0:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Empty file uploaded: {filename}"
+            )
+        
+        uploads.append((filename, file.file))
+    
+    subagents_list = parse_subagents(subagents)
+    
+    try:
+        indexing_service = await run_in_threadpool(get_indexing_service)
+    except ValueError as e:
+        logger.error(f"Indexing service initialization failed: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Indexing service not configured: {str(e)}"
+        )
+    
+    try:
+        results = await run_indexing(
+            indexing_service.batch_index_files,
+            practice_id=practice_id,
+            files=uploads,
+            source_type=source_type,
+            subagents_allowed=subagents_list,
+            persist=False
+        )
+    except Exception as e:
+        logger.error(f"Error during batch indexing: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Indexing failed: {str(e)}"
+        )
+    
+    # Save the documents rows after the response is sent (duplicates
+    # already have one)
+    for result in results:
+        if result.get("status") == "success" and not result.get("duplicate"):
+            background_tasks.add_task(
+                persist_document_record,
+                doc_id=result["doc_id"],
+                practice_id=practice_id,
+                title=result["title"],
+                source_type=source_type or file_extension(result["filename"])[1:],
+                source_uri=result["filename"],
+                chunk_count=result["chunk_count"],
+                subagents_allowed=subagents_list,
+                content_hash=result.get("content_hash")
+            )
+        
+        log_admin_action(
+            action="upload_document_deduped" if result.get("duplicate") else "upload_document",
+            actor=admin.username,
+            practice_id=practice_id,
+            doc_id=result.get("doc_id"),
+            details={
+                "filename": result.get("filename"),
+                "batch_size": len(uploads),
+                "status": result.get("status"),
+                "chunk_count": result.get("chunk_count", 0)
+            }
+        )
+    
+    return {"results": results}
+
+
 @admin_portal_router.post(
     "/practices/{practice_id}/documents/index-text",
     summary="Index Text Content",
@@ -575,19 +1057,22 @@ async def upload_and_index_document_stream(
 )
 async def index_text_content(
     practice_id: str,
+    background_tasks: BackgroundTasks,
     title: str = Form(..., description="Document title"),
     content: str = Form(..., description="Text content to index"),
     source_type: Optional[str] = Form("manual", description="Source type"),
     source_uri: Optional[str] = Form("manual-entry", description="Source URI"),
     subagents: Optional[str] = Form("chat,clinical", description="Comma-separated list of agents"),
+    use_batch_api: bool = Form(False, description="Embed via the OpenAI Batch API (half price, done within 24h)"),
     admin: AdminUser = Depends(require_admin)
 ):
     """
     Index raw text content directly.
     
     Use this for manual text entry or pasting content that doesn't need file extraction.
+    With use_batch_api the document is saved as pending and this returns 202;
+    it becomes indexed once its embedding batch completes.
     """
-    from src.admin_portal.indexing_service import get_indexing_service
     
     if len(content.strip()) < 50:
         raise HTTPException(
@@ -595,20 +1080,64 @@ async def index_text_content(
             detail="Content too short. Minimum 50 characters required."
         )
     
-    # Parse subagents
-    subagents_list = [s.strip() for s in subagents.split(",") if s.strip()] if subagents else ["chat", "clinical"]
+    subagents_list = parse_subagents(subagents)
+    
+    indexing_service = await run_in_threadpool(get_indexing_service)
     
-    indexing_service = get_indexing_service()
+    if use_batch_api:
+        result = await run_indexing(
+            indexing_service.submit_text_embedding_batch,
+            practice_id=practice_id,
+            title=title,
+            text_content=content,
+            source_type=source_type,
+            source_uri=source_uri,
+            subagents_allowed=subagents_list
+        )
+        log_admin_action(
+            action="index_text",
+            actor=admin.username,
+            practice_id=practice_id,
+            doc_id=result.get("doc_id"),
+            details={
+                "title": title,
+                "content_length": len(content),
+                "status": result.get("status"),
+                "batch_job_id": result.get("job_id")
+            }
+        )
+        if result.get("status") == "error":
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=result.get("message", "Failed to queue text for batch embedding")
+            )
+        return JSONResponse(status_code=status.HTTP_202_ACCEPTED, content=result)
     
-    result = indexing_service.index_text_content(
+    result = await run_indexing(
+        indexing_service.index_text_content,
         practice_id=practice_id,
         title=title,
         text_content=content,
         source_type=source_type,
         source_uri=source_uri,
-        subagents_allowed=subagents_list
+        subagents_allowed=subagents_list,
+        persist=False
     )
     
+    # Save the documents row after the response is sent
+    if result.get("status") == "success":
+        background_tasks.add_task(
+            persist_document_record,
+            doc_id=result["doc_id"],
+            practice_id=practice_id,
+            title=title,
+            source_type=source_type,
+            source_uri=source_uri,
+            chunk_count=result["chunk_count"],
+            subagents_allowed=subagents_list,
+            content_hash=result.get("content_hash")
+        )
+    
     log_admin_action(
         action="index_text",
         actor=admin.username,
@@ -640,10 +1169,9 @@ async def get_index_stats(
     admin: AdminUser = Depends(require_admin)
 ):
     """Get Pinecone index statistics for a practice namespace."""
-    from src.admin_portal.indexing_service import get_indexing_service
     
-    indexing_service = get_indexing_service()
-    result = indexing_service.get_index_stats(practice_id)
+    indexing_service = await run_in_threadpool(get_indexing_service)
+    result = await run_in_threadpool(indexing_service.get_index_stats, practice_id)
     
     return result
 
@@ -659,10 +1187,9 @@ async def delete_document_vectors(
     admin: AdminUser = Depends(require_admin)
 ):
     """Delete all vectors for a document from Pinecone."""
-    from src.admin_portal.indexing_service import get_indexing_service
 
-    indexing_service = get_indexing_service()
-    result = indexing_service.delete_document(practice_id, doc_id)
+    indexing_service = await run_in_threadpool(get_indexing_service)
+    result = await run_in_threadpool(indexing_service.delete_document, practice_id, doc_id)
 
     log_admin_action(
         action="delete_vectors",
@@ -687,73 +1214,64 @@ async def delete_document_vectors(
 
 @admin_portal_router.get(
     "/practices/{practice_id}/clinical-config",
-    response_model=ClinicalConfigResponse,
+    response_class=Response,
+    responses={200: {"model": ClinicalConfigResponse}},
     summary="Get Clinical Advisor Config",
     description="Get the clinical advisor configuration for a practice."
 )
 async def get_clinical_config(
-    practice_id: str,
+    practice_id: UUID,
     admin: AdminUser = Depends(require_admin),
     db: Session = Depends(get_db)
 ):
     """
     Get the clinical advisor configuration from the practice profile.
+
+    The stored config was validated as a ClinicalAdvisorConfig when it was
+    written, so it is serialized straight from profile_json with orjson
+    rather than rebuilt as nested models (ClinicalConfigResponse still
+    documents the shape).
     """
-    from uuid import UUID
     from src.models.models import Client, PracticeProfile
 
-    # Get client info
-    try:
-        client_uuid = UUID(practice_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid practice ID format"
-        )
-
-    client = db.query(Client).filter(Client.client_id == client_uuid).first()
-    if not client:
+    # Practice name and profile (if any) in one round trip
+    row = db.execute(
+        select(Client.clinic_name, PracticeProfile.profile_json, PracticeProfile.updated_at)
+        .outerjoin(PracticeProfile, PracticeProfile.practice_id == Client.client_id)
+        .where(Client.client_id == practice_id)
+    ).first()
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Practice not found"
         )
 
-    # Get practice profile
-    profile = db.query(PracticeProfile).filter(
-        PracticeProfile.practice_id == client_uuid
-    ).first()
-
     config = None
     profile_version = 0
     updated_at = None
 
-    if profile and profile.profile_json:
-        profile_json = profile.profile_json
-        config_dict = profile_json.get("clinical_advisor_config")
+    if row.profile_json:
+        profile_json = row.profile_json
+        config = profile_json.get("clinical_advisor_config") or None
         profile_version = profile_json.get("clinical_advisor_profile_version", 0)
-        updated_at = profile.updated_at
-
-        if config_dict:
-            # Convert dict to Pydantic model
-            try:
-                config = ClinicalAdvisorConfig(**config_dict)
-            except Exception as e:
-                logger.warning(f"Failed to parse clinical config: {e}")
-                config = None
+        updated_at = row.updated_at
 
     log_admin_action(
         action="view_clinical_config",
         actor=admin.username,
-        practice_id=practice_id,
+        practice_id=str(practice_id),
         details={"has_config": config is not None}
     )
 
-    return ClinicalConfigResponse(
-        practice_id=practice_id,
-        practice_name=client.clinic_name,
-        config=config,
-        profile_version=profile_version,
-        updated_at=updated_at
+    return Response(
+        content=orjson.dumps({
+            "practice_id": str(practice_id),
+            "practice_name": row.clinic_name,
+            "config": config,
+            "profile_version": profile_version,
+            "updated_at": updated_at,
+        }),
+        media_type="application/json"
     )
 
 
@@ -764,7 +1282,7 @@ async def get_clinical_config(
     description="Create or update the clinical advisor configuration for a practice."
 )
 async def update_clinical_config(
-    practice_id: str,
+    practice_id: UUID,
     request: ClinicalConfigUpdateRequest,
     admin: AdminUser = Depends(require_admin),
     db: Session = Depends(get_db)
@@ -776,61 +1294,50 @@ async def update_clinical_config(
     1. Store the config in practice_profiles.profile_json.clinical_advisor_config
     2. Bump the profile version
     """
-    from uuid import UUID
-    from src.models.models import Client, PracticeProfile
+    from src.models.models import PracticeProfile
     import datetime
 
-    # Validate practice ID
+    # Store the full config with JSON-native values (enums as strings).
+    # Default-valued sections are kept too: the admin UI fills its form
+    # from whatever is stored.
+    config_dict = request.config.model_dump(mode="json")
+
+    # Create the profile, or patch just the two clinical advisor keys of
+    # the existing profile_json (|| merges at the top level) and bump the
+    # version in the same statement
+    now = datetime.datetime.utcnow()
+    stored_version = PracticeProfile.profile_json["clinical_advisor_profile_version"].astext
+    stmt = pg_insert(PracticeProfile).values(
+        practice_id=practice_id,
+        profile_json={"clinical_advisor_config": config_dict, "clinical_advisor_profile_version": 1},
+        updated_at=now,
+    ).on_conflict_do_update(
+        index_elements=[PracticeProfile.practice_id],
+        set_={
+            "profile_json": PracticeProfile.profile_json.op("||")(func.jsonb_build_object(
+                "clinical_advisor_config", cast(config_dict, JSONB),
+                "clinical_advisor_profile_version", func.coalesce(cast(stored_version, Integer), 0) + 1,
+            )),
+            "updated_at": now,
+        },
+    ).returning(cast(stored_version, Integer))
+
+    # A missing practice surfaces as the profile's foreign key violation,
+    # which saves a separate existence check
     try:
-        client_uuid = UUID(practice_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid practice ID format"
-        )
-
-    # Get client
-    client = db.query(Client).filter(Client.client_id == client_uuid).first()
-    if not client:
+        new_version = db.execute(stmt).scalar_one()
+        db.commit()
+    except IntegrityError:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Practice not found"
         )
 
-    # Get or create practice profile
-    profile = db.query(PracticeProfile).filter(
-        PracticeProfile.practice_id == client_uuid
-    ).first()
-
-    if not profile:
-        profile = PracticeProfile(
-            practice_id=client_uuid,
-            profile_json={}
-        )
-        db.add(profile)
-
-    # Convert Pydantic model to dict
-    config_dict = request.config.model_dump(exclude_none=False)
-
-    # Get current version and increment
-    current_version = (profile.profile_json or {}).get("clinical_advisor_profile_version", 0)
-    new_version = current_version + 1
-
-    # Update profile_json
-    profile_json = profile.profile_json or {}
-    profile_json["clinical_advisor_config"] = config_dict
-    profile_json["clinical_advisor_profile_version"] = new_version
-
-    profile.profile_json = profile_json
-    profile.updated_at = datetime.datetime.utcnow()
-
-    db.commit()
-    db.refresh(profile)
-
     log_admin_action(
         action="update_clinical_config",
         actor=admin.username,
-        practice_id=practice_id,
+        practice_id=str(practice_id),
         details={
             "new_version": new_version,
             "primary_bias": config_dict.get("philosophy", {}).get("primary_bias")
@@ -840,7 +1347,7 @@ async def update_clinical_config(
     return ClinicalConfigUpdateResponse(
         status="success",
         message="Clinical advisor configuration updated successfully",
-        practice_id=practice_id,
+        practice_id=str(practice_id),
         profile_version=new_version
     )
 
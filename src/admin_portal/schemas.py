@@ -131,6 +131,18 @@ class ReindexResponse(BaseModel):
     job_id: Optional[str] = None
 
 
+class IndexingJobResponse(BaseModel):
+    job_id: str
+    practice_id: str
+    doc_id: Optional[str] = None
+    filename: str
+    status: str
+    percent: int
+    message: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
 # =============================================================================
 # Health Schemas
 # =============================================================================
@@ -22,9 +22,33 @@ if "${" in _raw_database_url or not _raw_database_url:
 else:
     DATABASE_URL = _raw_database_url
 
+# Connection pool per API process: sync endpoints, indexing workers and the
+# audit writer each check out a connection, which outgrows SQLAlchemy's
+# default 5 + 10 under upload bursts
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 PINECONE_API_KEY = os.getenv("PINECONE_API_KEY")
 PINECONE_INDEX_NAME = os.getenv("PINECONE_INDEX_NAME", "robeck-dental-v2")
+
+# Embedding requests made while indexing: inputs per request (the API
+# accepts at most 2048) and how many requests run concurrently
+EMBED_BATCH_SIZE = min(int(os.getenv("EMBED_BATCH_SIZE", "1000")), 2048)
+EMBED_MAX_CONCURRENCY = int(os.getenv("EMBED_MAX_CONCURRENCY", "8"))
+
+# Pinecone upserts: vectors per request (Pinecone caps requests at 2MB, so
+# stay around 100 for 1536-dim vectors) and requests in flight at once
+UPSERT_BATCH_SIZE = int(os.getenv("UPSERT_BATCH_SIZE", "100"))
+UPSERT_MAX_INFLIGHT = int(os.getenv("UPSERT_MAX_INFLIGHT", "8"))
+
+# Admin uploads / text indexing running at once in one API process
+INDEX_WORKERS = int(os.getenv("INDEX_WORKERS", "4"))
+
+# Upsert vectors as per-vector int8 levels (whole numbers in -127..127, with
+# the scale kept in metadata) instead of raw float32. Only for cosine
+# indexes, where the scale does not change similarity; off by default.
+PINECONE_INT8_VECTORS = os.getenv("PINECONE_INT8_VECTORS", "false").lower() in ("1", "true", "yes")
 ALLOWED_ORIGINS = os.getenv("ALLOWED_ORIGINS", 
                             "http://localhost:3000," \
                             "https://api.methodpro.com," \
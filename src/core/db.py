@@ -1,6 +1,6 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-from src.core.config import DATABASE_URL
+from src.core.config import DATABASE_URL, DB_MAX_OVERFLOW, DB_POOL_SIZE
 import time
 import logging
 from sqlalchemy.exc import OperationalError
@@ -25,6 +25,8 @@ def _init_engine_and_session():
                 "keepalives_count": 5,  # Number of keepalives before connection considered dead
                 "options": "-c statement_timeout=300000"  # 5 minutes statement timeout (milliseconds)
             },
+            pool_size=DB_POOL_SIZE,  # Connections kept open
+            max_overflow=DB_MAX_OVERFLOW,  # Extra connections allowed under bursts
             pool_pre_ping=True,  # Verify connections before using them
             pool_recycle=3600,  # Recycle connections after 1 hour
         )
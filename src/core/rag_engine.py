@@ -21,6 +21,7 @@ RAG_TIMEOUT_SECONDS = 10  # Timeout for Pinecone queries
 
 # Initialize Pinecone client (with error handling)
 _pinecone_client: Optional[pinecone.Pinecone] = None
+_pinecone_index = None
 _embeddings: Optional[OpenAIEmbeddings] = None
 
 
@@ -44,6 +45,36 @@ def _get_pinecone_client() -> Optional[pinecone.Pinecone]:
         return None
 
 
+def get_pinecone_index():
+    """
+    Get or resolve the Pinecone index handle.
+
+    pc.Index() looks up the index host on every call, so the handle (and
+    its keep-alive connection pool) is kept for all queries, and shared with
+    the admin portal's index stats.
+    """
+    global _pinecone_index
+
+    if _pinecone_index is not None:
+        return _pinecone_index
+
+    pc = _get_pinecone_client()
+    if pc is None:
+        logger.warning("Pinecone client unavailable, skipping RAG retrieval")
+        return None
+
+    if not PINECONE_INDEX_NAME:
+        logger.error("PINECONE_INDEX_NAME not configured")
+        return None
+
+    try:
+        _pinecone_index = pc.Index(PINECONE_INDEX_NAME)
+        return _pinecone_index
+    except Exception as e:
+        logger.error(f"Failed to open Pinecone index: {e}")
+        return None
+
+
 def _get_embeddings() -> Optional[OpenAIEmbeddings]:
     """Get or initialize the OpenAI embeddings with error handling."""
     global _embeddings
@@ -87,10 +118,9 @@ def get_relevant_context(query: str, client_id: str) -> str:
         logger.warning("No client_id provided to RAG engine")
         return ""
 
-    # Get Pinecone client
-    pc = _get_pinecone_client()
-    if pc is None:
-        logger.warning("Pinecone client unavailable, skipping RAG retrieval")
+    # Get the index
+    index = get_pinecone_index()
+    if index is None:
         return ""
 
     # Get embeddings
@@ -100,13 +130,6 @@ def get_relevant_context(query: str, client_id: str) -> str:
         return ""
 
     try:
-        # Get the index
-        if not PINECONE_INDEX_NAME:
-            logger.error("PINECONE_INDEX_NAME not configured")
-            return ""
-
-        index = pc.Index(PINECONE_INDEX_NAME)
-
         # Generate query embedding
         try:
             query_vector = embeddings.embed_query(query)
@@ -5,16 +5,25 @@ from src.api.chat import router as chat_router
 from src.api.admin import admin_router
 from src.api.clinical import router as clinical_router
 from src.api.reporting import router as reporting_router
-from src.admin_portal.router import admin_portal_router
+from src.admin_portal.router import (
+    admin_portal_router,
+    upload_exceeds_size_limit,
+    MAX_FILE_SIZE,
+    STATIC_DIR as ADMIN_STATIC_DIR,
+    AdminStaticFiles,
+)
 from fastapi.middleware.cors import CORSMiddleware
 from src.core.config import ALLOWED_ORIGINS
 from src.core.logging_config import setup_logging
 from fastapi.responses import FileResponse
 from src.models.models import Conversation
 import os
+import asyncio
+import logging
 from pathlib import Path
 
 setup_logging()
+logger = logging.getLogger(__name__)
 
 app = FastAPI(title="Dental Chatbot API")
 
@@ -26,6 +35,16 @@ app.add_middleware(
       allow_headers=["*"],
   )
 
+@app.middleware("http")
+async def reject_oversized_uploads(request: Request, call_next):
+    """Refuse oversized document uploads from Content-Length, before the body is read."""
+    if upload_exceeds_size_limit(request):
+        return JSONResponse(
+            status_code=413,
+            content={"detail": f"File too large. Maximum size: {MAX_FILE_SIZE / (1024*1024)}MB"}
+        )
+    return await call_next(request)
+
 @app.exception_handler(Exception)
 async def cors_exception_handler(request: Request, exc: Exception):
     """Ensure CORS headers are included even on 500 errors"""
@@ -45,6 +64,11 @@ app.include_router(clinical_router, prefix="/api/clinical", tags=["Clinical Advi
 app.include_router(reporting_router, prefix="/api/ahsuite", tags=["Reporting Dashboard"])
 app.include_router(admin_portal_router, prefix="/admin", tags=["Admin Portal"])
 
+# Admin portal UI: index.html at /admin/, plus styles.css and app.js. Mounted
+# after the router so /admin API routes match first.
+if ADMIN_STATIC_DIR.exists():
+    app.mount("/admin", AdminStaticFiles(directory=str(ADMIN_STATIC_DIR), html=True), name="admin")
+
 # Mount static files for frontends
 BASE_DIR = Path(__file__).parent.parent
 FRONTENDS_DIR = BASE_DIR / "frontends"
@@ -77,12 +101,39 @@ def view_logs():
     return HTMLResponse(f"<pre>{logs}</pre>")
 
 from src.core.db import get_db, wait_for_db
+from src.admin_portal.services import close_health_client, ensure_audit_log_partitions, flush_audit_log
+from src.admin_portal.indexing_service import (
+    close_batch_index_pool,
+    close_indexing_service,
+    start_batch_index_pool,
+    start_embedding_batch_poller,
+)
 
 
 @app.on_event("startup")
 def on_startup():
     # wait for DB to be ready before serving requests
     wait_for_db(retries=10, delay=1.0)
+    try:
+        ensure_audit_log_partitions()
+    except Exception as e:
+        logger.warning(f"Could not ensure audit_logs partitions: {e}")
+    # finish text documents whose embeddings went through the Batch API
+    start_embedding_batch_poller()
+    # worker processes for multi-file uploads (spawned, never forked)
+    start_batch_index_pool()
+
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    # write out audit entries still queued for the database (blocking, so
+    # off the event loop)
+    await asyncio.to_thread(flush_audit_log)
+    # close pooled connections (the indexing service's OpenAI clients, the
+    # health checks' HTTP client) and stop the upload worker processes
+    close_indexing_service()
+    await close_health_client()
+    close_batch_index_pool()
 
 @app.get("/test-webhook")
 async def test_webhook(client_id: str):
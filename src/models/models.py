@@ -1,7 +1,9 @@
-from sqlalchemy import create_engine, Column, String, DateTime, JSON, ForeignKey, BigInteger, Integer, Boolean
+from sqlalchemy import create_engine, Column, String, DateTime, JSON, ForeignKey, BigInteger, Integer, Boolean, Index, text, CHAR, Text, LargeBinary, Float
 from sqlalchemy.orm import declarative_base, sessionmaker
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
+import os
+import time
 import uuid
 import datetime
 
@@ -17,6 +19,19 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 from sqlalchemy.orm import declarative_base
 Base = declarative_base() 
 
+
+def uuid7() -> uuid.UUID:
+    """
+    Time-ordered UUID (RFC 9562 version 7).
+
+    48-bit unix-ms timestamp followed by random bits, so keys generated in
+    Python sort the same way as the gen_uuid_v7() server default.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
 class Client(Base):
     __tablename__ = 'clients'
     client_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -104,7 +119,7 @@ class Document(Base):
     """Tracks documents indexed into Pinecone for each practice"""
     __tablename__ = 'documents'
 
-    doc_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    doc_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text('gen_uuid_v7()'))
     client_id = Column(UUID(as_uuid=True), ForeignKey('clients.client_id'), nullable=False)
     title = Column(String(500), nullable=False)
     source_type = Column(String(50), nullable=False)  # 'pdf', 'docx', 'url', 'text'
@@ -112,7 +127,10 @@ class Document(Base):
     status = Column(String(20), nullable=False, default='pending')  # pending, processing, indexed, failed
     chunk_count = Column(Integer, nullable=False, default=0)
     error_message = Column(String, nullable=True)
-    subagents_allowed = Column(JSON, default=['chat', 'clinical'])  # Which agents can access this doc
+    subagents_allowed = Column(JSONB, default=['chat', 'clinical'])  # Which agents can access this doc
+    content_hash = Column(String(64), nullable=True)  # SHA-256 hex of the uploaded bytes (or text)
+    batch_job_id = Column(String(64), nullable=True)  # OpenAI Batch API job embedding this doc, while status is pending
+    batch_attempts = Column(Integer, nullable=False, default=0, server_default=text('0'))  # failed tries at completing that batch
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
     last_indexed_at = Column(DateTime, nullable=True)
@@ -120,13 +138,21 @@ class Document(Base):
     # Relationship
     client = relationship("Client", backref="documents")
 
+    __table_args__ = (
+        # Covering index for "documents for practice X with status Y" listings
+        Index('ix_documents_client_status', 'client_id', 'status', postgresql_include=['title', 'updated_at']),
+        # Duplicate-upload lookup (find_indexed_duplicates) by content hash
+        Index('ix_documents_client_content_hash_indexed', 'client_id', 'content_hash',
+              postgresql_where=text("status = 'indexed'")),
+    )
+
 
 class AdminUser(Base):
     """Admin portal users with role-based access"""
     __tablename__ = 'admin_users'
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
-    username = Column(String(100), nullable=False, unique=True, index=True)
+    username = Column(String(100), nullable=False, unique=True)
     password_hash = Column(String(255), nullable=False)
     email = Column(String(255), nullable=True)
     role = Column(String(50), nullable=False, default='admin')  # admin, superadmin, viewer
@@ -134,19 +160,59 @@ class AdminUser(Base):
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
     last_login_at = Column(DateTime, nullable=True)
 
+    __table_args__ = (
+        # Logins only ever look up active users
+        Index('ix_admin_users_username_active', 'username', postgresql_where=text('is_active = true')),
+    )
+
 
 class AuditLog(Base):
     """Audit trail for all admin portal actions"""
     __tablename__ = 'audit_logs'
 
+    # Partitioned by month on created_at, so the PK is (id, created_at)
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     actor = Column(String(100), nullable=False)  # Username of admin who performed action
     action = Column(String(100), nullable=False)  # e.g., 'create_practice', 'index_document', 'delete_document'
     practice_id = Column(UUID(as_uuid=True), nullable=True)  # Related practice if applicable
     doc_id = Column(UUID(as_uuid=True), nullable=True)  # Related document if applicable
     result = Column(String(20), nullable=False, default='success')  # success, failure
-    details = Column(JSON, nullable=True)  # Additional context (file names, error messages, etc.)
-    created_at = Column(DateTime, default=datetime.datetime.utcnow, index=True)
+    details = Column(JSONB, nullable=True)  # Additional context (file names, error messages, etc.)
+    created_at = Column(DateTime, primary_key=True, nullable=False, default=datetime.datetime.utcnow)
+
+    __table_args__ = (
+        # One composite B-tree + a BRIN keeps per-INSERT index maintenance low
+        Index('ix_audit_logs_actor_action_time', 'actor', 'action', created_at.desc()),
+        Index('ix_audit_logs_created_at_brin', 'created_at', postgresql_using='brin'),
+        Index('ix_audit_logs_details_gin', 'details', postgresql_using='gin'),
+        {'postgresql_partition_by': 'RANGE (created_at)'},
+    )
+
+
+class IndexingJob(Base):
+    """Status of an upload being indexed in the background"""
+    __tablename__ = 'indexing_jobs'
+
+    job_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text('gen_uuid_v7()'))
+    client_id = Column(UUID(as_uuid=True), ForeignKey('clients.client_id'), nullable=False, index=True)
+    doc_id = Column(UUID(as_uuid=True), nullable=True)  # Set once the document is indexed
+    filename = Column(String(500), nullable=False)
+    status = Column(String(20), nullable=False, default='queued')  # queued, processing, indexed, failed
+    percent = Column(Integer, nullable=False, default=0)
+    message = Column(String, nullable=True)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
+
+
+class EmbeddingCache(Base):
+    """Embedding vectors keyed by SHA-256 of the chunk text, so unchanged chunks are not re-embedded"""
+    __tablename__ = 'embedding_cache'
+
+    hash = Column(CHAR(64), primary_key=True)  # SHA-256 hex of the chunk text
+    model = Column(Text, primary_key=True)  # Embedding model name
+    vector = Column(LargeBinary, nullable=False)  # int8 (float32 little-endian when scale is NULL)
+    scale = Column(Float, nullable=True)  # int8 dequantization factor
+    created_at = Column(DateTime, default=datetime.datetime.utcnow)
 
 
 # ===================== Clinical Session Models =====================
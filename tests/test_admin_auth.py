@@ -0,0 +1,94 @@
+import sys
+import os
+import asyncio
+import hashlib
+import time
+from datetime import timedelta
+
+# Ensure project root is on sys.path so `src` package can be imported when running tests
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import jwt
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from src.admin_portal import auth
+from src.admin_portal.auth import (
+    SECRET_KEY,
+    create_access_token,
+    decode_access_token,
+    get_password_hash,
+    require_admin,
+    verify_password,
+)
+
+
+def test_decode_round_trips_created_token():
+    token = create_access_token({"sub": "alice", "role": "admin"})
+    payload = decode_access_token(token)
+    assert payload["sub"] == "alice"
+    assert payload["role"] == "admin"
+    assert isinstance(payload["exp"], int)
+
+
+def test_decode_rejects_tampered_payload():
+    token = create_access_token({"sub": "alice", "role": "viewer"})
+    header, _, signature = token.split(".")
+    forged = create_access_token({"sub": "alice", "role": "superadmin"}).split(".")[1]
+    assert decode_access_token(f"{header}.{forged}.{signature}") is None
+
+
+def test_decode_rejects_expired_token():
+    token = create_access_token({"sub": "alice", "role": "admin"}, expires_delta=timedelta(seconds=-1))
+    assert decode_access_token(token) is None
+
+
+def test_decode_rejects_other_algorithms_and_garbage():
+    hs512 = jwt.encode({"sub": "alice", "role": "admin"}, SECRET_KEY, algorithm="HS512")
+    assert decode_access_token(hs512) is None
+    assert decode_access_token("not-a-token") is None
+    assert decode_access_token("a.b.c") is None
+
+
+def test_decode_requires_exp_and_honours_nbf():
+    no_exp = jwt.encode({"sub": "alice", "role": "admin"}, SECRET_KEY, algorithm="HS256")
+    assert decode_access_token(no_exp) is None
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=no_exp)
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(require_admin(credentials))
+    assert exc_info.value.status_code == 401
+
+    exp = int(time.time()) + 600
+    early = jwt.encode(
+        {"sub": "alice", "role": "admin", "exp": exp, "nbf": exp - 60}, SECRET_KEY, algorithm="HS256"
+    )
+    assert decode_access_token(early) is None
+    future_iat = jwt.encode(
+        {"sub": "alice", "role": "admin", "exp": exp, "iat": exp - 60}, SECRET_KEY, algorithm="HS256"
+    )
+    assert decode_access_token(future_iat) is None
+
+
+def test_require_admin_caches_principal_per_token(monkeypatch):
+    token = create_access_token({"sub": "alice", "role": "admin"})
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+    assert asyncio.run(require_admin(credentials)).username == "alice"
+
+    def fail(_token):
+        raise AssertionError("token decoded twice")
+
+    monkeypatch.setattr(auth, "decode_access_token", fail)
+    assert asyncio.run(require_admin(credentials)).username == "alice"
+
+def test_password_cache_does_not_hold_plain_digests():
+    hashed = get_password_hash("hunter22")
+    assert verify_password("hunter22", hashed)
+    assert not verify_password("wrong", hashed)
+
+    digest = hashlib.sha256(b"hunter22").digest()
+    keys = [k for k in auth._password_cache if k[1] == hashed]
+    assert len(keys) == 1
+    assert keys[0][0] != digest
+    # Cached hit still answers without bcrypt
+    assert verify_password("hunter22", hashed)
@@ -0,0 +1,107 @@
+import sys
+import os
+import queue
+from types import SimpleNamespace
+
+# Ensure project root is on sys.path so `src` package can be imported when running tests
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.admin_portal import services
+
+
+class RecordingSession:
+    def __init__(self, scalar=None):
+        self.statements = []
+        self.commits = 0
+        self.closed = False
+        self.scalar_value = scalar
+
+    def execute(self, stmt, params=None):
+        self.statements.append((stmt, params))
+        return SimpleNamespace(scalar=lambda: self.scalar_value)
+
+    def commit(self):
+        self.commits += 1
+
+    def close(self):
+        self.closed = True
+
+
+def test_bulk_insert_audit_writes_batches_with_one_commit_each(monkeypatch):
+    session = RecordingSession()
+    monkeypatch.setattr(services, "SessionLocal", lambda: session)
+    rows = [{"actor": "alice", "action": f"a{i}"} for i in range(services.AUDIT_INSERT_BATCH_SIZE * 2 + 5)]
+
+    services.bulk_insert_audit(rows)
+
+    assert [len(params) for _, params in session.statements] == [
+        services.AUDIT_INSERT_BATCH_SIZE, services.AUDIT_INSERT_BATCH_SIZE, 5
+    ]
+    assert session.commits == 3 and session.closed
+
+
+def test_drain_audit_queue_takes_at_most_one_batch(monkeypatch):
+    pending = queue.Queue()
+    for i in range(services.AUDIT_INSERT_BATCH_SIZE + 3):
+        pending.put_nowait({"action": f"a{i}"})
+    monkeypatch.setattr(services, "_audit_queue", pending)
+
+    assert len(services._drain_audit_queue(timeout=0)) == services.AUDIT_INSERT_BATCH_SIZE
+    assert len(services._drain_audit_queue(timeout=0)) == 3
+    assert services._drain_audit_queue(timeout=0) == []
+
+def test_audit_partitions_cover_this_and_next_month(monkeypatch):
+    session = RecordingSession()
+    monkeypatch.setattr(services, "SessionLocal", lambda: session)
+
+    services.ensure_audit_log_partitions()
+
+    sql = str(session.statements[0][0])
+    assert sql.count("create_audit_logs_partition(") == 2
+    assert "interval '1 month'" in sql
+    assert session.commits == 1 and session.closed
+
+
+def test_audit_log_count_is_estimated_from_partition_stats():
+    session = RecordingSession(scalar=1234.0)
+    assert services.estimate_audit_log_count(session) == 1234
+    assert "pg_inherits" in str(session.statements[0][0])
+
+
+def test_full_audit_queue_hands_rows_to_the_overflow(monkeypatch):
+    full = queue.Queue(maxsize=1)
+    full.put_nowait({})
+
+    def inline_insert(rows):
+        raise AssertionError("audit row written on the caller's thread")
+
+    monkeypatch.setattr(services, "_audit_queue", full)
+    monkeypatch.setattr(services, "_ensure_audit_writer", lambda: None)
+    monkeypatch.setattr(services, "bulk_insert_audit", inline_insert)
+    dropped = services.audit_entries_dropped()
+
+    services.log_admin_action(action="view_documents", actor="alice")
+    assert full.get_nowait() == {}
+
+    # Once the writer makes room, the overflow row lands in the queue
+    services._audit_overflow.submit(lambda: None).result(timeout=5)
+    assert full.get_nowait()["action"] == "view_documents"
+    assert services.audit_entries_dropped() == dropped
+
+
+def test_failed_audit_insert_is_counted_as_dropped(monkeypatch):
+    pending = queue.Queue()
+    batch = [{"action": "a"}, {"action": "b"}]
+    for row in batch:
+        pending.put_nowait(row)
+
+    def failing_insert(rows):
+        raise ConnectionError("database down")
+
+    monkeypatch.setattr(services, "_audit_queue", pending)
+    monkeypatch.setattr(services, "bulk_insert_audit", failing_insert)
+    dropped = services.audit_entries_dropped()
+
+    services._write_audit_batch(services._drain_audit_queue(timeout=0))
+    assert services.audit_entries_dropped() == dropped + 2
+    pending.join()
@@ -0,0 +1,48 @@
+import sys
+import os
+
+# Ensure project root is on sys.path so `src` package can be imported when running tests
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.admin_portal.indexing_service import semantic_breakpoints, simple_chunk_text, window_starts
+
+
+def test_short_text_is_single_chunk():
+    assert simple_chunk_text("hello world", chunk_size=800) == ["hello world"]
+
+
+def test_prefers_paragraph_break_over_later_sentence_break():
+    text = ("a" * 60) + ".\n\n" + ("b" * 20) + ". " + ("c" * 200)
+    chunks = simple_chunk_text(text, chunk_size=100, overlap=10)
+    assert chunks[0] == ("a" * 60) + "."
+
+
+def test_breaks_at_last_sentence_in_window():
+    text = ("a" * 55) + "! " + ("b" * 20) + "? " + ("c" * 200)
+    chunks = simple_chunk_text(text, chunk_size=100, overlap=10)
+    assert chunks[0] == ("a" * 55) + "! " + ("b" * 20) + "?"
+
+
+def test_chunks_cover_the_whole_text():
+    text = " ".join(f"Sentence number {i} ends here." for i in range(300))
+    chunks = simple_chunk_text(text, chunk_size=200, overlap=20)
+    assert chunks[0].startswith("Sentence number 0 ")
+    assert chunks[-1].endswith("Sentence number 299 ends here.")
+    assert all(len(c) <= 200 for c in chunks)
+
+
+def test_last_chunk_tail_is_not_repeated():
+    text = "x" * 250
+    chunks = simple_chunk_text(text, chunk_size=100, overlap=10)
+    assert chunks == ["x" * 100, "x" * 100, "x" * 70]
+
+
+def test_semantic_breakpoints_split_at_topic_change():
+    vectors = [[1.0, 0.0]] * 5 + [[0.0, 1.0]] * 5
+    assert semantic_breakpoints(vectors) == [4]
+
+
+def test_window_starts_cover_the_tail():
+    assert window_starts(500, 800, 600).tolist() == [0]
+    assert window_starts(2000, 800, 600).tolist() == [0, 600, 1200]
+    assert window_starts(2100, 800, 600).tolist() == [0, 600, 1200, 1300]
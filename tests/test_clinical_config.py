@@ -0,0 +1,88 @@
+import sys
+import os
+import asyncio
+import uuid
+
+# Ensure project root is on sys.path so `src` package can be imported when running tests
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+
+from src.admin_portal import router
+from src.admin_portal.auth import AdminUser
+from src.admin_portal.schemas import ClinicalAdvisorConfig, ClinicalConfigUpdateRequest
+
+ADMIN = AdminUser(username="alice", role="admin")
+
+
+class FakeResult:
+    def __init__(self, row=None, scalar=None):
+        self.row = row
+        self.scalar = scalar
+
+    def first(self):
+        return self.row
+
+    def scalar_one(self):
+        return self.scalar
+
+
+class FakeSession:
+    def __init__(self, result):
+        self.result = result
+        self.statements = []
+        self.commits = 0
+
+    def execute(self, stmt, *args):
+        self.statements.append(stmt)
+        return self.result
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+
+def test_clinical_config_upsert_merges_into_profile_and_bumps_version(monkeypatch):
+    monkeypatch.setattr(router, "log_admin_action", lambda **kwargs: None)
+    db = FakeSession(FakeResult(scalar=4))
+    request = ClinicalConfigUpdateRequest.model_validate({"config": {}})
+
+    response = asyncio.run(router.update_clinical_config(uuid.uuid4(), request, ADMIN, db))
+
+    sql = str(db.statements[0].compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (practice_id) DO UPDATE" in sql
+    assert "practice_profiles.profile_json || jsonb_build_object(" in sql
+    assert "RETURNING" in sql
+    assert response.profile_version == 4
+    assert db.commits == 1
+
+
+def test_clinical_config_for_unknown_practice_is_404(monkeypatch):
+    monkeypatch.setattr(router, "log_admin_action", lambda **kwargs: None)
+
+    class MissingPracticeSession(FakeSession):
+        def execute(self, stmt, *args):
+            raise IntegrityError("INSERT", {}, Exception("violates foreign key constraint"))
+
+    request = ClinicalConfigUpdateRequest.model_validate({"config": {}})
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(router.update_clinical_config(uuid.uuid4(), request, ADMIN, MissingPracticeSession(None)))
+    assert exc_info.value.status_code == 404
+
+
+def test_clinical_config_is_stored_in_full_as_json_values(monkeypatch):
+    monkeypatch.setattr(router, "log_admin_action", lambda **kwargs: None)
+    db = FakeSession(FakeResult(scalar=1))
+    request = ClinicalConfigUpdateRequest.model_validate({"config": {"additional_notes": "n"}})
+
+    asyncio.run(router.update_clinical_config(uuid.uuid4(), request, ADMIN, db))
+
+    params = db.statements[0].compile(dialect=postgresql.dialect()).params
+    stored = params["profile_json"]["clinical_advisor_config"]
+    assert stored == {**ClinicalAdvisorConfig().model_dump(mode="json"), "additional_notes": "n"}
+    assert type(stored["philosophy"]["primary_bias"]) is str
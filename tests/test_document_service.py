@@ -0,0 +1,99 @@
+import sys
+import os
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+
+# Ensure project root is on sys.path so `src` package can be imported when running tests
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy.dialects import postgresql
+
+from src.admin_portal import services
+from src.admin_portal.schemas import SourceType
+from src.admin_portal.services import DocumentService
+
+PRACTICE_ID = str(uuid.uuid4())
+
+
+class FakeResult:
+    def __init__(self, rows=(), scalar=None):
+        self.rows = list(rows)
+        self.scalar = scalar
+
+    def all(self):
+        return self.rows
+
+    def scalar_one(self):
+        return self.scalar
+
+    def scalar_one_or_none(self):
+        return self.scalar
+
+
+class FakeSession:
+    def __init__(self, *results):
+        self.results = list(results)
+        self.statements = []
+        self.commits = 0
+
+    def execute(self, stmt):
+        self.statements.append(stmt)
+        return self.results.pop(0)
+
+    def commit(self):
+        self.commits += 1
+
+    def sql(self, i):
+        return str(self.statements[i].compile(dialect=postgresql.dialect()))
+
+
+def test_sources_are_aggregated_in_one_grouped_query():
+    when = datetime(2026, 10, 1)
+    db = FakeSession(FakeResult(rows=[
+        SimpleNamespace(source_type="pdf", document_count=3, total_chunks=40, indexed_count=3, last_indexed_at=when),
+        SimpleNamespace(source_type="faq", document_count=2, total_chunks=5, indexed_count=1, last_indexed_at=None),
+        SimpleNamespace(source_type="mystery", document_count=1, total_chunks=0, indexed_count=0, last_indexed_at=None),
+    ]))
+
+    sources = DocumentService.get_sources(PRACTICE_ID, db)
+
+    assert len(db.statements) == 1
+    assert "GROUP BY" in db.sql(0) and "FILTER (WHERE documents.status" in db.sql(0)
+    assert [(s.source_type, s.status, s.total_chunks) for s in sources] == [
+        (SourceType.PDF, "indexed", 40),
+        (SourceType.FAQ, "partial", 5),
+        (SourceType.DOC, "pending", 0),
+    ]
+    assert sources[0].last_indexed_at == when
+
+
+def test_reindex_document_is_one_update_and_one_commit(monkeypatch):
+    monkeypatch.setattr(services, "log_admin_action", lambda **kwargs: None)
+    db = FakeSession(FakeResult(scalar="Protocols"))
+
+    result = DocumentService.reindex_document(PRACTICE_ID, str(uuid.uuid4()), "alice", db)
+
+    assert result["status"] == "success" and "'Protocols'" in result["message"]
+    assert len(db.statements) == 1 and db.commits == 1
+    assert db.sql(0).startswith("UPDATE documents SET") and "RETURNING documents.title" in db.sql(0)
+
+
+def test_reindex_missing_document_commits_nothing(monkeypatch):
+    monkeypatch.setattr(services, "log_admin_action", lambda **kwargs: None)
+    db = FakeSession(FakeResult(scalar=None))
+
+    result = DocumentService.reindex_document(PRACTICE_ID, str(uuid.uuid4()), "alice", db)
+
+    assert result == {"status": "error", "message": "Document not found"}
+    assert db.commits == 0
+
+def test_reindex_practice_skips_disabled_documents(monkeypatch):
+    monkeypatch.setattr(services, "log_admin_action", lambda **kwargs: None)
+    db = FakeSession(FakeResult(scalar=4), FakeResult())
+
+    result = DocumentService.reindex_practice(PRACTICE_ID, "alice", db)
+
+    assert result["message"] == "Re-indexed 4 documents for practice"
+    assert db.sql(1).startswith("UPDATE documents SET") and "documents.status != " in db.sql(1)
+    assert db.commits == 1
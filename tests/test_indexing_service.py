@@ -0,0 +1,324 @@
+import sys
+import os
+import hashlib
+import io
+import tempfile
+import threading
+import time
+import uuid
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
+
+# Ensure project root is on sys.path so `src` package can be imported when running tests
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.admin_portal import indexing_service
+from src.admin_portal.indexing_service import IndexingService
+
+
+def make_service():
+    # The helpers under test use no clients, so skip __init__ (it needs API keys)
+    return IndexingService.__new__(IndexingService)
+
+
+def test_content_hash_is_sha256_for_every_input_form():
+    service = make_service()
+    text = "Crown prep protocol\n" * 1000
+    expected = hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    assert service.compute_content_hash(text) == expected
+    assert service.compute_content_hash(text.encode("utf-8")) == expected
+
+    stream = io.BytesIO(text.encode("utf-8"))
+    assert service.compute_content_hash(stream) == expected
+    assert stream.tell() == 0
+
+    with tempfile.TemporaryFile() as f:
+        f.write(text.encode("utf-8"))
+        assert service.compute_content_hash(f) == expected
+        assert f.tell() == 0
+
+
+def test_unchanged_upload_skips_extraction(monkeypatch):
+    service = make_service()
+    duplicate = {"status": "success", "doc_id": "d1", "duplicate": True}
+    monkeypatch.setattr(service, "find_indexed_duplicate", lambda practice_id, content_hash: duplicate, raising=False)
+
+    def extract(*args):
+        raise AssertionError("duplicate upload was extracted")
+
+    monkeypatch.setattr(indexing_service, "extract_text", extract)
+    assert service.process_and_index_file("p1", "protocols.txt", b"same bytes") is duplicate
+
+
+def test_indexed_duplicates_are_looked_up_by_content_hash(monkeypatch):
+    doc_id = uuid.uuid4()
+    statements = []
+
+    class DuplicateSession:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def execute(self, stmt):
+            statements.append(stmt)
+            row = SimpleNamespace(content_hash="h1", doc_id=doc_id, title="Protocols", chunk_count=4)
+            return SimpleNamespace(all=lambda: [row, row])
+
+    monkeypatch.setattr(indexing_service, "SessionLocal", DuplicateSession)
+    duplicates = make_service().find_indexed_duplicates(str(uuid.uuid4()), ["h1", "h2"])
+
+    assert list(duplicates) == ["h1"]
+    assert duplicates["h1"]["duplicate"] is True
+    assert duplicates["h1"]["doc_id"] == str(doc_id)
+    sql = str(statements[0])
+    assert "documents.status" in sql and "documents.content_hash IN" in sql
+
+
+class FakeSession:
+    open_count = 0
+
+    def __init__(self, rows=()):
+        self.rows = rows
+        self.inserted = []
+        FakeSession.open_count += 1
+
+    def execute(self, stmt, params=None):
+        if params is not None:
+            self.inserted.extend(params)
+            return None
+        return list(self.rows)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        FakeSession.open_count -= 1
+
+
+def test_embedding_cache_holds_no_session_during_embedding(monkeypatch):
+    sessions = []
+
+    def session_factory():
+        sessions.append(FakeSession())
+        return sessions[-1]
+
+    service = make_service()
+    service.model_name = "text-embedding-3-small"
+
+    def embed(texts):
+        assert FakeSession.open_count == 0
+        return [[0.5, -0.25] for _ in texts]
+
+    monkeypatch.setattr(indexing_service, "SessionLocal", session_factory)
+    monkeypatch.setattr(service, "_embed_texts", embed, raising=False)
+
+    vectors = service._embed_chunks_with_cache(["a", "b", "a"])
+    assert len(vectors) == 3 and vectors[0] == vectors[2]
+    assert len(sessions) == 2 and FakeSession.open_count == 0
+    assert len(sessions[1].inserted) == 2
+
+
+def test_batch_indexes_repeated_content_once(monkeypatch):
+    service = make_service()
+    upserted = []
+    monkeypatch.setattr(service, "find_indexed_duplicates", lambda practice_id, hashes: {}, raising=False)
+    monkeypatch.setattr(service, "upsert_chunks", lambda documents, practice_id: upserted.extend(documents), raising=False)
+    monkeypatch.setattr(indexing_service, "_extract_and_chunk", lambda filename, content: (len(content), [content.decode()]))
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        monkeypatch.setattr(indexing_service, "get_batch_index_pool", lambda: pool)
+        results = service.batch_index_files(
+            "00000000-0000-0000-0000-000000000001",
+            [("a.txt", b"same text"), ("b.txt", b"other text"), ("a-copy.txt", b"same text")],
+            persist=False,
+        )
+
+    assert len(upserted) == 2
+    assert [r["filename"] for r in results] == ["a.txt", "b.txt", "a-copy.txt"]
+    assert results[2]["duplicate"] is True
+    assert results[2]["doc_id"] == results[0]["doc_id"]
+    assert results[2]["status"] == "success"
+
+
+def test_batch_index_pool_spawns_workers():
+    pool = indexing_service.get_batch_index_pool()
+    try:
+        assert pool._mp_context.get_start_method() == "spawn"
+        assert indexing_service.get_batch_index_pool() is pool
+    finally:
+        indexing_service.close_batch_index_pool()
+
+
+def make_batch_service(monkeypatch, batch_status="completed", upsert_error=None):
+    service = make_service()
+    doc_id = uuid.uuid4()
+    requests = b"\n".join(
+        orjson.dumps({"custom_id": f"{doc_id}:{i}", "body": {"input": f"chunk {i}"}}) for i in range(2)
+    )
+    outputs = b"\n".join(
+        orjson.dumps({
+            "custom_id": f"{doc_id}:{i}",
+            "response": {"status_code": 200, "body": {"data": [{"embedding": [0.1, 0.2]}]}},
+        }) for i in range(2)
+    )
+    files = {"in": requests, "out": outputs}
+    service.openai_client = SimpleNamespace(
+        batches=SimpleNamespace(retrieve=lambda job_id: SimpleNamespace(
+            id=job_id, status=batch_status, input_file_id="in", output_file_id="out"
+        )),
+        files=SimpleNamespace(content=lambda file_id: SimpleNamespace(content=files[file_id])),
+    )
+
+    def upsert(documents, practice_id, embeddings=None):
+        if upsert_error:
+            raise upsert_error
+
+    released = []
+    monkeypatch.setattr(service, "upsert_chunks", upsert, raising=False)
+    monkeypatch.setattr(service, "_finish_embedding_batch", lambda doc, **values: released.append(values))
+    doc = SimpleNamespace(
+        doc_id=doc_id, client_id=uuid.uuid4(), title="Protocols", source_uri="manual-entry",
+        source_type="manual", subagents_allowed=["chat"], chunk_count=2,
+        batch_job_id="batch_1", batch_attempts=0,
+    )
+    return service, doc, released
+
+
+def test_completed_embedding_batch_is_indexed(monkeypatch):
+    service, doc, released = make_batch_service(monkeypatch)
+    assert service.complete_embedding_batch(doc) is True
+    assert released[0]["status"] == "indexed"
+
+
+def test_transient_embedding_batch_failure_is_retried(monkeypatch):
+    service, doc, released = make_batch_service(monkeypatch, upsert_error=ConnectionError("pinecone down"))
+    assert service.complete_embedding_batch(doc) is False
+    assert released[0]["status"] == "pending"
+    assert released[0]["batch_attempts"] == 1
+
+    doc.batch_attempts = indexing_service.EMBED_BATCH_MAX_ATTEMPTS - 1
+    assert service.complete_embedding_batch(doc) is True
+    assert released[1]["status"] == "failed"
+
+
+def test_expired_embedding_batch_fails_without_retry(monkeypatch):
+    service, doc, released = make_batch_service(monkeypatch, batch_status="expired")
+    assert service.complete_embedding_batch(doc) is True
+    assert released[0]["status"] == "failed"
+    assert "batch_attempts" not in released[0]
+
+
+def make_submit_service(monkeypatch, saved=True, attached=True):
+    service = make_service()
+    service.model_name = "text-embedding-3-small"
+    calls = []
+    service.openai_client = SimpleNamespace(
+        files=SimpleNamespace(create=lambda **kwargs: calls.append("upload") or SimpleNamespace(id="file_1")),
+        batches=SimpleNamespace(
+            create=lambda **kwargs: calls.append("create") or SimpleNamespace(id="batch_1"),
+            cancel=lambda batch_id: calls.append(("cancel", batch_id)),
+        ),
+    )
+    monkeypatch.setattr(indexing_service, "chunk_text_recursive", lambda text: ["chunk 0", "chunk 1"])
+    monkeypatch.setattr(indexing_service, "persist_document_record", lambda **kwargs: calls.append(("save", kwargs["status"])) or saved)
+    monkeypatch.setattr(service, "_attach_embedding_batch", lambda doc_id, batch_id: calls.append(("attach", batch_id)) or attached)
+    monkeypatch.setattr(service, "_fail_batch_submission", lambda doc_id, message: calls.append("failed"))
+    return service, calls
+
+
+def test_embedding_batch_row_is_saved_before_submitting(monkeypatch):
+    service, calls = make_submit_service(monkeypatch)
+    result = service.submit_text_embedding_batch("p1", "Protocols", "Crown prep protocol. " * 20)
+
+    assert result["status"] == "pending" and result["job_id"] == "batch_1"
+    assert calls == [("save", "pending"), "upload", "create", ("attach", "batch_1")]
+
+
+def test_embedding_batch_is_not_submitted_without_its_row(monkeypatch):
+    service, calls = make_submit_service(monkeypatch, saved=False)
+    result = service.submit_text_embedding_batch("p1", "Protocols", "Crown prep protocol. " * 20)
+
+    assert result["status"] == "error"
+    assert calls == [("save", "pending")]
+
+
+def test_embedding_batch_is_cancelled_when_it_cannot_be_recorded(monkeypatch):
+    service, calls = make_submit_service(monkeypatch, attached=False)
+    result = service.submit_text_embedding_batch("p1", "Protocols", "Crown prep protocol. " * 20)
+
+    assert result["status"] == "error"
+    assert calls[-2:] == [("cancel", "batch_1"), "failed"]
+
+def test_embedding_batches_are_completed_only_once_claimed(monkeypatch):
+    claimed_id, taken_id = uuid.uuid4(), uuid.uuid4()
+
+    class DueSession:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def execute(self, stmt):
+            return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: [claimed_id, taken_id]))
+
+    service = make_service()
+    completed = []
+    monkeypatch.setattr(indexing_service, "SessionLocal", DueSession)
+    monkeypatch.setattr(
+        service, "claim_embedding_batch",
+        lambda doc_id, now: SimpleNamespace(doc_id=doc_id) if doc_id == claimed_id else None,
+    )
+    monkeypatch.setattr(service, "complete_embedding_batch", lambda doc: completed.append(doc.doc_id) or True, raising=False)
+
+    assert service.complete_embedding_batches() == 1
+    assert completed == [claimed_id]
+
+
+def test_index_stats_need_no_indexing_service(monkeypatch):
+    from src.core import rag_engine
+
+    calls = []
+    index = SimpleNamespace(describe_index_stats=lambda: calls.append(1) or {"namespaces": {}})
+    monkeypatch.setattr(rag_engine, "get_pinecone_index", lambda: index)
+    monkeypatch.setattr(indexing_service, "IndexingService", None)
+    indexing_service.invalidate_index_stats()
+
+    assert indexing_service.describe_index_stats() == {"namespaces": {}}
+    assert indexing_service.describe_index_stats() == {"namespaces": {}}
+    assert len(calls) == 1
+    indexing_service.invalidate_index_stats()
+    indexing_service.describe_index_stats()
+    assert len(calls) == 2
+    indexing_service.invalidate_index_stats()
+
+
+def test_indexing_service_singleton_is_created_once(monkeypatch):
+    created = []
+
+    class SlowService:
+        def __init__(self):
+            time.sleep(0.05)
+            created.append(self)
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(indexing_service, "IndexingService", SlowService)
+    monkeypatch.setattr(indexing_service, "_indexing_service", None)
+    threads = [threading.Thread(target=indexing_service.get_indexing_service) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    indexing_service.close_indexing_service()
+    assert indexing_service._indexing_service is None
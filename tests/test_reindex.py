@@ -0,0 +1,32 @@
+import sys
+import os
+import asyncio
+
+# Ensure project root is on sys.path so `src` package can be imported when running tests
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.admin_portal import router
+from src.admin_portal.auth import AdminUser
+
+ADMIN = AdminUser(username="alice", role="admin")
+
+
+def test_reindex_endpoints_report_the_finished_reindex(monkeypatch):
+    calls = []
+
+    def reindex_document(practice_id, doc_id, actor):
+        calls.append(("document", practice_id, doc_id, actor))
+        return {"status": "success", "message": "Document 'Protocols' re-indexed successfully"}
+
+    def reindex_practice(practice_id, actor):
+        calls.append(("practice", practice_id, actor))
+        return {"status": "success", "message": "Re-indexed 3 documents"}
+
+    monkeypatch.setattr(router.DocumentService, "reindex_document", staticmethod(reindex_document))
+    monkeypatch.setattr(router.DocumentService, "reindex_practice", staticmethod(reindex_practice))
+
+    response = asyncio.run(router.reindex_document("p1", "d1", admin=ADMIN))
+    assert response.status == "success" and response.job_id is None
+    response = asyncio.run(router.reindex_practice("p1", admin=ADMIN))
+    assert response.message == "Re-indexed 3 documents"
+    assert calls == [("document", "p1", "d1", "alice"), ("practice", "p1", "alice")]
@@ -0,0 +1,113 @@
+import sys
+import os
+import asyncio
+import tempfile
+import threading
+from types import SimpleNamespace
+
+# Ensure project root is on sys.path so `src` package can be imported when running tests
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pytest
+from fastapi import BackgroundTasks, HTTPException, UploadFile
+
+from src.admin_portal import router
+from src.admin_portal.auth import AdminUser
+from src.admin_portal.router import iterate_indexing
+
+
+def test_cancelled_stream_cleans_up_after_the_running_step():
+    release = threading.Event()
+    cleaned = threading.Event()
+    events = []
+
+    def frames():
+        try:
+            yield "first"
+            release.wait(5)
+            events.append("step finished")
+            yield "second"
+        finally:
+            events.append("generator closed")
+
+    def cleanup():
+        events.append("file closed")
+        cleaned.set()
+
+    async def consume():
+        async for _ in iterate_indexing(frames(), cleanup=cleanup):
+            pass
+
+    async def main():
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0.1)  # the second step is now blocked on a worker thread
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        assert not cleaned.is_set()
+        release.set()
+
+    asyncio.run(main())
+    assert cleaned.wait(5)
+    assert events == ["step finished", "generator closed", "file closed"]
+
+
+def test_finished_stream_is_cleaned_up():
+    cleaned = threading.Event()
+
+    async def consume():
+        return [frame async for frame in iterate_indexing(iter(["a", "b"]), cleanup=cleaned.set)]
+
+    assert asyncio.run(consume()) == ["a", "b"]
+    assert cleaned.wait(5)
+
+
+def make_upload(content: bytes, filename: str, size=None):
+    spooled = tempfile.SpooledTemporaryFile(max_size=1024 * 1024)
+    spooled.write(content)
+    spooled.seek(0)
+    return UploadFile(file=spooled, size=len(content) if size is None else size, filename=filename)
+
+
+def test_single_file_upload_reuses_the_spooled_part():
+    upload = make_upload(b"%PDF-1.7 protocol", "protocols.pdf")
+    spooled = upload.file
+
+    assert asyncio.run(router.check_upload(upload, ".pdf")) == len(b"%PDF-1.7 protocol")
+    content = router.take_upload_file(upload)
+    assert content is spooled and content.tell() == 0
+
+    # Closing the form when the response ends leaves the taken file open
+    asyncio.run(upload.close())
+    assert not content.closed and content.read() == b"%PDF-1.7 protocol"
+    content.close()
+
+
+def test_upload_checks_reject_before_reading_the_body():
+    too_large = make_upload(b"x", "big.txt", size=router.MAX_FILE_SIZE + 1)
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(router.check_upload(too_large, ".txt"))
+    assert exc_info.value.status_code == 413
+
+    spoofed = make_upload(b"MZ\x00\x00 not a pdf", "protocols.pdf")
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(router.check_upload(spoofed, ".pdf"))
+    assert exc_info.value.status_code == 400
+
+
+def test_batch_upload_passes_the_spooled_parts_on(monkeypatch):
+    received = []
+
+    def batch_index_files(practice_id, files, source_type, subagents_allowed, persist):
+        received.extend(fileobj for _, fileobj in files)
+        return []
+
+    monkeypatch.setattr(router, "get_indexing_service", lambda: SimpleNamespace(batch_index_files=batch_index_files))
+    uploads = [make_upload(b"Crown prep protocol", "a.txt"), make_upload(b"%PDF-1.7", "b.pdf")]
+    spooled = [upload.file for upload in uploads]
+
+    response = asyncio.run(router.upload_and_index_documents_batch(
+        "p1", BackgroundTasks(), uploads, None, "chat", AdminUser(username="alice", role="admin")
+    ))
+
+    assert response == {"results": []}
+    assert received == spooled and all(f.tell() == 0 for f in received)